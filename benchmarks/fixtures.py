@@ -0,0 +1,328 @@
+# 벤치마크용 오프라인 픽스처 모듈
+# benchmarks/fixtures/ 디렉터리에 record_fixtures.py로 녹화한 실제 응답(JSON)이 있으면 그것을 사용하고,
+# 없으면 동일한 응답 구조를 가진 결정적(seed 고정) 합성 데이터를 생성합니다.
+# Offline fixtures for the benchmark suite.
+# Recorded responses (JSON) saved by record_fixtures.py under benchmarks/fixtures/ are used when present;
+# otherwise deterministic (fixed seed) synthetic payloads with the same response shape are generated.
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+SEED = 20241015
+
+
+def _load_recorded(name):
+    """
+    녹화된 픽스처 파일이 있으면 읽어서 반환합니다.
+    Returns the recorded fixture if the file exists.
+
+    Parameters:
+        name (str): 픽스처 이름 (확장자 제외).
+                    Fixture name without extension.
+
+    Returns:
+        object or None: JSON 객체, 파일이 없으면 None.
+                        Parsed JSON, or None if the file does not exist.
+    """
+    path = os.path.join(FIXTURE_DIR, f'{name}.json')
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
+def _business_dates(num_days, end='2024-10-15'):
+    """
+    종료일 기준 과거 num_days개의 평일 날짜(YYYYMMDD)를 생성합니다.
+    Generates num_days weekday dates (YYYYMMDD) ending at the given date.
+    """
+    dates = pd.bdate_range(end=end, periods=num_days)
+    return dates.strftime('%Y%m%d').tolist()
+
+
+def _random_walk(rng, num_days, start_price, volatility=0.02):
+    """
+    OHLC 가격을 랜덤워크로 생성합니다.
+    Generates OHLC prices from a random walk.
+    """
+    returns = rng.normal(0, volatility, num_days)
+    close = start_price * np.exp(np.cumsum(returns))
+    open_ = close * (1 + rng.normal(0, volatility / 4, num_days))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, volatility / 2, num_days)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, volatility / 2, num_days)))
+    return open_, high, low, close
+
+
+def stock_day_payload(num_days=250, domestic=True, seed=SEED):
+    """
+    네이버 일봉 차트 API(/chart/.../day) 응답과 같은 구조의 데이터를 반환합니다.
+    Returns a payload shaped like the Naver daily chart API (/chart/.../day) response.
+
+    Parameters:
+        num_days (int): 영업일 수입니다.
+                        Number of sessions.
+        domestic (bool): 국내 종목 여부입니다. 국내 종목은 원 단위 정수 가격을 사용합니다.
+                         Whether the symbol is domestic. Domestic prices are whole won.
+        seed (int): 난수 시드입니다.
+                    Random seed.
+
+    Returns:
+        list: 일별 시세 딕셔너리 리스트입니다.
+              List of daily price dictionaries.
+    """
+    name = 'stock_day_domestic' if domestic else 'stock_day_foreign'
+    recorded = _load_recorded(name)
+    if recorded is not None and len(recorded) >= num_days:
+        return recorded[-num_days:]
+
+    rng = np.random.default_rng(seed)
+    dates = _business_dates(num_days)
+    open_, high, low, close = _random_walk(rng, num_days, 70000.0 if domestic else 250.0)
+    if domestic:
+        open_, high, low, close = (np.round(a, -2) for a in (open_, high, low, close))
+    else:
+        open_, high, low, close = (np.round(a, 2) for a in (open_, high, low, close))
+    volume = rng.integers(1_000_000, 30_000_000, num_days)
+    retention = np.round(rng.uniform(50, 56, num_days), 2)
+
+    payload = []
+    for i in range(num_days):
+        row = {
+            'localDate': dates[i],
+            'closePrice': float(close[i]),
+            'openPrice': float(open_[i]),
+            'highPrice': float(high[i]),
+            'lowPrice': float(low[i]),
+            'accumulatedTradingVolume': int(volume[i]),
+        }
+        if domestic:
+            row['foreignRetentionRate'] = float(retention[i])
+        payload.append(row)
+    return payload
+
+
+def prices_by_period_payload(num_days=65, start_price=1350.0, with_open=False, seed=SEED):
+    """
+    네이버 pricesByPeriod API(환율, 금 시세) 응답과 같은 구조의 데이터를 반환합니다.
+    Returns a payload shaped like the Naver pricesByPeriod API (exchange rate, gold) response.
+
+    Parameters:
+        num_days (int): 영업일 수입니다.
+                        Number of sessions.
+        start_price (float): 시작 가격입니다.
+                             Starting price.
+        with_open (bool): openPrice 포함 여부입니다 (금 시세 캔들 차트).
+                          Whether to include openPrice (gold candle chart).
+        seed (int): 난수 시드입니다.
+                    Random seed.
+
+    Returns:
+        dict: {'result': {'priceInfos': [...]}} 형태의 딕셔너리입니다.
+              Dictionary shaped as {'result': {'priceInfos': [...]}}.
+    """
+    name = 'gold_prices_by_period' if with_open else 'fx_prices_by_period'
+    recorded = _load_recorded(name)
+    if recorded is not None:
+        return recorded
+
+    rng = np.random.default_rng(seed)
+    dates = _business_dates(num_days)
+    open_, high, low, close = _random_walk(rng, num_days, start_price, volatility=0.005)
+    price_infos = []
+    for i in range(num_days):
+        row = {
+            'localDate': dates[i],
+            'closePrice': round(float(close[i]), 2),
+            'highPrice': round(float(high[i]), 2),
+            'lowPrice': round(float(low[i]), 2),
+        }
+        if with_open:
+            row['openPrice'] = round(float(open_[i]), 2)
+        price_infos.append(row)
+    return {'isSuccess': True, 'result': {'priceInfos': price_infos}}
+
+
+def yfinance_frame(ticker, start, end, start_price=1300.0, seed=SEED):
+    """
+    단일 티커 yfinance.download 결과와 같은 구조(단일 레벨 컬럼)의 데이터프레임을 반환합니다.
+    Returns a DataFrame shaped like a yfinance.download result for a single ticker (flat columns).
+
+    Parameters:
+        ticker (str): 티커입니다.
+                      Ticker symbol.
+        start (datetime-like): 시작 날짜입니다.
+                               Start date.
+        end (datetime-like): 종료 날짜입니다.
+                             End date.
+        start_price (float): 시작 가격입니다.
+                             Starting price.
+        seed (int): 난수 시드입니다.
+                    Random seed.
+
+    Returns:
+        pd.DataFrame: 일별 OHLCV 데이터프레임입니다.
+                      Daily OHLCV DataFrame.
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(start=start, end=end, inclusive='left', name='Date')
+    open_, high, low, close = _random_walk(rng, len(index), start_price, volatility=0.005)
+    volume = np.zeros(len(index), dtype=np.int64)
+    return pd.DataFrame({'Close': close, 'High': high, 'Low': low, 'Open': open_, 'Volume': volume}, index=index)
+
+
+def financial_payload(domestic=True, num_periods=5, num_rows=30, seed=SEED):
+    """
+    네이버 연간 재무요약 API 응답과 같은 구조의 데이터를 반환합니다.
+    Returns a payload shaped like the Naver annual financial summary API response.
+
+    Parameters:
+        domestic (bool): 국내 종목 여부입니다. 국내 종목은 'financeInfo' 키 아래에 데이터가 있습니다.
+                         Whether the symbol is domestic. Domestic data is nested under 'financeInfo'.
+        num_periods (int): 기간(연도) 수입니다.
+                           Number of periods (years).
+        num_rows (int): 재무 항목 수입니다.
+                        Number of financial line items.
+        seed (int): 난수 시드입니다.
+                    Random seed.
+
+    Returns:
+        dict: 재무요약 응답 딕셔너리입니다.
+              Financial summary response dictionary.
+    """
+    name = 'financial_domestic' if domestic else 'financial_foreign'
+    recorded = _load_recorded(name)
+    if recorded is not None:
+        return recorded
+
+    rng = np.random.default_rng(seed)
+    keys = [str(2020 + i) + '12' for i in range(num_periods)]
+    titles = [{'isConsensus': 'N', 'title': f'{key[:4]}.12.', 'key': key} for key in keys]
+    row_list = []
+    for r in range(num_rows):
+        values = rng.normal(100000, 50000, num_periods)
+        columns = {key: {'value': f'{value:,.0f}'} for key, value in zip(keys, values)}
+        row_list.append({'title': f'항목{r:02d}', 'columns': columns})
+    body = {'trTitleList': titles, 'rowList': row_list}
+    return {'financeInfo': body} if domestic else body
+
+
+def decliners_payload(num_stocks=100, seed=SEED):
+    """
+    네이버 하락 종목 API 응답과 같은 구조의 데이터를 반환합니다.
+    Returns a payload shaped like the Naver declining stocks API response.
+
+    Parameters:
+        num_stocks (int): 종목 수입니다.
+                          Number of stocks.
+        seed (int): 난수 시드입니다.
+                    Random seed.
+
+    Returns:
+        dict: {'stocks': [...]} 형태의 딕셔너리입니다.
+              Dictionary shaped as {'stocks': [...]}.
+    """
+    recorded = _load_recorded('kospi_decliners')
+    if recorded is not None:
+        return recorded
+
+    rng = np.random.default_rng(seed)
+    stocks = []
+    for i in range(num_stocks):
+        close = int(rng.integers(1000, 500000))
+        change = -int(rng.integers(10, max(11, close // 10)))
+        stocks.append({
+            'stockType': 'domestic',
+            'itemCode': f'{i * 37 % 1000000:06d}',
+            'stockName': f'종목{i:03d}',
+            'closePrice': f'{close:,}',
+            'compareToPreviousClosePrice': f'{change:,}',
+            'fluctuationsRatio': f'{change / close * 100:.2f}',
+            'accumulatedTradingVolume': f'{int(rng.integers(1000, 10000000)):,}',
+            'accumulatedTradingValue': f'{int(rng.integers(1, 100000)):,}',
+            'marketValue': f'{int(rng.integers(100, 1000000)):,}',
+            'localTradedAt': '2024-10-15T16:10:00+09:00',
+        })
+    return {'stocks': stocks, 'totalCount': num_stocks}
+
+
+def nasdaq_screener_payload(num_rows=7000, seed=SEED):
+    """
+    나스닥 스크리너 API 응답과 같은 구조의 데이터를 반환합니다.
+    Returns a payload shaped like the NASDAQ screener API response.
+
+    Parameters:
+        num_rows (int): 종목 수입니다. 실제 응답은 약 7,000개 종목입니다.
+                        Number of rows. The live response has roughly 7,000 rows.
+        seed (int): 난수 시드입니다.
+                    Random seed.
+
+    Returns:
+        dict: {'data': {'rows': [...]}} 형태의 딕셔너리입니다.
+              Dictionary shaped as {'data': {'rows': [...]}}.
+    """
+    recorded = _load_recorded('nasdaq_screener')
+    if recorded is not None:
+        return recorded
+
+    rng = np.random.default_rng(seed)
+    sectors = ['Technology', 'Health Care', 'Finance', 'Industrials', 'Consumer Discretionary', 'Energy']
+    rows = []
+    for i in range(num_rows):
+        symbol = ''.join(chr(65 + (i // 26 ** k) % 26) for k in range(4))
+        last = float(rng.uniform(1, 500))
+        change = float(rng.normal(0, 2))
+        rows.append({
+            'symbol': symbol,
+            'name': f'{symbol} Common Stock',
+            'lastsale': f'${last:.2f}',
+            'netchange': f'{change:.2f}',
+            'pctchange': f'{change / last * 100:.3f}%',
+            'volume': str(int(rng.integers(1000, 50000000))),
+            'marketCap': f'{last * int(rng.integers(10**6, 10**9)):.2f}',
+            'country': 'United States',
+            'ipoyear': str(int(rng.integers(1980, 2024))),
+            'industry': 'Software',
+            'sector': sectors[i % len(sectors)],
+            'url': f'/market-activity/stocks/{symbol.lower()}',
+        })
+    return {'data': {'asOf': None, 'headers': {}, 'rows': rows}, 'message': None,
+            'status': {'rCode': 200}}
+
+
+def price_panel(num_symbols=100, num_days=2500, seed=SEED):
+    """
+    여러 종목의 일봉 데이터를 담은 합성 패널(long format)을 생성합니다.
+    Builds a synthetic long-format panel of daily bars for several symbols.
+
+    Parameters:
+        num_symbols (int): 종목 수입니다.
+                           Number of symbols.
+        num_days (int): 종목당 영업일 수입니다. 2,500일은 약 10년입니다.
+                        Sessions per symbol. 2,500 sessions is about 10 years.
+        seed (int): 난수 시드입니다.
+                    Random seed.
+
+    Returns:
+        pd.DataFrame: symbol 컬럼과 네이버 일봉 컬럼을 가진 데이터프레임입니다.
+                      DataFrame with a symbol column and Naver daily bar columns.
+    """
+    rng = np.random.default_rng(seed)
+    dates = _business_dates(num_days)
+    frames = []
+    for s in range(num_symbols):
+        open_, high, low, close = _random_walk(rng, num_days, float(rng.uniform(5000, 200000)))
+        frames.append(pd.DataFrame({
+            'symbol': f'{s:06d}',
+            'localDate': dates,
+            'closePrice': close,
+            'openPrice': open_,
+            'highPrice': high,
+            'lowPrice': low,
+            'accumulatedTradingVolume': rng.integers(1_000, 10_000_000, num_days),
+        }))
+    return pd.concat(frames, ignore_index=True)
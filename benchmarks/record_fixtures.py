@@ -0,0 +1,64 @@
+# 벤치마크 픽스처 녹화 스크립트
+# 실제 네이버/나스닥 API 응답을 benchmarks/fixtures/ 아래에 JSON으로 저장합니다.
+# 저장된 파일이 있으면 fixtures.py가 합성 데이터 대신 녹화된 응답을 사용합니다.
+# Records live Naver/NASDAQ API responses as JSON under benchmarks/fixtures/.
+# When the files exist, fixtures.py uses the recorded responses instead of synthetic payloads.
+#
+# 사용법 / Usage:
+#   python benchmarks/record_fixtures.py
+
+import datetime
+import json
+import os
+import sys
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loadstockdata.config import HEADERS
+from fixtures import FIXTURE_DIR
+
+
+def _targets():
+    """
+    녹화할 픽스처 이름과 (URL, 파라미터, 헤더) 목록을 반환합니다.
+    Returns the fixture names with their (URL, params, headers).
+    """
+    today = datetime.date.today()
+    start = (today - datetime.timedelta(days=365)).strftime('%Y%m%d')
+    end = today.strftime('%Y%m%d')
+    period_url = 'https://m.stock.naver.com/front-api/chart/pricesByPeriod'
+    return {
+        'stock_day_domestic': (f'https://api.stock.naver.com/chart/domestic/item/005930/day?startDateTime={start}0000&endDateTime={end}0000', None, None),
+        'stock_day_foreign': (f'https://api.stock.naver.com/chart/foreign/item/TSLA.O/day?startDateTime={start}0000&endDateTime={end}0000', None, None),
+        'fx_prices_by_period': (period_url, {'reutersCode': 'FX_USDKRW', 'category': 'exchange', 'chartInfoType': 'marketindex', 'scriptChartType': 'areaMonthThree'}, None),
+        'gold_prices_by_period': (period_url, {'reutersCode': 'GCcv1', 'category': 'metals', 'chartInfoType': 'futures', 'scriptChartType': 'candleDay'}, None),
+        'financial_domestic': ('https://m.stock.naver.com/api/stock/005930/finance/annual', None, None),
+        'financial_foreign': ('https://api.stock.naver.com/stock/TSLA.O/finance/annual', None, None),
+        'kospi_decliners': ('https://m.stock.naver.com/api/stocks/down/KOSPI?page=1&pageSize=100', None, None),
+        'nasdaq_screener': ('https://api.nasdaq.com/api/screener/stocks?tableonly=true&limit=0&offset=0&download=true', None, HEADERS),
+    }
+
+
+def record():
+    """
+    모든 픽스처를 녹화합니다. 실패한 항목은 건너뛰고 메시지를 출력합니다.
+    Records every fixture. Failed targets are skipped with a message.
+    """
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    for name, (url, params, headers) in _targets().items():
+        try:
+            response = requests.get(url, params=params, headers=headers, timeout=30)
+            response.raise_for_status()
+            data = json.loads(response.content)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f'{name}: skipped ({e})')
+            continue
+        with open(os.path.join(FIXTURE_DIR, f'{name}.json'), 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        print(f'{name}: {len(response.content):,} bytes')
+
+
+if __name__ == '__main__':
+    record()
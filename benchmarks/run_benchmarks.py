@@ -0,0 +1,497 @@
+# 벤치마크 실행 스크립트
+# 네트워크 없이(녹화/합성 픽스처 사용) 데이터 수집 파싱, 지표 계산, 데이터 결합 경로의
+# 실행 시간과 최대 메모리 사용량을 측정하고, 저장된 기준값(baseline.json)과 비교합니다.
+# Runs the benchmark suite offline (recorded/synthetic fixtures) over the fetch-parse,
+# indicator and merge paths, measuring wall time and peak memory, and compares the
+# results against a stored baseline (baseline.json).
+#
+# 사용법 / Usage:
+#   python benchmarks/run_benchmarks.py                     # 실행 후 기준값과 비교 / run and compare with baseline
+#   python benchmarks/run_benchmarks.py --save-baseline     # 기준값 갱신 / refresh the baseline
+#   python benchmarks/run_benchmarks.py --filter compute    # 이름에 'compute'가 포함된 항목만 / only names containing 'compute'
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import requests
+import yfinance
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import loadstockdata
+import fixtures
+
+BASELINE_PATH = os.path.join(BENCH_DIR, 'baseline.json')
+
+CASES = {}
+
+
+def benchmark(name):
+    """
+    벤치마크 항목을 등록하는 데코레이터입니다.
+    등록되는 함수는 설정(dict)을 받아 측정할 인자 없는 함수를 반환해야 합니다.
+    Decorator that registers a benchmark case.
+    The decorated function takes the config dict and returns a zero-argument callable to measure.
+    """
+    def decorator(setup):
+        CASES[name] = setup
+        return setup
+    return decorator
+
+
+class OfflineRoutes:
+    """
+    URL에 따라 픽스처 응답을 돌려주는 오프라인 라우터입니다.
+    Offline router that serves fixture responses by URL.
+
+    응답 본문은 미리 직렬화해 두므로 측정 시간에는 JSON 인코딩이 포함되지 않습니다.
+    Bodies are serialized up front so JSON encoding is not part of the measured time.
+    """
+
+    def __init__(self, config):
+        days = config['days']
+        self.bodies = {
+            'stock_domestic': json.dumps(fixtures.stock_day_payload(days, domestic=True)).encode(),
+            'stock_foreign': json.dumps(fixtures.stock_day_payload(days, domestic=False)).encode(),
+            'fx': json.dumps(fixtures.prices_by_period_payload(65, 1350.0)).encode(),
+            'gold': json.dumps(fixtures.prices_by_period_payload(65, 2600.0, with_open=True)).encode(),
+            'financial_domestic': json.dumps(fixtures.financial_payload(domestic=True)).encode(),
+            'financial_foreign': json.dumps(fixtures.financial_payload(domestic=False)).encode(),
+            'decliners': json.dumps(fixtures.decliners_payload()).encode(),
+            'nasdaq': json.dumps(fixtures.nasdaq_screener_payload()).encode(),
+            'telegram': b'{"ok": true, "result": {}}',
+        }
+
+    def route(self, url, params):
+        if '/chart/domestic/item/' in url:
+            return 'stock_domestic'
+        if '/chart/foreign/item/' in url:
+            return 'stock_foreign'
+        if 'pricesByPeriod' in url:
+            return 'gold' if (params or {}).get('reutersCode') == 'GCcv1' else 'fx'
+        if '/finance/annual' in url:
+            return 'financial_domestic' if 'm.stock.naver.com' in url else 'financial_foreign'
+        if '/down' in url:
+            return 'decliners'
+        if 'api.nasdaq.com' in url:
+            return 'nasdaq'
+        if 'api.telegram.org' in url:
+            return 'telegram'
+        raise KeyError(f'No offline fixture for {url}')
+
+    def request(self, session, method, url, params=None, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = url
+        response.encoding = 'utf-8'
+        response.headers['Content-Type'] = 'application/json'
+        response._content = self.bodies[self.route(url, params)]
+        return response
+
+
+def _yfinance_download(tickers, start=None, end=None, **kwargs):
+    start_price = 2600.0 if tickers == 'GC=F' else 1300.0
+    return fixtures.yfinance_frame(tickers, start, end, start_price=start_price)
+
+
+@contextlib.contextmanager
+def offline(config):
+    """
+    requests와 yfinance 호출을 픽스처로 대체하는 컨텍스트 매니저입니다.
+    Context manager that serves requests and yfinance calls from fixtures.
+    """
+    routes = OfflineRoutes(config)
+
+    def fake_request(session, method, url, params=None, **kwargs):
+        return routes.request(session, method, url, params=params, **kwargs)
+
+    with mock.patch.object(requests.sessions.Session, 'request', fake_request), \
+            mock.patch.object(yfinance, 'download', _yfinance_download):
+        yield
+
+
+# ---------------------------------------------------------------------------
+# 데이터 수집 및 파싱 / Fetch and parse
+# ---------------------------------------------------------------------------
+
+@benchmark('prices.retrieve_stock_data.domestic')
+def _retrieve_domestic(config):
+    return lambda: loadstockdata.retrieve_stock_data('005930', '20000101', '20241015')
+
+
+@benchmark('prices.retrieve_stock_data.foreign')
+def _retrieve_foreign(config):
+    return lambda: loadstockdata.retrieve_stock_data('TSLA.O', '20000101', '20241015')
+
+
+@benchmark('prices.retrieve_stock_data.domestic.compact')
+def _retrieve_domestic_compact(config):
+    return lambda: loadstockdata.retrieve_stock_data('005930', '20000101', '20241015', compact=True)
+
+
+@benchmark('financials.fetch_financial_data.domestic')
+def _financial_domestic(config):
+    return lambda: loadstockdata.fetch_financial_data('005930')
+
+
+@benchmark('financials.fetch_financial_data.domestic.compact')
+def _financial_domestic_compact(config):
+    return lambda: loadstockdata.fetch_financial_data('005930', compact=True)
+
+
+@benchmark('financials.fetch_financial_data.foreign')
+def _financial_foreign(config):
+    return lambda: loadstockdata.fetch_financial_data('TSLA.O')
+
+
+@benchmark('stocklisting.get_kospi_decliners_today')
+def _kospi_decliners(config):
+    return loadstockdata.get_kospi_decliners_today
+
+
+@benchmark('stocklisting.get_kospi_decliners_today.compact')
+def _kospi_decliners_compact(config):
+    return lambda: loadstockdata.get_kospi_decliners_today(compact=True)
+
+
+@benchmark('stocklisting.get_nasdaq_decliners_today')
+def _nasdaq_decliners(config):
+    return loadstockdata.get_nasdaq_decliners_today
+
+
+@benchmark('stocklisting.get_nasdaq_list')
+def _nasdaq_list(config):
+    return loadstockdata.get_nasdaq_list
+
+
+@benchmark('stocklisting.get_nasdaq_list.compact')
+def _nasdaq_list_compact(config):
+    return lambda: loadstockdata.get_nasdaq_list(compact=True)
+
+
+# ---------------------------------------------------------------------------
+# 데이터 결합 / Merge
+# ---------------------------------------------------------------------------
+
+@benchmark('exchange.create_exchange_rate_dataframe')
+def _create_exchange(config):
+    data = fixtures.prices_by_period_payload(65, 1350.0)
+    return lambda: loadstockdata.create_exchange_rate_dataframe(data)
+
+
+@benchmark('exchange.create_exchange_rate_dataframe.weekday')
+def _create_exchange_weekday(config):
+    data = fixtures.prices_by_period_payload(65, 1350.0)
+    return lambda: loadstockdata.create_exchange_rate_dataframe(data, calendar='WEEKDAY')
+
+
+@benchmark('exchange.combine_exchange_rate_data')
+def _combine_exchange(config):
+    return lambda: loadstockdata.combine_exchange_rate_data('20150101', '20241015')
+
+
+@benchmark('gold.create_gold_dataframe')
+def _create_gold(config):
+    data = fixtures.prices_by_period_payload(65, 2600.0, with_open=True)
+    return lambda: loadstockdata.create_gold_dataframe(data)
+
+
+@benchmark('gold.create_gold_dataframe.nyse')
+def _create_gold_nyse(config):
+    data = fixtures.prices_by_period_payload(65, 2600.0, with_open=True)
+    return lambda: loadstockdata.create_gold_dataframe(data, calendar='NYSE')
+
+
+@benchmark('gold.combine_gold_data')
+def _combine_gold(config):
+    return lambda: loadstockdata.combine_gold_data('20150101', '20241015')
+
+
+@benchmark('calendars.krx_sessions_10y')
+def _krx_sessions(config):
+    calendar = loadstockdata.calendars.get_calendar('KRX')
+    return lambda: calendar.sessions('20150101', '20241231')
+
+
+# ---------------------------------------------------------------------------
+# 지표 계산 (종목 패널 전체) / Indicators over the whole symbol panel
+# ---------------------------------------------------------------------------
+
+def _panel_frames(config):
+    panel = fixtures.price_panel(config['symbols'], config['days'])
+    return [frame.reset_index(drop=True) for _, frame in panel.groupby('symbol', sort=False)]
+
+
+def _over_panel(config, func, **kwargs):
+    frames = _panel_frames(config)
+
+    def run():
+        for frame in frames:
+            func(frame, **kwargs)
+    return run
+
+
+@benchmark('compute.compute_rsi')
+def _rsi(config):
+    return _over_panel(config, loadstockdata.compute_rsi)
+
+
+@benchmark('compute.compute_moving_average')
+def _moving_average(config):
+    return _over_panel(config, loadstockdata.compute_moving_average)
+
+
+@benchmark('compute.compute_bollinger_bands')
+def _bollinger(config):
+    return _over_panel(config, loadstockdata.compute_bollinger_bands)
+
+
+@benchmark('compute.compute_ema')
+def _ema(config):
+    return _over_panel(config, loadstockdata.compute_ema)
+
+
+@benchmark('compute.compute_macd')
+def _macd(config):
+    return _over_panel(config, loadstockdata.compute_macd)
+
+
+@benchmark('compute.compute_atr')
+def _atr(config):
+    return _over_panel(config, loadstockdata.compute_atr)
+
+
+@benchmark('compute.compute_stochastic')
+def _stochastic(config):
+    return _over_panel(config, loadstockdata.compute_stochastic)
+
+
+@benchmark('compute.compute_obv')
+def _obv(config):
+    return _over_panel(config, loadstockdata.compute_obv)
+
+
+@benchmark('compute.compute_roc')
+def _roc(config):
+    return _over_panel(config, loadstockdata.compute_roc)
+
+
+# ---------------------------------------------------------------------------
+# 주봉/월봉 변환 (종목 패널 전체) / Resampling over the whole symbol panel
+# ---------------------------------------------------------------------------
+
+@benchmark('resample.resample_ohlcv.weekly')
+def _resample_weekly(config):
+    panel = fixtures.price_panel(config['symbols'], config['days'])
+    return lambda: loadstockdata.resample.resample_ohlcv(panel, 'W')
+
+
+@benchmark('resample.resample_ohlcv.monthly')
+def _resample_monthly(config):
+    panel = fixtures.price_panel(config['symbols'], config['days'])
+    return lambda: loadstockdata.resample.resample_ohlcv(panel, 'M')
+
+
+@benchmark('resample.update_bars.one_day')
+def _update_bars(config):
+    panel = fixtures.price_panel(config['symbols'], config['days'])
+    last_day = panel.groupby('symbol').tail(1)
+    bars = loadstockdata.resample.resample_ohlcv(panel.drop(last_day.index), 'W')
+    # 기본값(inplace=False)은 bars를 바꾸지 않으므로 매 실행이 같은 입력에서 시작합니다.
+    # The default (inplace=False) leaves `bars` untouched, so every run starts from the same input.
+    return lambda: loadstockdata.resample.update_bars(bars, last_day, 'W')
+
+
+# ---------------------------------------------------------------------------
+# 측정 및 비교 / Measurement and comparison
+# ---------------------------------------------------------------------------
+
+def measure(func, repeat):
+    """
+    함수의 실행 시간(최소, 중앙값)과 최대 메모리 사용량을 측정합니다.
+    메모리는 tracemalloc 오버헤드가 시간 측정에 섞이지 않도록 별도 실행에서 측정합니다.
+    Measures wall time (min, median) and peak memory of a function.
+    Memory is measured in a separate run so tracemalloc overhead does not skew timings.
+
+    Parameters:
+        func (callable): 측정할 인자 없는 함수입니다.
+                         Zero-argument callable to measure.
+        repeat (int): 시간 측정 반복 횟수입니다.
+                      Number of timed repetitions.
+
+    Returns:
+        dict: min, median(초)과 peak_bytes를 담은 딕셔너리입니다.
+              Dictionary with min, median (seconds) and peak_bytes.
+    """
+    func()  # 워밍업 / warm-up
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {'min': min(times), 'median': statistics.median(times), 'peak_bytes': peak}
+
+
+def run(config, name_filter=None):
+    """
+    등록된 벤치마크를 실행합니다.
+    Runs the registered benchmarks.
+
+    Parameters:
+        config (dict): symbols, days, repeat 설정입니다.
+                       Config with symbols, days and repeat.
+        name_filter (str, optional): 이름에 이 문자열이 포함된 항목만 실행합니다.
+                                     Only run cases whose name contains this string.
+
+    Returns:
+        tuple: (측정 결과, 오류) 딕셔너리입니다. 둘 다 항목 이름을 키로 사용합니다.
+               (measurements, errors) dictionaries, both keyed by case name.
+    """
+    results = {}
+    errors = {}
+    with offline(config):
+        for name, setup in CASES.items():
+            if name_filter and name_filter not in name:
+                continue
+            try:
+                func = setup(config)
+                results[name] = measure(func, config['repeat'])
+            except Exception as e:
+                # 한 항목의 실패로 나머지 측정이 중단되지 않도록 하되, 실패는 기록해 종료 코드에 반영합니다.
+                # Keep measuring the other cases, but record the failure so it sets the exit code.
+                errors[name] = f'{type(e).__name__}: {e}'
+                print(f'{name:<50} ERROR {errors[name]}')
+                continue
+            r = results[name]
+            print(f"{name:<50} median {r['median'] * 1000:10.2f} ms   min {r['min'] * 1000:10.2f} ms   "
+                  f"peak {r['peak_bytes'] / 1024 / 1024:8.2f} MiB")
+    return results, errors
+
+
+def compare(results, baseline, time_tolerance, memory_tolerance, name_filter=None):
+    """
+    측정 결과를 기준값과 비교하고, 허용 범위를 넘은 항목을 반환합니다.
+    Compares results with the baseline and returns cases outside the tolerance.
+
+    Parameters:
+        results (dict): 이번 측정 결과입니다.
+                        Current measurements.
+        baseline (dict): 저장된 기준값입니다.
+                         Stored baseline measurements.
+        time_tolerance (float): 허용 시간 증가율입니다 (0.25 = 25%).
+                                Allowed relative time increase (0.25 = 25%).
+        memory_tolerance (float): 허용 메모리 증가율입니다.
+                                  Allowed relative memory increase.
+        name_filter (str, optional): 실행할 때 사용한 필터입니다. 필터에 맞는 기준값 항목이 결과에 없으면 회귀로 봅니다.
+                                     Filter used for the run. Baseline cases matching it but missing from
+                                     the results count as regressions.
+
+    Returns:
+        list: (이름, 항목, 기준값, 측정값) 튜플 리스트입니다. 누락된 항목은 측정값이 None입니다.
+              List of (name, metric, baseline, current) tuples. Missing cases have current None.
+    """
+    regressions = []
+    print(f"\n{'benchmark':<50} {'time':>9} {'memory':>9}")
+    for name, base in baseline.items():
+        if name not in results and (not name_filter or name_filter in name):
+            print(f'{name:<50} {"missing":>9} {"missing":>9}')
+            regressions.append((name, 'missing', base['median'], None))
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f'{name:<50} {"new":>9} {"new":>9}')
+            continue
+        time_ratio = current['median'] / base['median'] if base['median'] else 1.0
+        memory_ratio = current['peak_bytes'] / base['peak_bytes'] if base['peak_bytes'] else 1.0
+        print(f'{name:<50} {time_ratio:8.2f}x {memory_ratio:8.2f}x')
+        if time_ratio > 1 + time_tolerance:
+            regressions.append((name, 'median', base['median'], current['median']))
+        if memory_ratio > 1 + memory_tolerance:
+            regressions.append((name, 'peak_bytes', base['peak_bytes'], current['peak_bytes']))
+    return regressions
+
+
+def _environment(config):
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'config': config,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Offline benchmark suite for loadstockdata.')
+    parser.add_argument('--filter', help='only run benchmarks whose name contains this string')
+    parser.add_argument('--symbols', type=int, default=100, help='symbols in the indicator panel')
+    parser.add_argument('--days', type=int, default=2500, help='sessions per symbol / per fetch')
+    parser.add_argument('--repeat', type=int, default=5, help='timed repetitions per benchmark')
+    parser.add_argument('--output', help='write results as JSON to this path')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='baseline JSON path')
+    parser.add_argument('--save-baseline', action='store_true', help='store results as the new baseline')
+    parser.add_argument('--time-tolerance', type=float, default=0.25)
+    parser.add_argument('--memory-tolerance', type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    config = {'symbols': args.symbols, 'days': args.days, 'repeat': args.repeat}
+    results, errors = run(config, args.filter)
+    document = {'environment': _environment(config), 'results': results}
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(document, f, indent=2)
+
+    if args.save_baseline:
+        baseline = {}
+        if args.filter and os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)['results']
+        baseline.update(results)
+        document['results'] = baseline
+        with open(args.baseline, 'w') as f:
+            json.dump(document, f, indent=2)
+        print(f'\nbaseline saved to {args.baseline}')
+        return 1 if errors else 0
+
+    if not os.path.exists(args.baseline):
+        print(f'\nno baseline at {args.baseline}; run with --save-baseline first')
+        return 1 if errors else 0
+
+    with open(args.baseline) as f:
+        stored = json.load(f)
+    if stored['environment']['config'] != config:
+        print(f"\nwarning: baseline config {stored['environment']['config']} differs from {config}")
+    regressions = compare(results, stored['results'], args.time_tolerance, args.memory_tolerance, args.filter)
+    for name, metric, base, current in regressions:
+        if current is None:
+            print(f'REGRESSION {name}: in baseline but not measured')
+        else:
+            print(f'REGRESSION {name} {metric}: {base:.6g} -> {current:.6g}')
+    for name, error in errors.items():
+        print(f'ERROR {name}: {error}')
+    return 1 if regressions or errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,7 @@
+# 공용 HTTP 도구 패키지
+# loadstockdata와 messageSVC가 함께 사용하는 복원력 정책(resilience)과 계측(instrumentation) 모듈입니다.
+# requests와 tenacity만 사용하므로 pandas 등 데이터 패키지를 불러오지 않고 가져올 수 있습니다.
+# Shared HTTP helpers package.
+# The resilience policy and instrumentation modules used by both loadstockdata and messageSVC.
+# They depend only on requests and tenacity, so importing them does not load pandas or the data package.
+from . import instrumentation, resilience
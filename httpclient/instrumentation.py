@@ -0,0 +1,498 @@
+# 성능 계측 모듈
+# 엔드포인트별 응답 지연(히스토그램), 상태 코드, 재시도 횟수, 응답 크기, 캐시 적중률과
+# 연산 함수별 실행 시간을 기록하고 JSON 요약 또는 Prometheus 텍스트 파일로 내보냅니다.
+# 기본값은 비활성화이며, 비활성화 상태에서는 플래그 확인 한 번 외에는 추가 작업이 없습니다.
+# Instrumentation module.
+# Records per-endpoint latency histograms, status codes, retry counts, response sizes, cache hit
+# rates and wall time per compute function, exportable as a JSON summary or a Prometheus text file.
+# Disabled by default; when disabled the only overhead is a single flag check.
+#
+# 사용법 / Usage:
+#   from httpclient import instrumentation
+#   instrumentation.enable()            # 또는 환경변수 NSTOCK_INSTRUMENTATION=1 / or set NSTOCK_INSTRUMENTATION=1
+#   ...
+#   instrumentation.write_json('metrics.json')
+#   instrumentation.write_prometheus('metrics.prom')
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+import requests
+
+# 요청 지연 히스토그램 구간(초) / Request latency histogram buckets (seconds)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# 연산 시간 히스토그램 구간(초) / Compute duration histogram buckets (seconds)
+COMPUTE_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+_enabled = os.environ.get('NSTOCK_INSTRUMENTATION', '').lower() in ('1', 'true', 'yes')
+_lock = threading.Lock()
+_endpoints = {}
+_compute = {}
+_caches = {}
+
+
+class _Histogram:
+    """
+    누적되지 않은 구간별 카운트와 합계를 보관하는 히스토그램입니다.
+    Histogram keeping per-bucket (non-cumulative) counts and the running sum.
+    """
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                break
+        else:
+            i = len(self.buckets)
+        self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """
+        구간 상한값으로 근사한 분위수를 반환합니다.
+        Returns the quantile approximated by the bucket upper bound.
+        """
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                return self.buckets[i] if i < len(self.buckets) else float('inf')
+        return float('inf')
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'mean': self.sum / self.count if self.count else None,
+            'p50': self.quantile(0.50),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'buckets': {str(bound): n for bound, n in zip(self.buckets + ('+Inf',), self.counts)},
+        }
+
+
+class _EndpointStats:
+    """
+    엔드포인트 하나의 요청 통계입니다.
+    Request statistics for a single endpoint.
+    """
+
+    def __init__(self):
+        self.latency = _Histogram(LATENCY_BUCKETS)
+        self.status_codes = {}
+        self.errors = 0
+        self.retries = 0
+        self.bytes = 0
+
+    def to_dict(self):
+        return {
+            'requests': self.latency.count,
+            'errors': self.errors,
+            'retries': self.retries,
+            'status_codes': {str(code): n for code, n in sorted(self.status_codes.items())},
+            'bytes': self.bytes,
+            'latency': self.latency.to_dict(),
+        }
+
+
+def enable():
+    """
+    계측을 활성화합니다.
+    Enables instrumentation.
+    """
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """
+    계측을 비활성화합니다. 이미 기록된 값은 유지됩니다.
+    Disables instrumentation. Recorded values are kept.
+    """
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    """
+    계측 활성화 여부를 반환합니다.
+    Returns whether instrumentation is enabled.
+    """
+    return _enabled
+
+
+def reset():
+    """
+    기록된 모든 값을 초기화합니다.
+    Clears every recorded value.
+    """
+    with _lock:
+        _endpoints.clear()
+        _compute.clear()
+        _caches.clear()
+
+
+def _endpoint(endpoint):
+    stats = _endpoints.get(endpoint)
+    if stats is None:
+        stats = _endpoints[endpoint] = _EndpointStats()
+    return stats
+
+
+def record_request(endpoint, elapsed, status_code=None, num_bytes=0):
+    """
+    요청 한 건의 지연 시간, 상태 코드, 응답 크기를 기록합니다.
+    상태 코드가 None이면 통신 오류로 기록합니다.
+    Records latency, status code and response size of a single request.
+    A status code of None is recorded as a communication error.
+
+    Parameters:
+        endpoint (str): 엔드포인트 이름입니다. 예: 'naver.chart.day'
+                        Endpoint name. e.g., 'naver.chart.day'
+        elapsed (float): 지연 시간(초)입니다.
+                         Latency in seconds.
+        status_code (int, optional): HTTP 상태 코드입니다.
+                                     HTTP status code.
+        num_bytes (int): 응답 본문 크기(바이트)입니다.
+                         Response body size in bytes.
+    """
+    if not _enabled:
+        return
+    with _lock:
+        stats = _endpoint(endpoint)
+        stats.latency.observe(elapsed)
+        stats.bytes += num_bytes
+        if status_code is None:
+            stats.errors += 1
+        else:
+            stats.status_codes[status_code] = stats.status_codes.get(status_code, 0) + 1
+
+
+def record_retry(endpoint):
+    """
+    재시도 한 건을 기록합니다.
+    Records a single retry.
+
+    Parameters:
+        endpoint (str): 엔드포인트 이름입니다.
+                        Endpoint name.
+    """
+    if not _enabled:
+        return
+    with _lock:
+        _endpoint(endpoint).retries += 1
+
+
+def retry_hook(endpoint):
+    """
+    tenacity의 before_sleep 인자로 사용할 재시도 기록 콜백을 반환합니다.
+    Returns a retry-recording callback for tenacity's before_sleep argument.
+
+    Parameters:
+        endpoint (str): 엔드포인트 이름입니다.
+                        Endpoint name.
+
+    Returns:
+        callable: retry_state를 받는 콜백입니다.
+                  Callback taking the retry_state.
+    """
+    def before_sleep(retry_state):
+        record_retry(endpoint)
+    return before_sleep
+
+
+def record_cache(cache, hit):
+    """
+    캐시 조회 결과(적중/실패)를 기록합니다.
+    Records a cache lookup result (hit or miss).
+
+    Parameters:
+        cache (str): 캐시 이름입니다.
+                     Cache name.
+        hit (bool): 적중 여부입니다.
+                    Whether the lookup was a hit.
+    """
+    if not _enabled:
+        return
+    with _lock:
+        counts = _caches.setdefault(cache, [0, 0])
+        counts[0 if hit else 1] += 1
+
+
+def record_compute(name, elapsed):
+    """
+    연산 함수 한 번의 실행 시간을 기록합니다.
+    Records the wall time of a single compute function call.
+
+    Parameters:
+        name (str): 함수 이름입니다.
+                    Function name.
+        elapsed (float): 실행 시간(초)입니다.
+                         Wall time in seconds.
+    """
+    if not _enabled:
+        return
+    with _lock:
+        histogram = _compute.get(name)
+        if histogram is None:
+            histogram = _compute[name] = _Histogram(COMPUTE_BUCKETS)
+        histogram.observe(elapsed)
+
+
+def drain_compute():
+    """
+    기록된 연산 시간 히스토그램을 꺼내고 비웁니다. 작업 프로세스가 부모 프로세스로 넘길 때 사용합니다.
+    Returns and clears the recorded compute histograms, for worker processes to hand to the parent.
+
+    Returns:
+        dict: 함수 이름별 (구간별 카운트, 개수, 합계)입니다. merge_compute에 그대로 전달합니다.
+              (per-bucket counts, count, sum) per function name, to pass to merge_compute.
+    """
+    with _lock:
+        drained = {name: (list(histogram.counts), histogram.count, histogram.sum)
+                   for name, histogram in _compute.items()}
+        _compute.clear()
+    return drained
+
+
+def merge_compute(drained):
+    """
+    다른 프로세스에서 drain_compute로 꺼낸 연산 시간을 합칩니다.
+    Merges compute timings drained with drain_compute in another process.
+
+    Parameters:
+        drained (dict): drain_compute의 반환값입니다.
+                        Return value of drain_compute.
+    """
+    if not _enabled or not drained:
+        return
+    with _lock:
+        for name, (counts, count, total) in drained.items():
+            histogram = _compute.get(name)
+            if histogram is None:
+                histogram = _compute[name] = _Histogram(COMPUTE_BUCKETS)
+            histogram.counts = [a + b for a, b in zip(histogram.counts, counts)]
+            histogram.count += count
+            histogram.sum += total
+
+
+def request(endpoint, method, url, **kwargs):
+    """
+    requests.request를 호출하고, 계측이 활성화되어 있으면 지연 시간, 상태 코드, 응답 크기를 기록합니다.
+    Calls requests.request and, when enabled, records latency, status code and response size.
+
+    Parameters:
+        endpoint (str): 엔드포인트 이름입니다.
+                        Endpoint name.
+        method (str): HTTP 메서드입니다.
+                      HTTP method.
+        url (str): 요청 URL입니다.
+                   Request URL.
+        **kwargs: requests.request에 그대로 전달됩니다.
+                  Passed through to requests.request.
+
+    Returns:
+        requests.Response: 응답 객체입니다.
+                           Response object.
+    """
+    if not _enabled:
+        return requests.request(method, url, **kwargs)
+
+    start = time.perf_counter()
+    try:
+        response = requests.request(method, url, **kwargs)
+    except requests.exceptions.RequestException:
+        record_request(endpoint, time.perf_counter() - start)
+        raise
+    record_request(endpoint, time.perf_counter() - start, response.status_code, len(response.content))
+    return response
+
+
+def get(endpoint, url, **kwargs):
+    """
+    계측되는 GET 요청입니다. request()를 참고하세요.
+    Instrumented GET request. See request().
+    """
+    return request(endpoint, 'GET', url, **kwargs)
+
+
+def post(endpoint, url, **kwargs):
+    """
+    계측되는 POST 요청입니다. request()를 참고하세요.
+    Instrumented POST request. See request().
+    """
+    return request(endpoint, 'POST', url, **kwargs)
+
+
+@contextlib.contextmanager
+def track(endpoint):
+    """
+    requests를 거치지 않는 외부 호출(예: yfinance.download)의 지연 시간을 기록하는 컨텍스트 매니저입니다.
+    Context manager recording latency of external calls that bypass requests (e.g. yfinance.download).
+
+    Parameters:
+        endpoint (str): 엔드포인트 이름입니다.
+                        Endpoint name.
+    """
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        record_request(endpoint, time.perf_counter() - start)
+        raise
+    record_request(endpoint, time.perf_counter() - start, 200)
+
+
+def timed(name=None):
+    """
+    연산 함수의 실행 시간을 기록하는 데코레이터입니다.
+    Decorator recording the wall time of a compute function.
+
+    Parameters:
+        name (str, optional): 기록할 이름입니다. 기본값은 '모듈.함수명'입니다.
+                              Recorded name. Defaults to 'module.function'.
+    """
+    def decorator(func):
+        label = name or f'{func.__module__}.{func.__qualname__}'
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record_compute(label, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def summary():
+    """
+    기록된 값을 요약한 딕셔너리를 반환합니다.
+    Returns a dictionary summarizing the recorded values.
+
+    Returns:
+        dict: endpoints, compute, caches 키를 가진 딕셔너리입니다.
+              Dictionary with endpoints, compute and caches keys.
+    """
+    with _lock:
+        return {
+            'endpoints': {name: stats.to_dict() for name, stats in sorted(_endpoints.items())},
+            'compute': {name: histogram.to_dict() for name, histogram in sorted(_compute.items())},
+            'caches': {
+                name: {'hits': hits, 'misses': misses,
+                       'hit_rate': hits / (hits + misses) if hits + misses else None}
+                for name, (hits, misses) in sorted(_caches.items())
+            },
+        }
+
+
+def write_json(path):
+    """
+    요약을 JSON 파일로 저장합니다.
+    Writes the summary to a JSON file.
+
+    Parameters:
+        path (str): 저장할 파일 경로입니다.
+                    Output file path.
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(summary(), f, indent=2)
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _prometheus_histogram(lines, metric, label_name, histograms):
+    for name, histogram in histograms:
+        cumulative = 0
+        for bound, n in zip(histogram.buckets + ('+Inf',), histogram.counts):
+            cumulative += n
+            lines.append(f'{metric}_bucket{{{label_name}="{_label(name)}",le="{bound}"}} {cumulative}')
+        lines.append(f'{metric}_sum{{{label_name}="{_label(name)}"}} {histogram.sum}')
+        lines.append(f'{metric}_count{{{label_name}="{_label(name)}"}} {histogram.count}')
+
+
+def to_prometheus():
+    """
+    기록된 값을 Prometheus 텍스트 노출 형식 문자열로 변환합니다.
+    Renders the recorded values in the Prometheus text exposition format.
+
+    Returns:
+        str: Prometheus 텍스트입니다.
+             Prometheus text.
+    """
+    lines = []
+    with _lock:
+        endpoints = sorted(_endpoints.items())
+        compute = sorted(_compute.items())
+        caches = sorted(_caches.items())
+
+        lines.append('# HELP nstock_request_duration_seconds Request latency per endpoint.')
+        lines.append('# TYPE nstock_request_duration_seconds histogram')
+        _prometheus_histogram(lines, 'nstock_request_duration_seconds', 'endpoint',
+                              [(name, stats.latency) for name, stats in endpoints])
+
+        lines.append('# HELP nstock_responses_total Responses per endpoint and status code.')
+        lines.append('# TYPE nstock_responses_total counter')
+        for name, stats in endpoints:
+            for code, n in sorted(stats.status_codes.items()):
+                lines.append(f'nstock_responses_total{{endpoint="{_label(name)}",code="{code}"}} {n}')
+
+        for metric, attr, help_text in (
+                ('nstock_request_errors_total', 'errors', 'Requests that failed without a response.'),
+                ('nstock_request_retries_total', 'retries', 'Retries per endpoint.'),
+                ('nstock_response_bytes_total', 'bytes', 'Response body bytes per endpoint.')):
+            lines.append(f'# HELP {metric} {help_text}')
+            lines.append(f'# TYPE {metric} counter')
+            for name, stats in endpoints:
+                lines.append(f'{metric}{{endpoint="{_label(name)}"}} {getattr(stats, attr)}')
+
+        lines.append('# HELP nstock_compute_duration_seconds Wall time per compute function.')
+        lines.append('# TYPE nstock_compute_duration_seconds histogram')
+        _prometheus_histogram(lines, 'nstock_compute_duration_seconds', 'function', compute)
+
+        lines.append('# HELP nstock_cache_lookups_total Cache lookups by result.')
+        lines.append('# TYPE nstock_cache_lookups_total counter')
+        for name, (hits, misses) in caches:
+            lines.append(f'nstock_cache_lookups_total{{cache="{_label(name)}",result="hit"}} {hits}')
+            lines.append(f'nstock_cache_lookups_total{{cache="{_label(name)}",result="miss"}} {misses}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def write_prometheus(path):
+    """
+    Prometheus 텍스트 파일로 저장합니다 (node_exporter textfile collector 용).
+    Writes a Prometheus text file (for the node_exporter textfile collector).
+
+    Parameters:
+        path (str): 저장할 파일 경로입니다.
+                    Output file path.
+    """
+    # 수집기가 쓰는 도중의 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체합니다.
+    # Write to a temporary file and rename so the collector never reads a partial file.
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(to_prometheus())
+    os.replace(tmp_path, path)
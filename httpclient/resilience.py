@@ -0,0 +1,391 @@
+# 네트워크 호출 복원력 정책 모듈
+# 네이버/나스닥/텔레그램 호출에 공통으로 적용되는 정책입니다.
+#  - 연결/응답 타임아웃 기본값: 응답 없는 상위 서버에 호출자가 무한정 묶이지 않도록 합니다.
+#  - 지수 백오프 + 지터 재시도 (연결 오류, 타임아웃, HTTP 429/5xx)
+#  - 배치 단위 재시도 예산: 상위 서버 장애 시 수천 종목 배치가 재시도 대기로 수십 분을 허비하지 않도록 합니다.
+#  - 호스트별 서킷 브레이커: 연속 실패가 누적되면 일정 시간 동안 요청을 보내지 않고 즉시 실패합니다.
+#  - 헤지 요청(선택): 응답이 호스트별 지연 분위수를 넘으면 같은 GET 요청을 한 번 더 보내고 먼저 도착한 응답을 사용합니다.
+# Resilience policy shared by the Naver/NASDAQ/Telegram calls.
+#  - Default connect/read timeouts so a hung upstream never blocks its caller forever.
+#  - Retries with exponential backoff and jitter (connection errors, timeouts, HTTP 429/5xx)
+#  - A per-batch retry budget so a multi-thousand-symbol batch does not spend tens of minutes
+#    waiting on retries during an upstream brownout.
+#  - A per-host circuit breaker that fails fast for a while after consecutive failures.
+#  - Optional hedged requests: when a GET takes longer than the host's latency percentile, a
+#    duplicate is sent and whichever response arrives first is used.
+
+import concurrent.futures
+import contextlib
+import contextvars
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+import requests
+from tenacity import Retrying, retry_if_exception, retry_if_result, stop_after_attempt, stop_any, wait_random_exponential
+
+from . import instrumentation
+
+# 타임아웃 설정(초). 호출할 때 timeout을 직접 주면 그 값을 사용합니다.
+# Timeout settings (seconds). An explicit timeout passed by the caller takes precedence.
+CONNECT_TIMEOUT = 5.0
+READ_TIMEOUT = 30.0
+
+# 재시도 설정 / Retry settings
+MAX_ATTEMPTS = 3            # 최초 요청을 포함한 최대 시도 횟수 / Attempts including the first one
+BACKOFF_MULTIPLIER = 0.5    # 대기 시간 상한 = multiplier * 2^n 초 / Wait upper bound = multiplier * 2^n seconds
+BACKOFF_MAX = 8.0           # 한 번의 대기 시간 상한(초) / Cap on a single wait (seconds)
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# 서킷 브레이커 설정 / Circuit breaker settings
+FAILURE_THRESHOLD = 5       # 연속 실패 횟수 / Consecutive failures before opening
+RESET_TIMEOUT = 30.0        # 열린 상태 유지 시간(초) / Seconds to stay open before a trial request
+
+# 헤지 요청 설정 / Hedging settings
+HEDGE_PERCENTILE = 0.95
+HEDGE_MIN_SAMPLES = 20
+HEDGE_WINDOW = 200
+
+_lock = threading.Lock()
+_breakers = {}
+_latencies = {}
+# 재시도 예산은 컨텍스트별로 보관하므로 다른 스레드의 retry_budget 블록과 서로 덮어쓰지 않습니다.
+# The retry budget is held per context, so retry_budget blocks in different threads never overwrite each other.
+_budget = contextvars.ContextVar('retry_budget', default=None)
+_hedging = False
+_hedge_executor = None
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """
+    서킷 브레이커가 열려 있어 요청을 보내지 않았을 때 발생하는 예외입니다.
+    Raised when a request is not sent because the host's circuit breaker is open.
+    """
+
+
+class CircuitBreaker:
+    """
+    호스트 하나의 서킷 브레이커입니다.
+    Circuit breaker for a single host.
+
+    closed: 정상 상태. 연속 실패가 threshold에 도달하면 open으로 바뀝니다.
+            Normal state. Opens after `threshold` consecutive failures.
+    open: reset_timeout 동안 모든 요청을 즉시 거부합니다.
+          Rejects every request for `reset_timeout` seconds.
+    half-open: 시험 요청 한 건만 허용하고, 성공하면 closed, 실패하면 다시 open이 됩니다.
+               Lets a single trial request through; success closes, failure reopens.
+    """
+
+    def __init__(self, threshold=None, reset_timeout=None):
+        self.threshold = threshold or FAILURE_THRESHOLD
+        self.reset_timeout = reset_timeout or RESET_TIMEOUT
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return 'half-open'
+        return 'open'
+
+    def allow(self):
+        """
+        요청을 보내도 되는지 확인합니다.
+        Returns whether a request may be sent.
+        """
+        with self._lock:
+            state = self.state
+            if state == 'closed':
+                return True
+            if state == 'half-open' and not self.trial_in_flight:
+                self.trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.trial_in_flight or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+            self.trial_in_flight = False
+
+
+class RetryBudget:
+    """
+    배치 전체에서 사용할 수 있는 재시도 횟수입니다. 여러 스레드에서 공유할 수 있습니다.
+    Number of retries available to a whole batch. Safe to share across threads.
+    """
+
+    def __init__(self, max_retries):
+        self.remaining = max_retries
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        재시도 한 번을 사용합니다. 예산이 남아 있지 않으면 False를 반환합니다.
+        Consumes one retry. Returns False when the budget is exhausted.
+        """
+        with self._lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
+
+
+@contextlib.contextmanager
+def retry_budget(max_retries):
+    """
+    블록 안의 모든 요청이 공유하는 재시도 예산을 설정합니다.
+    Sets a retry budget shared by every request made inside the block.
+
+    Parameters:
+        max_retries (int): 배치 전체에서 허용할 재시도 횟수입니다.
+                           Retries allowed for the whole batch.
+
+    예산은 contextvars로 보관하므로 블록을 연 스레드(와 asyncio 작업)에만 적용됩니다.
+    새 스레드나 스레드 풀 작업에 같은 예산을 적용하려면 contextvars.copy_context().run으로 실행하세요.
+    The budget is held in a contextvar, so it applies to the thread (and asyncio task) that opened the block.
+    To share it with new threads or thread-pool tasks, run them through contextvars.copy_context().run.
+
+    Usage:
+        with retry_budget(200):
+            for symbol in symbols:
+                retrieve_stock_data(symbol)
+    """
+    budget = RetryBudget(max_retries)
+    token = _budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _budget.reset(token)
+
+
+def enable_hedging(percentile=None, min_samples=None):
+    """
+    GET 요청에 헤지 요청을 활성화합니다.
+    Enables hedged requests for GETs.
+
+    Parameters:
+        percentile (float, optional): 헤지 요청을 보낼 지연 분위수입니다. 기본값 0.95.
+                                      Latency percentile that triggers the hedge. Defaults to 0.95.
+        min_samples (int, optional): 분위수를 계산하기 위해 필요한 최소 표본 수입니다.
+                                     Samples required before hedging starts.
+    """
+    global _hedging, HEDGE_PERCENTILE, HEDGE_MIN_SAMPLES
+    if percentile is not None:
+        HEDGE_PERCENTILE = percentile
+    if min_samples is not None:
+        HEDGE_MIN_SAMPLES = min_samples
+    _hedging = True
+
+
+def disable_hedging():
+    """
+    헤지 요청을 비활성화합니다.
+    Disables hedged requests.
+    """
+    global _hedging
+    _hedging = False
+
+
+def circuit_breaker(host):
+    """
+    호스트의 서킷 브레이커를 반환합니다. 없으면 새로 만듭니다.
+    Returns the circuit breaker for a host, creating it if needed.
+    """
+    with _lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker()
+        return breaker
+
+
+def reset():
+    """
+    모든 서킷 브레이커와 지연 표본을 초기화합니다.
+    Resets every circuit breaker and latency sample.
+    """
+    with _lock:
+        _breakers.clear()
+        _latencies.clear()
+
+
+def _record_latency(host, elapsed):
+    with _lock:
+        window = _latencies.get(host)
+        if window is None:
+            window = _latencies[host] = deque(maxlen=HEDGE_WINDOW)
+        window.append(elapsed)
+
+
+def _hedge_delay(host):
+    with _lock:
+        window = _latencies.get(host)
+        if window is None or len(window) < HEDGE_MIN_SAMPLES:
+            return None
+        samples = sorted(window)
+    return samples[min(len(samples) - 1, int(HEDGE_PERCENTILE * len(samples)))]
+
+
+def _executor():
+    global _hedge_executor
+    with _lock:
+        if _hedge_executor is None:
+            _hedge_executor = concurrent.futures.ThreadPoolExecutor(max_workers=16, thread_name_prefix='hedge')
+        return _hedge_executor
+
+
+def _timed_request(endpoint, host, method, url, kwargs):
+    start = time.perf_counter()
+    response = instrumentation.request(endpoint, method, url, **kwargs)
+    _record_latency(host, time.perf_counter() - start)
+    return response
+
+
+def _send(endpoint, host, method, url, kwargs):
+    """
+    요청 한 건을 보냅니다. 헤지가 활성화된 GET 요청이면 지연 분위수를 넘었을 때 중복 요청을 보냅니다.
+    Sends a single request. For hedged GETs, a duplicate is sent once the latency percentile is exceeded.
+    """
+    delay = _hedge_delay(host) if _hedging and method == 'GET' else None
+    if delay is None:
+        return _timed_request(endpoint, host, method, url, kwargs)
+
+    executor = _executor()
+    primary = executor.submit(_timed_request, endpoint, host, method, url, kwargs)
+    try:
+        return primary.result(timeout=delay)
+    except concurrent.futures.TimeoutError:
+        pass
+
+    hedge = executor.submit(_timed_request, endpoint, host, method, url, kwargs)
+    done, _ = concurrent.futures.wait([primary, hedge], return_when=concurrent.futures.FIRST_COMPLETED)
+    first = done.pop()
+    if first.exception() is not None:
+        # 먼저 끝난 요청이 실패했으면 나머지 요청의 결과를 기다립니다.
+        # If the first one to finish failed, wait for the other.
+        other = hedge if first is primary else primary
+        return other.result()
+    return first.result()
+
+
+def _is_retryable_exception(e):
+    if isinstance(e, CircuitOpenError):
+        return False
+    return isinstance(e, (requests.exceptions.ConnectionError,
+                          requests.exceptions.Timeout,
+                          requests.exceptions.ChunkedEncodingError))
+
+
+def _is_retryable_response(response):
+    return response.status_code in RETRY_STATUS_CODES
+
+
+def _is_unsent(e):
+    # 서버에 도달하지 못한 것이 확실한 오류만 재시도합니다 (POST 중복 전송 방지).
+    # Only errors where the request certainly never reached the server (avoids duplicate POSTs).
+    return isinstance(e, requests.exceptions.ConnectTimeout)
+
+
+def _is_rate_limited(response):
+    return response.status_code == 429
+
+
+def _budget_exhausted(retry_state):
+    budget = _budget.get()
+    return budget is not None and not budget.acquire()
+
+
+def _last_outcome(retry_state):
+    # 재시도를 모두 사용한 경우 마지막 응답을 그대로 반환하거나 마지막 예외를 다시 발생시킵니다.
+    # When retries are exhausted, return the last response as is or re-raise the last exception.
+    return retry_state.outcome.result()
+
+
+def request(endpoint, method, url, **kwargs):
+    """
+    복원력 정책(재시도, 재시도 예산, 서킷 브레이커, 헤지 요청)을 적용해 요청을 보냅니다.
+    Sends a request with the resilience policy applied (retries, retry budget, circuit breaker, hedging).
+
+    Parameters:
+        endpoint (str): 계측용 엔드포인트 이름입니다.
+                        Endpoint name for instrumentation.
+        method (str): HTTP 메서드입니다. 헤지 요청은 GET에만 적용되며, 그 외 메서드는
+                      서버에 도달하지 않은 연결 타임아웃과 429 응답만 재시도합니다.
+                      HTTP method. Hedging only applies to GET; other methods are only retried
+                      on connect timeouts (never reached the server) and 429 responses.
+        url (str): 요청 URL입니다.
+                   Request URL.
+        **kwargs: requests.request에 그대로 전달됩니다. timeout이 없으면 (CONNECT_TIMEOUT, READ_TIMEOUT)을 사용합니다.
+                  Passed through to requests.request. Defaults timeout to (CONNECT_TIMEOUT, READ_TIMEOUT).
+
+    Returns:
+        requests.Response: 응답 객체입니다. 재시도 후에도 429/5xx이면 마지막 응답을 반환합니다.
+                           Response object. If it is still 429/5xx after retries, the last response is returned.
+
+    Raises:
+        CircuitOpenError: 호스트의 서킷 브레이커가 열려 있는 경우.
+                          If the host's circuit breaker is open.
+        requests.exceptions.RequestException: 재시도 후에도 통신 오류가 계속되는 경우.
+                                              If communication keeps failing after retries.
+    """
+    # 응답 없는 서버도 Timeout으로 끝나야 재시도, 서킷 브레이커, 헤지 스레드 반환이 동작합니다.
+    # A hung server must end in a Timeout for retries, the circuit breaker and hedge threads to work.
+    kwargs.setdefault('timeout', (CONNECT_TIMEOUT, READ_TIMEOUT))
+    host = urlsplit(url).netloc
+    breaker = circuit_breaker(host)
+
+    def attempt():
+        if not breaker.allow():
+            raise CircuitOpenError(f'Circuit open for {host} (서킷 브레이커가 열려 있습니다: {host})')
+        try:
+            response = _send(endpoint, host, method, url, kwargs)
+        except Exception:
+            breaker.record_failure()
+            raise
+        if _is_retryable_response(response):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    if method == 'GET':
+        retry = retry_if_exception(_is_retryable_exception) | retry_if_result(_is_retryable_response)
+    else:
+        retry = retry_if_exception(_is_unsent) | retry_if_result(_is_rate_limited)
+
+    retrying = Retrying(
+        stop=stop_any(stop_after_attempt(MAX_ATTEMPTS), _budget_exhausted),
+        wait=wait_random_exponential(multiplier=BACKOFF_MULTIPLIER, max=BACKOFF_MAX),
+        retry=retry,
+        before_sleep=instrumentation.retry_hook(endpoint),
+        retry_error_callback=_last_outcome,
+    )
+    return retrying(attempt)
+
+
+def get(endpoint, url, **kwargs):
+    """
+    복원력 정책이 적용된 GET 요청입니다. request()를 참고하세요.
+    GET request with the resilience policy applied. See request().
+    """
+    return request(endpoint, 'GET', url, **kwargs)
+
+
+def post(endpoint, url, **kwargs):
+    """
+    복원력 정책이 적용된 POST 요청입니다. 중복 전송을 막기 위해 헤지 요청은 적용되지 않습니다.
+    POST request with the resilience policy applied. Never hedged, to avoid duplicate sends.
+    """
+    return request(endpoint, 'POST', url, **kwargs)
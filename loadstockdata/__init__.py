@@ -5,3 +5,5 @@ from .compute import *
 from .exchange import *
 from .financials import *
 from .gold import *
+from httpclient import instrumentation, resilience
+from . import calendars, parsing, resample
@@ -0,0 +1,407 @@
+# 거래소 거래일 캘린더 모듈
+# KRX, NYSE, NASDAQ의 휴장일을 네트워크 없이 계산합니다.
+#  - NYSE/NASDAQ: 규칙 기반 공휴일(대체 휴일 포함)과 임시 휴장일 표
+#  - KRX: 양력 고정 공휴일, 연말 휴장일과 음력 공휴일/대체 공휴일/선거일/임시 공휴일 표(2015~2026년)
+#    표에 없는 연도는 양력 고정 공휴일과 연말 휴장일만 반영되므로 KRXHolidayTableWarning을 내며, 표를 매년 갱신해야 합니다.
+# Exchange trading calendar module.
+# Computes KRX, NYSE and NASDAQ holidays offline.
+#  - NYSE/NASDAQ: rule-based holidays (with observance) plus a table of special closures
+#  - KRX: fixed solar holidays, the year-end closing day, and a table of lunar, substitute,
+#    election and temporary holidays (2015-2026). Years outside the table only get the fixed
+#    holidays and the year-end closing and emit KRXHolidayTableWarning; the table needs a yearly update.
+
+import datetime
+import functools
+import re
+import warnings
+
+import pandas as pd
+
+# KRX 음력 공휴일(설날, 부처님오신날, 추석), 대체 공휴일, 선거일, 임시 공휴일 중 평일인 날짜
+# Weekday KRX closures from lunar holidays (Seollal, Buddha's Birthday, Chuseok), substitute
+# holidays, election days and temporary holidays
+_KRX_TABLE = {
+    2015: ['2015-02-18', '2015-02-19', '2015-02-20', '2015-05-25', '2015-08-14',
+           '2015-09-28', '2015-09-29'],
+    2016: ['2016-02-08', '2016-02-09', '2016-02-10', '2016-04-13', '2016-05-06',
+           '2016-09-14', '2016-09-15', '2016-09-16'],
+    2017: ['2017-01-27', '2017-01-30', '2017-05-03', '2017-05-09', '2017-10-02',
+           '2017-10-04', '2017-10-05', '2017-10-06'],
+    2018: ['2018-02-15', '2018-02-16', '2018-05-07', '2018-05-22', '2018-06-13',
+           '2018-09-24', '2018-09-25', '2018-09-26'],
+    2019: ['2019-02-04', '2019-02-05', '2019-02-06', '2019-05-06',
+           '2019-09-12', '2019-09-13'],
+    2020: ['2020-01-24', '2020-01-27', '2020-04-15', '2020-04-30', '2020-08-17',
+           '2020-09-30', '2020-10-01', '2020-10-02'],
+    2021: ['2021-02-11', '2021-02-12', '2021-05-19', '2021-08-16',
+           '2021-09-20', '2021-09-21', '2021-09-22', '2021-10-04', '2021-10-11'],
+    2022: ['2022-01-31', '2022-02-01', '2022-02-02', '2022-03-09', '2022-06-01',
+           '2022-09-09', '2022-09-12', '2022-10-10'],
+    2023: ['2023-01-23', '2023-01-24', '2023-05-29', '2023-09-28', '2023-09-29',
+           '2023-10-02'],
+    2024: ['2024-02-09', '2024-02-12', '2024-04-10', '2024-05-06', '2024-05-15',
+           '2024-09-16', '2024-09-17', '2024-09-18', '2024-10-01'],
+    2025: ['2025-01-27', '2025-01-28', '2025-01-29', '2025-01-30', '2025-03-03',
+           '2025-05-06', '2025-06-03', '2025-10-06', '2025-10-07', '2025-10-08'],
+    2026: ['2026-02-16', '2026-02-17', '2026-02-18', '2026-03-02', '2026-05-25',
+           '2026-06-03', '2026-08-17', '2026-09-24', '2026-09-25', '2026-10-05'],
+}
+
+KRX_TABLE_YEARS = (min(_KRX_TABLE), max(_KRX_TABLE))
+
+# 네이버 해외 티커(로이터 코드) 접미사별 미국 거래소 / US exchange by Naver foreign ticker (Reuters code) suffix
+_US_SUFFIX_CALENDARS = {
+    '.O': 'NASDAQ',
+    '.OQ': 'NASDAQ',
+    '.N': 'NYSE',
+    '.A': 'NYSE',   # NYSE American
+    '.P': 'NYSE',   # NYSE Arca
+    '.K': 'NYSE',   # NYSE 통합 시세 / NYSE consolidated
+}
+
+
+class KRXHolidayTableWarning(UserWarning):
+    """
+    KRX 음력/대체/임시 공휴일 표에 없는 연도를 계산할 때 발생하는 경고입니다.
+    해당 연도는 설날, 추석 등이 빠져 거래일이 실제보다 많게 계산됩니다.
+    Warning emitted when a year outside the KRX lunar/substitute/temporary holiday table is used.
+    Seollal, Chuseok and the like are missing for that year, so it has more sessions than it really does.
+    """
+
+_NYSE_SPECIAL_CLOSURES = [
+    '2001-09-11', '2001-09-12', '2001-09-13', '2001-09-14',  # 9/11
+    '2004-06-11',  # Ronald Reagan 추모 / Reagan day of mourning
+    '2007-01-02',  # Gerald Ford 추모 / Ford day of mourning
+    '2012-10-29', '2012-10-30',  # 허리케인 샌디 / Hurricane Sandy
+    '2018-12-05',  # George H.W. Bush 추모 / Bush day of mourning
+    '2025-01-09',  # Jimmy Carter 추모 / Carter day of mourning
+]
+
+
+def _nth_weekday(year, month, weekday, n):
+    """
+    해당 월의 n번째 요일 날짜를 반환합니다 (weekday: 월=0).
+    Returns the n-th given weekday of the month (weekday: Monday=0).
+    """
+    first = datetime.date(year, month, 1)
+    offset = (weekday - first.weekday()) % 7
+    return first + datetime.timedelta(days=offset + 7 * (n - 1))
+
+
+def _last_weekday(year, month, weekday):
+    """
+    해당 월의 마지막 요일 날짜를 반환합니다.
+    Returns the last given weekday of the month.
+    """
+    if month == 12:
+        last = datetime.date(year, 12, 31)
+    else:
+        last = datetime.date(year, month + 1, 1) - datetime.timedelta(days=1)
+    return last - datetime.timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year):
+    """
+    그레고리력 부활절 날짜를 계산합니다 (Anonymous Gregorian algorithm).
+    Computes the Gregorian Easter date (Anonymous Gregorian algorithm).
+    """
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return datetime.date(year, month, day + 1)
+
+
+def _observed(date):
+    """
+    미국 공휴일 대체 규칙: 토요일이면 금요일, 일요일이면 월요일에 휴장합니다.
+    US observance rule: Saturday holidays move to Friday, Sunday holidays to Monday.
+    """
+    if date.weekday() == 5:
+        return date - datetime.timedelta(days=1)
+    if date.weekday() == 6:
+        return date + datetime.timedelta(days=1)
+    return date
+
+
+@functools.lru_cache(maxsize=None)
+def _nyse_holidays(year):
+    holidays = []
+
+    # 신정: 토요일이면 전년도 금요일에 휴장하지 않습니다.
+    # New Year's Day: no Friday closure when it falls on a Saturday.
+    new_year = datetime.date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.append(_observed(new_year))
+
+    if year >= 1998:
+        holidays.append(_nth_weekday(year, 1, 0, 3))  # Martin Luther King Jr. Day
+    holidays.append(_nth_weekday(year, 2, 0, 3))  # Washington's Birthday
+    holidays.append(_easter(year) - datetime.timedelta(days=2))  # Good Friday
+    holidays.append(_last_weekday(year, 5, 0))  # Memorial Day
+    if year >= 2022:
+        holidays.append(_observed(datetime.date(year, 6, 19)))  # Juneteenth
+    holidays.append(_observed(datetime.date(year, 7, 4)))  # Independence Day
+    holidays.append(_nth_weekday(year, 9, 0, 1))  # Labor Day
+    holidays.append(_nth_weekday(year, 11, 3, 4))  # Thanksgiving
+    holidays.append(_observed(datetime.date(year, 12, 25)))  # Christmas
+
+    holidays.extend(datetime.date.fromisoformat(d) for d in _NYSE_SPECIAL_CLOSURES if d.startswith(str(year)))
+    return tuple(sorted(h for h in holidays if h.year == year))
+
+
+@functools.lru_cache(maxsize=None)
+def _krx_holidays(year):
+    holidays = [datetime.date(year, month, day) for month, day in (
+        (1, 1),    # 신정 / New Year's Day
+        (3, 1),    # 삼일절 / Independence Movement Day
+        (5, 1),    # 근로자의 날 / Labor Day
+        (5, 5),    # 어린이날 / Children's Day
+        (6, 6),    # 현충일 / Memorial Day
+        (8, 15),   # 광복절 / Liberation Day
+        (10, 3),   # 개천절 / National Foundation Day
+        (10, 9),   # 한글날 / Hangul Day
+        (12, 25),  # 성탄절 / Christmas
+    )]
+
+    # 연말 휴장일: 12월 마지막 평일
+    # Year-end closing: the last weekday of December
+    year_end = datetime.date(year, 12, 31)
+    while year_end.weekday() >= 5:
+        year_end -= datetime.timedelta(days=1)
+    holidays.append(year_end)
+
+    if year in _KRX_TABLE:
+        holidays.extend(datetime.date.fromisoformat(d) for d in _KRX_TABLE[year])
+    else:
+        # lru_cache 덕분에 연도마다 한 번만 경고합니다.
+        # Thanks to lru_cache this warns once per year.
+        warnings.warn(
+            f"KRX holiday table covers {KRX_TABLE_YEARS[0]}-{KRX_TABLE_YEARS[1]}; {year} lacks lunar, substitute "
+            f"and temporary holidays ({year}년은 KRX 휴장일 표에 없어 설날/추석 등이 빠집니다)",
+            KRXHolidayTableWarning, stacklevel=2)
+    return tuple(sorted(set(holidays)))
+
+
+class TradingCalendar:
+    """
+    거래소 하나의 거래일 캘린더입니다.
+    Trading calendar for a single exchange.
+
+    Parameters:
+        name (str): 캘린더 이름입니다. 예: 'KRX'
+                    Calendar name. e.g., 'KRX'
+        holiday_rule (callable, optional): 연도를 받아 휴장일 튜플을 반환하는 함수입니다. 없으면 평일 전체가 거래일입니다.
+                                           Function returning the holidays of a year. If omitted, every weekday is a session.
+    """
+
+    def __init__(self, name, holiday_rule=None):
+        self.name = name
+        self.holiday_rule = holiday_rule
+
+    def __repr__(self):
+        return f'TradingCalendar({self.name!r})'
+
+    def holidays(self, start, end):
+        """
+        기간 내 평일 휴장일을 반환합니다.
+        Returns the weekday holidays in the range.
+
+        Parameters:
+            start (datetime-like or str): 시작 날짜입니다 ('YYYYMMDD' 문자열 가능).
+                                          Start date ('YYYYMMDD' strings accepted).
+            end (datetime-like or str): 종료 날짜입니다.
+                                        End date.
+
+        Returns:
+            pd.DatetimeIndex: 휴장일입니다.
+                              Holidays.
+        """
+        start, end = _to_timestamp(start), _to_timestamp(end)
+        if self.holiday_rule is None:
+            return pd.DatetimeIndex([])
+        days = [d for year in range(start.year, end.year + 1) for d in self.holiday_rule(year)]
+        index = pd.DatetimeIndex(days)
+        return index[(index >= start) & (index <= end) & (index.dayofweek < 5)]
+
+    def sessions(self, start, end):
+        """
+        기간 내 거래일을 반환합니다.
+        Returns the trading sessions in the range.
+
+        Parameters:
+            start (datetime-like or str): 시작 날짜입니다.
+                                          Start date.
+            end (datetime-like or str): 종료 날짜입니다.
+                                        End date.
+
+        Returns:
+            pd.DatetimeIndex: 거래일입니다.
+                              Trading sessions.
+        """
+        start, end = _to_timestamp(start), _to_timestamp(end)
+        if start > end:
+            return pd.DatetimeIndex([])
+        # pd.bdate_range는 날짜를 하나씩 생성하므로 일 단위 범위에서 주말을 걸러냅니다.
+        # pd.bdate_range generates dates one by one, so mask weekends out of a daily range instead.
+        days = pd.date_range(start, end, freq='D')
+        return days[days.dayofweek < 5].difference(self.holidays(start, end))
+
+    def is_session(self, date):
+        """
+        거래일 여부를 반환합니다.
+        Returns whether the date is a trading session.
+        """
+        date = _to_timestamp(date)
+        return date.dayofweek < 5 and date not in self.holidays(date, date)
+
+    def previous_sessions(self, end, count):
+        """
+        end 이전(end 포함) 최근 count개의 거래일을 반환합니다.
+        Returns the last `count` sessions on or before `end`.
+
+        Parameters:
+            end (datetime-like or str): 기준 날짜입니다.
+                                        Reference date.
+            count (int): 거래일 수입니다.
+                         Number of sessions.
+
+        Returns:
+            pd.DatetimeIndex: 오래된 순으로 정렬된 거래일입니다.
+                              Sessions in ascending order.
+        """
+        end = _to_timestamp(end)
+        # 휴장일을 고려해 넉넉한 기간을 잡고 뒤에서 count개를 자릅니다.
+        # Take a generous window to cover holidays and keep the last `count`.
+        start = end - pd.Timedelta(days=count * 7 // 5 + 30)
+        sessions = self.sessions(start, end)
+        while len(sessions) < count:
+            start -= pd.Timedelta(days=count + 30)
+            sessions = self.sessions(start, end)
+        return sessions[-count:] if count > 0 else sessions[:0]
+
+    def missing_sessions(self, dates, start=None, end=None):
+        """
+        주어진 날짜 목록에서 빠진 거래일을 반환합니다. 휴장일은 정상적인 결측으로 보고 제외합니다.
+        Returns the sessions missing from the given dates. Holidays are legitimately absent and excluded.
+
+        Parameters:
+            dates (iterable): 보유한 데이터의 날짜입니다 ('YYYYMMDD' 문자열 또는 datetime).
+                              Dates present in the data ('YYYYMMDD' strings or datetimes).
+            start (datetime-like or str, optional): 시작 날짜입니다. 기본값은 dates의 최솟값입니다.
+                                                    Start date. Defaults to the earliest date.
+            end (datetime-like or str, optional): 종료 날짜입니다. 기본값은 dates의 최댓값입니다.
+                                                  End date. Defaults to the latest date.
+
+        Returns:
+            pd.DatetimeIndex: 빠진 거래일입니다.
+                              Missing sessions.
+        """
+        present = pd.DatetimeIndex([_to_timestamp(d) for d in dates])
+        if start is None and end is None and present.empty:
+            return pd.DatetimeIndex([])
+        start = _to_timestamp(start) if start is not None else present.min()
+        end = _to_timestamp(end) if end is not None else present.max()
+        return self.sessions(start, end).difference(present.normalize())
+
+
+def _to_timestamp(date):
+    if isinstance(date, str) and re.match(r'^\d{8}$', date):
+        return pd.Timestamp(datetime.datetime.strptime(date, '%Y%m%d'))
+    return pd.Timestamp(date).normalize()
+
+
+_CALENDARS = {
+    'KRX': TradingCalendar('KRX', _krx_holidays),
+    'NYSE': TradingCalendar('NYSE', _nyse_holidays),
+    'NASDAQ': TradingCalendar('NASDAQ', _nyse_holidays),
+    'WEEKDAY': TradingCalendar('WEEKDAY'),
+}
+
+
+def get_calendar(name):
+    """
+    이름으로 거래일 캘린더를 반환합니다.
+    Returns a trading calendar by name.
+
+    Parameters:
+        name (str): 'KRX', 'NYSE', 'NASDAQ' 또는 'WEEKDAY'(휴장일 없는 평일, 환율 등)입니다.
+                    'KRX', 'NYSE', 'NASDAQ' or 'WEEKDAY' (plain weekdays, e.g. FX).
+
+    Returns:
+        TradingCalendar: 거래일 캘린더입니다.
+                         Trading calendar.
+
+    Raises:
+        ValueError: 지원하지 않는 캘린더 이름인 경우.
+                    If the calendar name is not supported.
+    """
+    try:
+        return _CALENDARS[name.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown calendar: {name} (지원하지 않는 캘린더입니다: {name})")
+
+
+def calendar_for_symbol(symbol):
+    """
+    종목 코드에 맞는 거래소 캘린더를 반환합니다.
+    국내 종목(숫자 6자리)은 KRX, 네이버 해외 티커는 미국 거래소 접미사('.O', '.OQ'는 NASDAQ, '.N', '.A', '.P', '.K'는 NYSE)로 구분합니다.
+    Returns the exchange calendar for a symbol.
+    Domestic symbols (6 digits) use KRX; Naver foreign tickers are mapped by US exchange suffix
+    ('.O', '.OQ' to NASDAQ; '.N', '.A', '.P', '.K' to NYSE).
+
+    Parameters:
+        symbol (str): 종목 코드 또는 티커입니다.
+                      Stock code or ticker.
+
+    Returns:
+        TradingCalendar: 거래일 캘린더입니다.
+                         Trading calendar.
+
+    Raises:
+        ValueError: 캘린더가 없는 시장의 종목인 경우 (예: '.T' 도쿄, '.HK' 홍콩).
+                    If the symbol trades on a market without a calendar (e.g. '.T' Tokyo, '.HK' Hong Kong).
+                    조회 기간 계산에는 오류 없이 대체 기간을 쓰는 lookback_start를 사용하세요.
+                    Use lookback_start, which falls back instead of raising, for fetch windows.
+    """
+    if re.match(r'^\d{6}$', symbol):
+        return _CALENDARS['KRX']
+    suffix = symbol[symbol.rfind('.'):].upper() if '.' in symbol else ''
+    if suffix in _US_SUFFIX_CALENDARS:
+        return _CALENDARS[_US_SUFFIX_CALENDARS[suffix]]
+    raise ValueError(f"No trading calendar for symbol: {symbol} (거래일 캘린더가 없는 종목입니다: {symbol})")
+
+
+def lookback_start(symbol, end, count):
+    """
+    종목의 최근 count 거래일을 가져오기 위한 시작 날짜를 계산합니다.
+    캘린더가 없는 시장의 종목(예: '.T', '.HK', '.IXIC' 같은 지수)은 오류를 내지 않고, 휴장일을 모르므로
+    count의 두 배(달력일)만큼 넉넉하게 거슬러 올라갑니다. 호출한 쪽에서 뒤의 count개를 잘라 쓰면 됩니다.
+    Computes the start date for fetching a symbol's last `count` sessions.
+    Symbols on markets without a calendar (e.g. '.T', '.HK' or indices such as '.IXIC') do not raise;
+    since their holidays are unknown, the window goes back a generous 2 * count calendar days and
+    callers keep the last `count` rows.
+
+    Parameters:
+        symbol (str): 종목 코드 또는 티커입니다.
+                      Stock code or ticker.
+        end (datetime-like or str): 기준 날짜입니다.
+                                    Reference date.
+        count (int): 필요한 거래일 수입니다.
+                     Number of sessions needed.
+
+    Returns:
+        pd.Timestamp: 조회 시작 날짜입니다.
+                      First date of the fetch window.
+    """
+    try:
+        calendar = calendar_for_symbol(symbol)
+    except ValueError:
+        return _to_timestamp(end) - pd.Timedelta(days=count * 2)
+    return calendar.previous_sessions(end, count)[0]
@@ -2,9 +2,133 @@ import requests
 import pandas as pd
 import re
 import datetime
+import numpy as np
+from httpclient import instrumentation
 
 
+# ---------------------------------------------------------------------------
+# 공통 커널 / Shared kernels
+# 여러 지표가 같은 커널을 재사용합니다.
+# Indicators below are built on these kernels.
+# ---------------------------------------------------------------------------
 
+def _rolling_moments(series, window_size, min_periods=1):
+    """
+    이동 평균과 이동 표준편차(ddof=1)를 누적합으로 함께 계산합니다.
+    시리즈 전체 누적합은 가격이 처음 값에서 멀어질수록 정밀도를 잃으므로, 값을 window_size 크기의 블록으로 나눕니다.
+    현재 블록에서 끝나는 창은 모두 블록의 첫 값을 포함하므로 그 값을 빼서(재중심화) 계산하고, 창의 합은
+    직전 블록의 뒤쪽 누적합과 현재 블록의 앞쪽 누적합으로 구해 창 밖의 값은 더하지 않습니다.
+    따라서 오차는 전체 추세가 아니라 각 창 안의 값 범위에만 비례합니다.
+    Computes the rolling mean and rolling standard deviation (ddof=1) from cumulative sums.
+    A whole-series cumulative sum loses precision as prices drift from where they started, so values are
+    split into blocks of window_size. Every window ending in a block contains the block's first value, so
+    values are re-centered on it, and each window sum is a suffix sum of the previous block plus a prefix
+    sum of the current block, so values outside the window are never accumulated. The error then scales
+    with the range inside each window rather than with the overall trend.
+
+    Parameters:
+        series (pandas.Series): 입력 시리즈입니다. NaN은 건너뜁니다.
+                                Input series. NaNs are skipped.
+        window_size (int): 이동 기간입니다.
+                           Window size.
+        min_periods (int): 값을 계산하기 위한 최소 유효값 개수입니다.
+                           Minimum number of valid observations required for a value.
+
+    Returns:
+        tuple: (이동 평균, 이동 표준편차) 시리즈입니다.
+               (rolling mean, rolling standard deviation) Series.
+    """
+    values = series.to_numpy(dtype=np.float64)
+    length = len(values)
+    num_blocks = -(-length // window_size)
+
+    # 앞에 NaN 블록 하나를 두어 블록마다 (직전 블록, 현재 블록) 쌍을 만듭니다.
+    # Prepend one NaN block so every block has a (previous block, current block) pair.
+    padded = np.full((num_blocks + 1) * window_size, np.nan)
+    padded[window_size:window_size + length] = values
+    blocks = padded.reshape(num_blocks + 1, window_size)
+    valid = ~np.isnan(blocks)
+
+    # 기준값은 현재 블록의 첫 유효값이고, 없으면 직전 블록의 마지막 유효값입니다 (그 블록에서 끝나는 창에 포함됨).
+    # The shift is the current block's first valid value, else the previous block's last valid value
+    # (both lie inside the windows ending in that block).
+    rows = np.arange(num_blocks + 1)
+    first = blocks[rows, valid.argmax(axis=1)]
+    last = blocks[rows, window_size - 1 - valid[:, ::-1].argmax(axis=1)]
+    shift = np.where(valid[1:].any(axis=1), first[1:], np.where(valid[:-1].any(axis=1), last[:-1], 0.0))
+    centered = np.where(valid, blocks - np.concatenate(([0.0], shift))[:, None], 0.0)
+    # 직전 블록의 값은 다음 블록의 기준값으로 다시 중심화합니다. / Previous-block values are re-centered on the next block's shift.
+    previous = np.where(valid[:-1], blocks[:-1] - shift[:, None], 0.0)
+
+    def window_sum(before, current):
+        # 현재 블록 j번째 값에서 끝나는 창 = 직전 블록의 j + 1번째 이후 + 현재 블록의 j번째까지
+        # The window ending at position j of a block = previous block from j + 1 on + current block up to j
+        suffix = np.cumsum(before[:, ::-1], axis=1)[:, ::-1]
+        suffix = np.concatenate([suffix[:, 1:], np.zeros((num_blocks, 1))], axis=1)
+        return (suffix + np.cumsum(current, axis=1)).ravel()[:length]
+
+    current = centered[1:]
+    count = window_sum(valid[:-1].astype(np.float64), valid[1:].astype(np.float64))
+    total = window_sum(previous, current)
+    squares = window_sum(previous * previous, current * current)
+    shift = np.repeat(shift, window_size)[:length]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / count
+        variance = np.maximum(squares - total * mean, 0.0) / (count - 1)
+    enough = count >= max(min_periods, 1)
+    mean = np.where(enough, mean + shift, np.nan)
+    std = np.where(enough & (count > 1), np.sqrt(variance), np.nan)
+    return pd.Series(mean, index=series.index), pd.Series(std, index=series.index)
+
+
+def _ema(series, min_periods=0, adjust=False, **decay):
+    """
+    지수이동평균을 계산합니다. adjust=False이면 y[t] = (1 - a) * y[t-1] + a * x[t] 재귀식을 사용합니다.
+    Computes the exponential moving average. With adjust=False the recursion
+    y[t] = (1 - a) * y[t-1] + a * x[t] is used.
+
+    Parameters:
+        series (pandas.Series): 입력 시리즈입니다.
+                                Input series.
+        min_periods (int): 값을 계산하기 위한 최소 개수입니다.
+                           Minimum number of observations required for a value.
+        adjust (bool): pandas ewm의 adjust 옵션입니다.
+                       The adjust option of pandas ewm.
+        **decay: span, com 또는 alpha 중 하나입니다.
+                 One of span, com or alpha.
+
+    Returns:
+        pandas.Series: 지수이동평균 시리즈입니다.
+                       Exponential moving average Series.
+    """
+    return series.ewm(min_periods=min_periods, adjust=adjust, **decay).mean()
+
+
+def _rolling_extrema(series, window_size, min_periods=None):
+    """
+    이동 최댓값과 최솟값을 계산합니다. pandas의 rolling max/min은 단조 덱(monotonic deque)으로 구현되어
+    창 크기와 관계없이 값마다 상수 시간에 처리합니다.
+    Computes the rolling maximum and minimum. pandas implements rolling max/min with a monotonic
+    deque, so each value is processed in amortized constant time regardless of the window size.
+
+    Returns:
+        tuple: (이동 최댓값, 이동 최솟값) 시리즈입니다.
+               (rolling max, rolling min) Series.
+    """
+    rolling = series.rolling(window=window_size, min_periods=min_periods)
+    return rolling.max(), rolling.min()
+
+
+def _true_range(dataframe, high_column, low_column, close_column):
+    high = dataframe[high_column]
+    low = dataframe[low_column]
+    previous_close = dataframe[close_column].shift(1)
+    ranges = pd.concat([high - low, (high - previous_close).abs(), (low - previous_close).abs()], axis=1)
+    return ranges.max(axis=1, skipna=False).fillna(high - low)
+
+
+@instrumentation.timed()
 def compute_rsi(dataframe, price_column='closePrice', period=14):
     """
     RSI를 계산하는 함수입니다.
@@ -26,14 +150,15 @@ def compute_rsi(dataframe, price_column='closePrice', period=14):
     gain = delta.clip(lower=0)
     loss = -delta.clip(upper=0)
 
-    avg_gain = gain.ewm(com=period - 1, min_periods=period).mean()
-    avg_loss = loss.ewm(com=period - 1, min_periods=period).mean()
+    avg_gain = _ema(gain, min_periods=period, adjust=True, com=period - 1)
+    avg_loss = _ema(loss, min_periods=period, adjust=True, com=period - 1)
 
     rs = avg_gain / avg_loss
     rsi = 100 - (100 / (1 + rs))
     return rsi
 
 
+@instrumentation.timed()
 def compute_moving_average(dataframe, price_column='closePrice', window_size=30):
     """
     N일 이동평균선을 계산하는 함수입니다.
@@ -55,6 +180,7 @@ def compute_moving_average(dataframe, price_column='closePrice', window_size=30)
     return moving_avg
 
 
+@instrumentation.timed()
 def compute_bollinger_bands(dataframe, price_column='closePrice', window_size=20, num_std_dev=2):
     """
     볼린저 밴드를 계산하는 함수입니다.
@@ -74,11 +200,8 @@ def compute_bollinger_bands(dataframe, price_column='closePrice', window_size=20
         pandas.DataFrame: 상단 밴드, 중간 밴드(이동평균), 하단 밴드가 포함된 데이터프레임입니다.
                           DataFrame containing Upper Band, Middle Band (Moving Average), and Lower Band.
     """
-    # 중간 밴드(Moving Average) 계산
-    middle_band = dataframe[price_column].rolling(window=window_size, min_periods=1).mean()
-
-    # 표준편차(Standard Deviation) 계산
-    rolling_std = dataframe[price_column].rolling(window=window_size, min_periods=1).std()
+    # 중간 밴드(Moving Average)와 표준편차(Standard Deviation)를 한 번에 계산
+    middle_band, rolling_std = _rolling_moments(dataframe[price_column], window_size, min_periods=1)
 
     # 상단 밴드 및 하단 밴드 계산
     upper_band = middle_band + (rolling_std * num_std_dev)
@@ -92,3 +215,165 @@ def compute_bollinger_bands(dataframe, price_column='closePrice', window_size=20
     })
 
     return bollinger_bands
+
+
+@instrumentation.timed()
+def compute_ema(dataframe, price_column='closePrice', span=20):
+    """
+    지수이동평균(EMA)을 계산하는 함수입니다.
+    Calculates the Exponential Moving Average (EMA).
+
+    Parameters:
+        dataframe (pandas.DataFrame): 가격 데이터프레임입니다.
+                                      Price DataFrame.
+        price_column (str): 가격 열 이름입니다.
+                            The column name for price data.
+        span (int): EMA 기간입니다. 가중치는 2 / (span + 1)입니다.
+                    EMA span. The smoothing factor is 2 / (span + 1).
+
+    Returns:
+        pandas.Series: EMA 값이 담긴 시리즈입니다.
+                       Series containing EMA values.
+    """
+    return _ema(dataframe[price_column], span=span)
+
+
+@instrumentation.timed()
+def compute_macd(dataframe, price_column='closePrice', fast_period=12, slow_period=26, signal_period=9):
+    """
+    MACD, 시그널, 히스토그램을 계산하는 함수입니다.
+    Calculates the MACD line, signal line and histogram.
+
+    Parameters:
+        dataframe (pandas.DataFrame): 가격 데이터프레임입니다.
+                                      Price DataFrame.
+        price_column (str): 가격 열 이름입니다.
+                            The column name for price data.
+        fast_period (int): 단기 EMA 기간입니다.
+                           Span of the fast EMA.
+        slow_period (int): 장기 EMA 기간입니다.
+                           Span of the slow EMA.
+        signal_period (int): 시그널선(MACD의 EMA) 기간입니다.
+                             Span of the signal line (EMA of the MACD line).
+
+    Returns:
+        pandas.DataFrame: macd, signal, histogram 열이 포함된 데이터프레임입니다.
+                          DataFrame containing macd, signal and histogram columns.
+    """
+    price = dataframe[price_column]
+    macd = _ema(price, span=fast_period) - _ema(price, span=slow_period)
+    signal = _ema(macd, span=signal_period)
+
+    return pd.DataFrame({
+        'macd': macd,
+        'signal': signal,
+        'histogram': macd - signal
+    })
+
+
+@instrumentation.timed()
+def compute_atr(dataframe, high_column='highPrice', low_column='lowPrice', close_column='closePrice', period=14):
+    """
+    ATR(평균 실제 범위)을 계산하는 함수입니다. 실제 범위(True Range)를 와일더 방식(alpha = 1 / period)으로 평활합니다.
+    Calculates the Average True Range, smoothing the True Range with Wilder's method (alpha = 1 / period).
+
+    Parameters:
+        dataframe (pandas.DataFrame): 가격 데이터프레임입니다.
+                                      Price DataFrame.
+        high_column (str): 고가 열 이름입니다.
+                           The column name for high prices.
+        low_column (str): 저가 열 이름입니다.
+                          The column name for low prices.
+        close_column (str): 종가 열 이름입니다.
+                            The column name for close prices.
+        period (int): ATR 계산 기간입니다.
+                      Period for ATR calculation.
+
+    Returns:
+        pandas.Series: ATR 값이 담긴 시리즈입니다.
+                       Series containing ATR values.
+    """
+    true_range = _true_range(dataframe, high_column, low_column, close_column)
+    return _ema(true_range, min_periods=period, alpha=1 / period)
+
+
+@instrumentation.timed()
+def compute_stochastic(dataframe, high_column='highPrice', low_column='lowPrice', close_column='closePrice',
+                       k_period=14, d_period=3):
+    """
+    스토캐스틱 %K, %D를 계산하는 함수입니다.
+    Calculates the stochastic oscillator %K and %D.
+
+    Parameters:
+        dataframe (pandas.DataFrame): 가격 데이터프레임입니다.
+                                      Price DataFrame.
+        high_column (str): 고가 열 이름입니다.
+                           The column name for high prices.
+        low_column (str): 저가 열 이름입니다.
+                          The column name for low prices.
+        close_column (str): 종가 열 이름입니다.
+                            The column name for close prices.
+        k_period (int): %K 계산 기간(최고가/최저가 기간)입니다.
+                        Look-back period for %K (highest high / lowest low).
+        d_period (int): %D(%K의 이동평균) 기간입니다.
+                        Period of %D (moving average of %K).
+
+    Returns:
+        pandas.DataFrame: percent_k, percent_d 열이 포함된 데이터프레임입니다.
+                          DataFrame containing percent_k and percent_d columns.
+    """
+    highest_high, _ = _rolling_extrema(dataframe[high_column], k_period)
+    _, lowest_low = _rolling_extrema(dataframe[low_column], k_period)
+
+    price_range = (highest_high - lowest_low).replace(0, np.nan)
+    percent_k = 100 * (dataframe[close_column] - lowest_low) / price_range
+    percent_d, _ = _rolling_moments(percent_k, d_period, min_periods=d_period)
+
+    return pd.DataFrame({
+        'percent_k': percent_k,
+        'percent_d': percent_d
+    })
+
+
+@instrumentation.timed()
+def compute_obv(dataframe, price_column='closePrice', volume_column='accumulatedTradingVolume'):
+    """
+    OBV(거래량 균형 지표)를 계산하는 함수입니다. 종가가 오르면 거래량을 더하고, 내리면 뺍니다.
+    Calculates On-Balance Volume: volume is added on up closes and subtracted on down closes.
+
+    Parameters:
+        dataframe (pandas.DataFrame): 가격 데이터프레임입니다.
+                                      Price DataFrame.
+        price_column (str): 가격 열 이름입니다.
+                            The column name for price data.
+        volume_column (str): 거래량 열 이름입니다.
+                             The column name for volume data.
+
+    Returns:
+        pandas.Series: OBV 값이 담긴 시리즈입니다. 첫 값은 0입니다.
+                       Series containing OBV values, starting at 0.
+    """
+    direction = np.sign(dataframe[price_column].diff()).fillna(0)
+    return (direction * dataframe[volume_column]).cumsum()
+
+
+@instrumentation.timed()
+def compute_roc(dataframe, price_column='closePrice', period=12):
+    """
+    ROC(변화율)를 계산하는 함수입니다. N일 전 대비 가격 변화율(%)입니다.
+    Calculates the Rate of Change: the percentage price change versus N periods ago.
+
+    Parameters:
+        dataframe (pandas.DataFrame): 가격 데이터프레임입니다.
+                                      Price DataFrame.
+        price_column (str): 가격 열 이름입니다.
+                            The column name for price data.
+        period (int): 비교 기간입니다.
+                      Look-back period.
+
+    Returns:
+        pandas.Series: ROC 값(%)이 담긴 시리즈입니다.
+                       Series containing ROC values (%).
+    """
+    price = dataframe[price_column]
+    return 100 * (price / price.shift(period) - 1)
@@ -15,6 +15,8 @@ import pandas as pd
 import numpy as np
 from scipy.interpolate import interp1d
 import yfinance as yf
+from httpclient import instrumentation, resilience
+from . import calendars, parsing
 
 def fetch_usd_to_krw_data():
     """
@@ -32,11 +34,12 @@ def fetch_usd_to_krw_data():
         'chartInfoType': 'marketindex',
         'scriptChartType': 'areaMonthThree'
     }
-    response = requests.get(url, params=params)
+    response = resilience.get('naver.chart.pricesByPeriod', url, params=params)
     response.raise_for_status()
-    return json.loads(response.content)
+    return parsing.loads(response.content)
 
-def create_exchange_rate_dataframe(data):
+@instrumentation.timed()
+def create_exchange_rate_dataframe(data, calendar=None):
     """
     가져온 환율 데이터로부터 데이터프레임을 생성하고 누락된 날짜를 채웁니다.
     Creates a DataFrame from the fetched exchange rate data and fills missing dates.
@@ -44,6 +47,10 @@ def create_exchange_rate_dataframe(data):
     Parameters:
         data (dict): 환율 정보를 포함한 JSON 데이터.
                      JSON data containing exchange rate information.
+        calendar (str, optional): 누락된 날짜를 채울 거래일 캘린더 이름입니다 ('KRX', 'NYSE', 'NASDAQ', 'WEEKDAY').
+                                  지정하지 않으면 주말을 포함한 모든 날짜를 채웁니다.
+                                  Trading calendar used to fill missing dates ('KRX', 'NYSE', 'NASDAQ', 'WEEKDAY').
+                                  If omitted, every calendar day including weekends is filled.
 
     Returns:
         pd.DataFrame: 스무딩된 환율 데이터가 포함된 데이터프레임.
@@ -61,8 +68,13 @@ def create_exchange_rate_dataframe(data):
     df = df[['closePrice', 'highPrice', 'lowPrice']]
 
     # 데이터의 첫 번째 날짜부터 마지막 날짜까지의 전체 날짜 범위 생성
+    # 캘린더를 지정하면 거래일만 채우고, 실제로 받은 날짜는 그대로 유지합니다.
     # Create a complete date range from the first to the last date in the data
-    full_date_range = pd.date_range(start=df.index.min(), end=df.index.max(), freq='D')
+    # With a calendar only sessions are filled, and the dates actually received are kept.
+    if calendar is None:
+        full_date_range = pd.date_range(start=df.index.min(), end=df.index.max(), freq='D')
+    else:
+        full_date_range = calendars.get_calendar(calendar).sessions(df.index.min(), df.index.max()).union(df.index)
     df = df.reindex(full_date_range)
 
     # 선형 보간법을 사용하여 누락된 값을 보간
@@ -84,7 +96,7 @@ def create_exchange_rate_dataframe(data):
 
     return df
 
-def combine_exchange_rate_data(start_date, end_date):
+def combine_exchange_rate_data(start_date, end_date, calendar=None):
     """
     네이버 API와 yfinance에서 가져온 환율 데이터를 결합하고, 조회 기간에 맞춰 데이터를 반환합니다.
     Combines exchange rate data from Naver API and yfinance, then returns the data for the specified date range.
@@ -94,6 +106,8 @@ def combine_exchange_rate_data(start_date, end_date):
                           Start date in 'YYYYMMDD' format.
         end_date (str): 종료 날짜 ('YYYYMMDD' 형식).
                         End date in 'YYYYMMDD' format.
+        calendar (str, optional): 네이버 데이터의 누락된 날짜를 채울 거래일 캘린더 이름입니다.
+                                  Trading calendar used to fill missing dates in the Naver data.
 
     Returns:
         pd.DataFrame: 결합된 환율 데이터가 포함된 데이터프레임.
@@ -102,7 +116,7 @@ def combine_exchange_rate_data(start_date, end_date):
     # 네이버 API 데이터 가져오기
     # Fetch data from Naver API
     data = fetch_usd_to_krw_data()
-    naver_df = create_exchange_rate_dataframe(data)
+    naver_df = create_exchange_rate_dataframe(data, calendar)
     naver_df.rename(columns={'closePrice': 'Close', 'highPrice': 'High', 'lowPrice': 'Low'}, inplace=True)
     naver_df['Open'] = naver_df['Close']  # Open 값을 Close로 설정
     naver_df = naver_df[['Open', 'High', 'Low', 'Close', 'localDate']]
@@ -111,7 +125,8 @@ def combine_exchange_rate_data(start_date, end_date):
     # Fetch data from yfinance
     start_dt = pd.to_datetime(start_date, format='%Y%m%d')
     end_dt = pd.to_datetime(end_date, format='%Y%m%d')
-    yf_df = yf.download("USDKRW=X", start=start_dt, end=end_dt)
+    with instrumentation.track('yfinance.download'):
+        yf_df = yf.download("USDKRW=X", start=start_dt, end=end_dt)
     yf_df = yf_df[['Open', 'High', 'Low', 'Close']]
 
     # 날짜 인덱스 설정
@@ -129,8 +144,12 @@ def combine_exchange_rate_data(start_date, end_date):
 
     # 누락된 값 보간 (선형 보간법 사용)
     # Interpolate missing values using linear interpolation
-    combined_df = combined_df.infer_objects(copy=False)  # 객체 타입을 적절한 타입으로 변환
-    combined_df = combined_df.interpolate(method='linear', axis=0)  # 보간 실행
+    # localDate(문자열)는 아래에서 인덱스로 다시 만들므로 가격 컬럼만 보간합니다 (pandas 3은 문자열 컬럼 보간 시 TypeError).
+    # Only the price columns are interpolated; localDate (str) is rebuilt from the index below
+    # (pandas 3 raises TypeError when interpolating a str column).
+    price_columns = ['Open', 'High', 'Low', 'Close']
+    combined_df[price_columns] = combined_df[price_columns].infer_objects(copy=False)  # 객체 타입을 적절한 타입으로 변환
+    combined_df[price_columns] = combined_df[price_columns].interpolate(method='linear', axis=0)  # 보간 실행
     #combined_df = combined_df.interpolate(method='linear')  # future warning (앞으로 object는 취급 안할수도 있음) 대응으로 위의 코드로 수정
 
     # 조회 기간에 맞게 필터링
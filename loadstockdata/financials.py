@@ -2,10 +2,11 @@ import requests
 import pandas as pd
 import json
 import re
+from httpclient import resilience
+from . import parsing
 
 
-
-def fetch_financial_data(item_code):
+def fetch_financial_data(item_code, compact=False):
     """
     특정 종목의 연간 재무요약정보를 가져와 데이터프레임으로 변환하는 함수입니다.
     Fetches annual financial summary information for a specific stock and converts it into a DataFrame.
@@ -13,6 +14,8 @@ def fetch_financial_data(item_code):
     Parameters:
         item_code (str): 종목 코드.
                          Stock item code.
+        compact (bool, optional): True이면 '2,796,048' 같은 문자열 값을 float64 숫자로 변환합니다.
+                                  If True, string values such as '2,796,048' are converted to float64 numbers.
 
     Returns:
         pd.DataFrame: 재무 데이터를 담고 있는 데이터프레임.
@@ -38,9 +41,9 @@ def fetch_financial_data(item_code):
         isKRX=False
 
 
-    response = requests.get(url)
+    response = resilience.get('naver.finance.annual', url)
     response.raise_for_status()
-    data = response.json()
+    data = parsing.loads(response.content)
 
     # 기간 정보 추출
     # Extract period information
@@ -64,6 +67,14 @@ def fetch_financial_data(item_code):
 
     df = pd.DataFrame(financial_data)
 
+    # 재무 값은 float32의 유효 자릿수를 넘을 수 있어 float64를 사용합니다.
+    # Financial values can exceed float32 precision, so float64 is used.
+    if compact:
+        for column in df.columns:
+            values = parsing.to_numeric(df[column].tolist(), float)
+            if values is not None:
+                df[column] = values
+
     if isKRX:
       return df[::-1]
     else:
@@ -4,6 +4,8 @@ import pandas as pd
 import numpy as np
 from scipy.interpolate import interp1d
 import yfinance as yf
+from httpclient import instrumentation, resilience
+from . import calendars, parsing
 
 def fetch_gold_data():
     """
@@ -21,11 +23,12 @@ def fetch_gold_data():
         'chartInfoType': 'futures',
         'scriptChartType': 'candleDay'
     }
-    response = requests.get(url, params=params)
+    response = resilience.get('naver.chart.pricesByPeriod', url, params=params)
     response.raise_for_status()
-    return json.loads(response.content)
+    return parsing.loads(response.content)
 
-def create_gold_dataframe(data):
+@instrumentation.timed()
+def create_gold_dataframe(data, calendar=None):
     """
     가져온 금 시세 데이터로부터 데이터프레임을 생성하고 누락된 날짜를 채웁니다.
     Creates a DataFrame from the fetched gold price data and fills missing dates.
@@ -33,6 +36,10 @@ def create_gold_dataframe(data):
     Parameters:
         data (dict): 금 시세 정보를 포함한 JSON 데이터.
                      JSON data containing gold price information.
+        calendar (str, optional): 누락된 날짜를 채울 거래일 캘린더 이름입니다 ('KRX', 'NYSE', 'NASDAQ', 'WEEKDAY').
+                                  지정하지 않으면 주말을 포함한 모든 날짜를 채웁니다.
+                                  Trading calendar used to fill missing dates ('KRX', 'NYSE', 'NASDAQ', 'WEEKDAY').
+                                  If omitted, every calendar day including weekends is filled.
 
     Returns:
         pd.DataFrame: 스무딩된 금 시세 데이터가 포함된 데이터프레임.
@@ -48,7 +55,11 @@ def create_gold_dataframe(data):
     df = df[['closePrice', 'highPrice', 'lowPrice', 'openPrice']]
 
     # 데이터의 첫 번째 날짜부터 마지막 날짜까지의 전체 날짜 범위 생성
-    full_date_range = pd.date_range(start=df.index.min(), end=df.index.max(), freq='D')
+    # 캘린더를 지정하면 거래일만 채우고, 실제로 받은 날짜는 그대로 유지합니다.
+    if calendar is None:
+        full_date_range = pd.date_range(start=df.index.min(), end=df.index.max(), freq='D')
+    else:
+        full_date_range = calendars.get_calendar(calendar).sessions(df.index.min(), df.index.max()).union(df.index)
     df = df.reindex(full_date_range)
 
     # 선형 보간법을 사용하여 누락된 값을 보간
@@ -59,7 +70,7 @@ def create_gold_dataframe(data):
 
     return df
 
-def combine_gold_data(start_date, end_date):
+def combine_gold_data(start_date, end_date, calendar=None):
     """
     네이버 API와 yfinance에서 가져온 금 시세 데이터를 결합하고, 조회 기간에 맞춰 데이터를 반환합니다.
     Combines gold price data from Naver API and yfinance, then returns the data for the specified date range.
@@ -69,6 +80,8 @@ def combine_gold_data(start_date, end_date):
                           Start date in 'YYYYMMDD' format.
         end_date (str): 종료 날짜 ('YYYYMMDD' 형식).
                         End date in 'YYYYMMDD' format.
+        calendar (str, optional): 네이버 데이터의 누락된 날짜를 채울 거래일 캘린더 이름입니다.
+                                  Trading calendar used to fill missing dates in the Naver data.
 
     Returns:
         pd.DataFrame: 결합된 금 시세 데이터가 포함된 데이터프레임.
@@ -76,14 +89,15 @@ def combine_gold_data(start_date, end_date):
     """
     # 네이버 API 데이터 가져오기
     data = fetch_gold_data()
-    naver_df = create_gold_dataframe(data)
+    naver_df = create_gold_dataframe(data, calendar)
     naver_df.rename(columns={'closePrice': 'Close', 'highPrice': 'High', 'lowPrice': 'Low', 'openPrice': 'Open'}, inplace=True)
     naver_df = naver_df[['Open', 'High', 'Low', 'Close', 'localDate']]
 
     # yfinance 데이터 가져오기
     start_dt = pd.to_datetime(start_date, format='%Y%m%d')
     end_dt = pd.to_datetime(end_date, format='%Y%m%d')
-    yf_df = yf.download("GC=F", start=start_dt, end=end_dt)
+    with instrumentation.track('yfinance.download'):
+        yf_df = yf.download("GC=F", start=start_dt, end=end_dt)
     yf_df = yf_df[['Open', 'High', 'Low', 'Close']]
 
     # 날짜 인덱스 설정 (tz-naive로 변환)
@@ -97,13 +111,19 @@ def combine_gold_data(start_date, end_date):
     combined_df = combined_df.loc[~combined_df.index.duplicated(keep='first')]
 
     # 누락된 값 보간 (선형 보간법 사용)
-    combined_df.interpolate(method='linear', inplace=True)
+    # localDate(문자열)는 아래에서 인덱스로 다시 만들므로 가격 컬럼만 보간합니다 (pandas 3은 문자열 컬럼 보간 시 TypeError).
+    # Only the price columns are interpolated; localDate (str) is rebuilt from the index below
+    # (pandas 3 raises TypeError when interpolating a str column).
+    price_columns = [col for col in combined_df.columns if col != 'localDate']
+    combined_df[price_columns] = combined_df[price_columns].interpolate(method='linear')
 
     # NaN 값을 가진 열을 업데이트: GC=F 데이터를 NaN 열에 할당
+    # (Copy-on-Write에서는 combined_df[col].fillna(..., inplace=True)가 원본에 반영되지 않으므로 다시 대입합니다)
+    # (Under Copy-on-Write, combined_df[col].fillna(..., inplace=True) does not reach the frame, so assign back)
     for col in ['Open', 'High', 'Low', 'Close']:
         gc_col = (col, 'GC=F')
         if gc_col in combined_df.columns:
-            combined_df[col].fillna(combined_df[gc_col], inplace=True)
+            combined_df[col] = combined_df[col].fillna(combined_df[gc_col])
     
     # GC=F 관련 컬럼 제거
     combined_df = combined_df.loc[:, ~combined_df.columns.to_series().astype(str).str.contains('GC=F')]
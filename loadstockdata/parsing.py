@@ -0,0 +1,225 @@
+# 응답 파싱 모듈
+# 빠른 JSON 디코더(orjson)가 설치되어 있으면 사용하고, 없으면 표준 json 모듈을 사용합니다.
+# compact=True이면 레코드 리스트를 컬럼별 타입 배열로 바로 변환해 메모리를 줄입니다.
+#  - 날짜(localDate): datetime64
+#  - 가격/비율: float32
+#  - 거래량: Int64 (결측값이 있어도 종목에 관계없이 같은 타입을 쓰도록 pandas nullable 정수)
+#  - 거래대금/시가총액: float64 (float32로는 유효 자릿수가 부족함)
+# Response parsing module.
+# Uses the fast JSON decoder (orjson) when installed, otherwise the standard json module.
+# With compact=True, record lists are built column by column straight into typed arrays.
+#  - dates (localDate): datetime64
+#  - prices/ratios: float32
+#  - volumes: Int64 (pandas nullable integer, so every symbol gets the same dtype even with missing values)
+#  - traded value/market cap: float64 (float32 lacks the significant digits)
+
+import json
+import re
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+DATE_COLUMNS = ('localDate',)
+
+# 문자열이어도 숫자로 변환할 컬럼 이름 패턴 (예: '71,000', '$225.00', '-0.53%')
+# Column name pattern converted to numbers even when sent as strings (e.g. '71,000', '$225.00', '-0.53%')
+_NUMERIC_NAME = re.compile(r'(price|ratio|rate|volume|value|sale|change|cap)$', re.IGNORECASE)
+_VOLUME_NAME = re.compile(r'volume$', re.IGNORECASE)
+_LARGE_NAME = re.compile(r'(value|cap)$', re.IGNORECASE)
+_NUMBER_JUNK = '$%+ '
+_MISSING = {'', '-', 'N/A', 'NA'}
+
+
+def loads(content):
+    """
+    JSON 응답 본문을 디코딩합니다. orjson이 있으면 orjson을 사용합니다.
+    Decodes a JSON response body, using orjson when available.
+
+    Parameters:
+        content (bytes or str): 응답 본문입니다.
+                                Response body.
+
+    Returns:
+        object: 디코딩된 JSON 객체입니다.
+                Decoded JSON object.
+
+    Raises:
+        ValueError: JSON 형식이 잘못된 경우 (json.JSONDecodeError 또는 그 하위 클래스).
+                    If the body is not valid JSON (json.JSONDecodeError or a subclass of it).
+    """
+    if _orjson is not None:
+        return _orjson.loads(content)
+    return json.loads(content)
+
+
+def _column_dtype(name):
+    if _VOLUME_NAME.search(name):
+        return np.int64
+    if _LARGE_NAME.search(name):
+        return np.float64
+    return np.float32
+
+
+def to_numeric(values, dtype=np.float32):
+    """
+    숫자 또는 숫자 문자열('71,000', '$225.00', '-0.53%')을 타입 배열로 변환합니다.
+    결측값('', '-', None)은 NaN이 되며, 정수 타입은 결측값 유무와 관계없이 항상 nullable 정수 배열(Int64 등)로 반환합니다.
+    Converts numbers or numeric strings ('71,000', '$225.00', '-0.53%') into a typed array.
+    Missing values ('', '-', None) become NaN; integer dtypes always return a nullable integer array
+    (Int64 etc.) whether or not values are missing, so the dtype never depends on the data.
+
+    Parameters:
+        values (sequence): 변환할 값입니다.
+                           Values to convert.
+        dtype (numpy dtype): 목표 타입입니다.
+                             Target dtype.
+
+    Returns:
+        numpy.ndarray, pandas.arrays.IntegerArray or None: 변환된 배열입니다. 숫자가 아닌 값이 있으면 None을 반환합니다.
+                                                            Converted array, or None if a non-numeric value is present.
+    """
+    try:
+        # 대부분의 차트 응답은 이미 숫자이므로 한 번에 변환합니다 (None은 NaN이 됨).
+        # Most chart responses are already numeric, so convert in one go (None becomes NaN).
+        array = np.array(values, dtype=np.float64)
+    except (ValueError, TypeError):
+        array = _parse_numbers(values)
+        if array is None:
+            return None
+
+    if np.issubdtype(dtype, np.integer):
+        missing = np.isnan(array)
+        return pd.arrays.IntegerArray(np.where(missing, 0, array).astype(dtype), missing)
+    return array.astype(dtype, copy=False)
+
+
+def _parse_numbers(values):
+    try:
+        cleaned = [value.replace(',', '').strip(_NUMBER_JUNK) if isinstance(value, str) else value for value in values]
+        return np.array(cleaned, dtype=np.float64)
+    except (ValueError, TypeError):
+        pass
+
+    # 결측값 표기('-', '')나 숫자가 아닌 값이 섞인 경우에만 값 단위로 확인합니다.
+    # Only check value by value when missing markers ('-', '') or non-numbers are mixed in.
+    converted = []
+    for value in cleaned:
+        if isinstance(value, str):
+            value = value.strip()
+            if value in _MISSING:
+                converted.append(np.nan)
+                continue
+        elif value is None:
+            converted.append(np.nan)
+            continue
+        elif not isinstance(value, (int, float)):
+            return None
+        try:
+            converted.append(float(value))
+        except ValueError:
+            return None
+    return np.array(converted, dtype=np.float64)
+
+
+def _compact_column(name, values):
+    if name in DATE_COLUMNS:
+        return pd.to_datetime(pd.Series(values, dtype=object), format='%Y%m%d').to_numpy()
+    if _NUMERIC_NAME.search(name):
+        array = to_numeric(values, _column_dtype(name))
+        if array is not None:
+            return array
+    return values
+
+
+def records_to_frame(records, compact=False):
+    """
+    딕셔너리 리스트(JSON 레코드)를 데이터프레임으로 변환합니다.
+    Converts a list of dictionaries (JSON records) into a DataFrame.
+
+    Parameters:
+        records (list): 레코드 리스트입니다.
+                        List of records.
+        compact (bool): True이면 컬럼별 타입 배열(날짜 datetime64, 가격 float32, 거래량 Int64)로 바로 만듭니다.
+                        False이면 기존과 같이 pd.DataFrame(records)을 사용합니다.
+                        If True, builds typed column arrays directly (datetime64 dates, float32 prices,
+                        Int64 volumes). If False, uses pd.DataFrame(records) as before.
+
+    Returns:
+        pd.DataFrame: 변환된 데이터프레임입니다.
+                      Converted DataFrame.
+    """
+    if not compact:
+        return pd.DataFrame(records)
+    if not records:
+        return pd.DataFrame()
+
+    names = list(records[0])
+    seen = set(names)
+    for record in records:
+        if len(record) != len(names) or record.keys() != seen:
+            for name in record:
+                if name not in seen:
+                    seen.add(name)
+                    names.append(name)
+
+    columns = {}
+    for name in names:
+        values = [record.get(name) for record in records]
+        columns[name] = _compact_column(name, values)
+    return pd.DataFrame(columns)
+
+
+def compact_frame(dataframe):
+    """
+    이미 만들어진 데이터프레임을 records_to_frame(compact=True)와 같은 규칙으로 축소합니다.
+    Downcasts an existing DataFrame with the same rules as records_to_frame(compact=True).
+
+    Parameters:
+        dataframe (pd.DataFrame): 원본 데이터프레임입니다.
+                                  Source DataFrame.
+
+    Returns:
+        pd.DataFrame: 타입이 축소된 새 데이터프레임입니다.
+                      New DataFrame with compact dtypes.
+    """
+    columns = {}
+    for name in dataframe.columns:
+        series = dataframe[name]
+        if name in DATE_COLUMNS and not pd.api.types.is_datetime64_any_dtype(series):
+            columns[name] = pd.to_datetime(series.astype(str), format='%Y%m%d').to_numpy()
+        elif isinstance(name, str) and _NUMERIC_NAME.search(name):
+            array = to_numeric(series.tolist(), _column_dtype(name))
+            columns[name] = series if array is None else array
+        else:
+            columns[name] = series
+    return pd.DataFrame(columns, index=dataframe.index)
+
+
+def memory_report(before, after):
+    """
+    두 데이터프레임의 메모리 사용량(문자열 포함)을 비교합니다.
+    Compares the memory usage (including strings) of two DataFrames.
+
+    Parameters:
+        before (pd.DataFrame): 변환 전 데이터프레임입니다.
+                               DataFrame before conversion.
+        after (pd.DataFrame): 변환 후 데이터프레임입니다.
+                              DataFrame after conversion.
+
+    Returns:
+        dict: before_bytes, after_bytes, saved_bytes, saved_ratio를 담은 딕셔너리입니다.
+              Dictionary with before_bytes, after_bytes, saved_bytes and saved_ratio.
+    """
+    before_bytes = int(before.memory_usage(deep=True).sum())
+    after_bytes = int(after.memory_usage(deep=True).sum())
+    return {
+        'before_bytes': before_bytes,
+        'after_bytes': after_bytes,
+        'saved_bytes': before_bytes - after_bytes,
+        'saved_ratio': (before_bytes - after_bytes) / before_bytes if before_bytes else 0.0,
+    }
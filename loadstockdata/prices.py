@@ -3,13 +3,15 @@ import pandas as pd
 import re
 import datetime
 from .compute import compute_rsi, compute_moving_average 
-from tenacity import retry, stop_after_attempt, wait_fixed
+from httpclient import resilience
+from . import calendars, parsing
 
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
-def retrieve_stock_data(symbol, start_date=None, end_date=None):
+def retrieve_stock_data(symbol, start_date=None, end_date=None, compact=False):
     """
     네이버 API를 통해 주식 데이터를 가져오는 내부 함수입니다.
+    통신 오류 재시도와 서킷 브레이커는 resilience 모듈의 정책을 따릅니다.
     Internal function to fetch stock data from Naver API.
+    Retries and circuit breaking follow the policy in the resilience module.
 
     Parameters:
         symbol (str): 종목 코드 또는 티커입니다.
@@ -18,6 +20,8 @@ def retrieve_stock_data(symbol, start_date=None, end_date=None):
                                     Start date in 'YYYYMMDD' format. Defaults to today.
         end_date (str, optional): 종료 날짜입니다. 형식은 'YYYYMMDD'입니다.
                                   End date in 'YYYYMMDD' format. Defaults to 30 days ago.
+        compact (bool, optional): True이면 localDate는 datetime64, 가격은 float32, 거래량은 Int64(nullable 정수)로 변환합니다.
+                                  If True, localDate becomes datetime64, prices float32 and volume Int64 (nullable integer).
 
     Returns:
         pandas.DataFrame: 주식 데이터가 담긴 데이터프레임입니다.
@@ -41,12 +45,12 @@ def retrieve_stock_data(symbol, start_date=None, end_date=None):
             url = f"https://api.stock.naver.com/chart/foreign/item/{symbol}/day?startDateTime={start_date}0000&endDateTime={end_date}0000"
 
         # 요청 보내기
-        response = requests.get(url)
+        response = resilience.get('naver.chart.day', url)
         response.raise_for_status()
 
         # 데이터 파싱
-        data = response.json()
-        dataframe = pd.DataFrame(data)
+        data = parsing.loads(response.content)
+        dataframe = parsing.records_to_frame(data, compact=compact)
 
         # 날짜 형식 변환 및 정렬
         
@@ -93,7 +97,7 @@ def get_stock_data_by_date_range(symbol, start_date, end_date, moving_avg_period
     # Calculate moving averages and add columns
     if moving_avg_periods:
         for period in moving_avg_periods:
-            dataframe[f'MA{period}'] = compute_moving_average(dataframe, period)
+            dataframe[f'MA{period}'] = compute_moving_average(dataframe, window_size=period)
 
     return dataframe
 
@@ -118,11 +122,12 @@ def get_recent_stock_data(symbol, num_days, moving_avg_periods=None):
         Exception: 통신 오류나 데이터 파싱 오류가 발생한 경우 예외를 발생시킵니다.
                    Raises an exception if a communication error or data parsing error occurs.
     """
-    # 오늘 날짜와 필요한 기간 계산
-    # Calculate today's date and required period
+    # 거래소 캘린더로 최근 N 거래일의 시작 날짜 계산 (캘린더가 없는 시장은 두 배의 기간)
+    # 오늘 장이 아직 집계되지 않았을 수 있으므로 한 거래일을 더 요청합니다.
+    # Compute the start of the last N sessions from the exchange calendar (twice the period for
+    # markets without a calendar). One extra session is requested because today's bar may not be published yet.
     today = datetime.date.today()
-    past_date = today - datetime.timedelta(days=num_days * 2)  # 여유를 두고 두 배의 기간을 가져옴
-    start_date = past_date.strftime("%Y%m%d")
+    start_date = calendars.lookback_start(symbol, today, num_days + 1).strftime("%Y%m%d")
     end_date = today.strftime("%Y%m%d")
 
     dataframe = retrieve_stock_data(symbol, start_date, end_date)
@@ -136,6 +141,6 @@ def get_recent_stock_data(symbol, num_days, moving_avg_periods=None):
     # Calculate moving averages and add columns
     if moving_avg_periods:
         for period in moving_avg_periods:
-            dataframe[f'MA{period}'] = compute_moving_average(dataframe, period)
+            dataframe[f'MA{period}'] = compute_moving_average(dataframe, window_size=period)
 
     return dataframe
@@ -0,0 +1,261 @@
+# 일봉 → 주봉/월봉/N거래일봉 변환 모듈
+# 이미 받아 둔 일봉 데이터로 주봉, 월봉, N거래일봉을 만들어 네트워크 없이 여러 시간 단위로 분석할 수 있게 합니다.
+# 여러 종목이 섞인 패널(symbol 컬럼)도 groupby 한 번으로 처리하며, 새 일봉을 추가할 때는 마지막(진행 중인) 봉만 갱신합니다.
+# 결과는 네이버 일봉과 같은 컬럼 이름을 사용하므로 compute 모듈의 지표 함수를 그대로 적용할 수 있습니다.
+# Daily → weekly/monthly/N-session bar module.
+# Derives weekly, monthly and N-session bars from daily bars that are already on hand, so other
+# timeframes can be analysed without network access. A panel of several symbols (symbol column)
+# is handled in a single groupby, and appending a new daily bar only updates the last (partial) bar.
+# Results keep the Naver daily column names, so the compute module's indicators apply unchanged.
+
+import numpy as np
+import pandas as pd
+
+# 컬럼별 집계 방법 / Aggregation per column
+OHLCV_AGGREGATION = {
+    'openPrice': 'first',
+    'highPrice': 'max',
+    'lowPrice': 'min',
+    'closePrice': 'last',
+    'accumulatedTradingVolume': 'sum',
+}
+
+
+def _dates(series):
+    """
+    localDate 컬럼('YYYYMMDD' 문자열 또는 datetime)을 DatetimeIndex로 변환합니다.
+    Converts the localDate column ('YYYYMMDD' strings or datetimes) to a DatetimeIndex.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return pd.DatetimeIndex(series)
+    return pd.DatetimeIndex(pd.to_datetime(series.astype(str), format='%Y%m%d'))
+
+
+def _period_keys(dates, rule):
+    """
+    날짜별 주/월 구간 번호를 계산합니다. 같은 구간의 날짜는 같은 번호를 가집니다.
+    Computes the week/month bucket number of each date. Dates in the same bucket share a number.
+    """
+    if rule == 'W':
+        # 1970-01-01은 목요일이므로 3일을 더해 월요일에 주가 바뀌도록 합니다.
+        # 1970-01-01 was a Thursday; adding 3 days makes weeks start on Monday.
+        days = dates.values.astype('datetime64[D]').astype(np.int64)
+        return (days + 3) // 7
+    if rule == 'M':
+        return dates.year.values.astype(np.int64) * 12 + dates.month.values - 1
+    raise ValueError(f"Unsupported rule: {rule} (지원하지 않는 rule입니다: {rule}). Use 'W', 'M' or an int.")
+
+
+def _aggregation(columns, symbol_column):
+    agg = {}
+    for column in columns:
+        if column == symbol_column:
+            continue
+        agg[column] = OHLCV_AGGREGATION.get(column, 'last')
+    return agg
+
+
+def resample_ohlcv(dataframe, rule='W', symbol_column='symbol', date_column='localDate'):
+    """
+    일봉 데이터로 주봉, 월봉 또는 N거래일봉을 만듭니다.
+    Builds weekly, monthly or N-session bars from daily bars.
+
+    시가는 첫 값, 고가는 최댓값, 저가는 최솟값, 종가는 마지막 값, 거래량은 합계를 사용하며,
+    그 밖의 컬럼은 마지막 값을 사용합니다. localDate는 봉의 마지막 거래일이고,
+    sessionCount는 봉에 포함된 거래일 수입니다.
+    Open is the first value, high the max, low the min, close the last value and volume the sum;
+    other columns take the last value. localDate is the bar's last session and sessionCount
+    is the number of sessions in the bar.
+
+    Parameters:
+        dataframe (pandas.DataFrame): 일봉 데이터프레임입니다. symbol 컬럼이 있으면 종목별로 나눠 한 번에 처리합니다.
+                                      Daily bars. When a symbol column exists, all symbols are processed in one pass.
+        rule (str or int): 'W'(주봉, 월요일 시작), 'M'(월봉) 또는 정수 N(N거래일봉)입니다.
+                           'W' (weekly, weeks start on Monday), 'M' (monthly) or an int N (N-session bars).
+        symbol_column (str): 종목 컬럼 이름입니다.
+                             Symbol column name.
+        date_column (str): 날짜 컬럼 이름입니다.
+                           Date column name.
+
+    Returns:
+        pandas.DataFrame: 봉 데이터프레임입니다. 날짜 컬럼 타입은 입력과 같습니다.
+                          Bar DataFrame. The date column keeps the input type.
+    """
+    has_symbol = symbol_column in dataframe.columns
+    sort_columns = [symbol_column, date_column] if has_symbol else [date_column]
+    daily = dataframe.sort_values(sort_columns, kind='stable').reset_index(drop=True)
+    dates = _dates(daily[date_column])
+
+    if isinstance(rule, (int, np.integer)):
+        if rule < 1:
+            raise ValueError(f"N must be positive: {rule} (N은 1 이상이어야 합니다: {rule})")
+        position = daily.groupby(symbol_column).cumcount() if has_symbol else pd.Series(np.arange(len(daily)))
+        keys = position.to_numpy() // rule
+    else:
+        keys = _period_keys(dates, rule)
+
+    group_keys = [daily[symbol_column].to_numpy(), keys] if has_symbol else [keys]
+    named = {symbol_column: (symbol_column, 'first')} if has_symbol else {}
+    for column, how in _aggregation(daily.columns, symbol_column).items():
+        named[column] = (column, how)
+    named['sessionCount'] = (date_column, 'size')
+    return daily.groupby(group_keys, sort=False).agg(**named).reset_index(drop=True)
+
+
+def _same_bar(last_dates, new_dates, last_counts, rule):
+    if isinstance(rule, (int, np.integer)):
+        return last_counts < rule
+    return _period_keys(last_dates, rule) == _period_keys(new_dates, rule)
+
+
+def _stale_rows(bars, daily, has_symbol, symbol_column, date_column):
+    """
+    기존 봉의 마지막 날짜보다 새롭지 않은 일봉(같은 날짜 중복 포함)을 표시하는 마스크를 반환합니다.
+    Returns a mask of daily rows that are not newer than the last bar's date, including repeated dates.
+    """
+    new_dates = _dates(daily[date_column]).values
+    if has_symbol:
+        last = pd.Series(_dates(bars[date_column]).values, index=bars[symbol_column].to_numpy()).groupby(level=0).max()
+        last_dates = last.reindex(daily[symbol_column].to_numpy()).to_numpy()
+        repeated = daily.duplicated([symbol_column, date_column]).to_numpy()
+    else:
+        last_dates = _dates(bars[date_column]).values.max() if len(bars) else np.datetime64('NaT')
+        repeated = daily.duplicated([date_column]).to_numpy()
+    # NaT(처음 보는 종목)와의 비교는 False입니다. / Comparisons with NaT (unseen symbols) are False.
+    return (new_dates <= last_dates) | repeated
+
+
+def update_bars(bars, daily, rule='W', symbol_column='symbol', date_column='localDate', stale='raise', inplace=False):
+    """
+    새 일봉을 기존 봉에 반영합니다. 같은 구간이면 마지막(진행 중인) 봉만 갱신하고,
+    새 구간이면 봉을 추가합니다. 이전 봉은 다시 계산하지 않습니다.
+    Applies new daily bars to existing bars. If a day falls in the current bucket, only the last
+    (partial) bar is updated; otherwise a new bar is appended. Earlier bars are never recomputed.
+
+    봉에는 하루치 기여분이 따로 남지 않으므로, 이미 반영된 날짜(마지막 봉의 날짜 이하)를 다시 넣으면
+    거래량과 sessionCount가 두 번 더해집니다. 이런 일봉은 stale에 따라 오류를 내거나 건너뜁니다.
+    장중 값이 바뀐 당일 봉을 반영하려면 해당 구간을 resample_ohlcv로 다시 만드세요.
+    Bars do not keep each day's contribution, so re-sending a day that is already applied (on or before
+    the last bar's date) would add its volume and sessionCount twice. Such rows raise or are skipped
+    according to `stale`. To apply a refreshed intraday bar, rebuild that bucket with resample_ohlcv.
+
+    Parameters:
+        bars (pandas.DataFrame): resample_ohlcv로 만든 봉 데이터프레임입니다.
+                                 Bars built by resample_ohlcv.
+        daily (pandas.DataFrame): 추가할 일봉 데이터프레임입니다. 기존 봉의 마지막 날짜 이후여야 합니다.
+                                  New daily bars, all after the last date already in `bars`.
+        rule (str or int): resample_ohlcv에 사용한 것과 같은 rule입니다.
+                           The same rule used for resample_ohlcv.
+        symbol_column (str): 종목 컬럼 이름입니다.
+                             Symbol column name.
+        date_column (str): 날짜 컬럼 이름입니다.
+                           Date column name.
+        stale (str): 마지막 봉보다 새롭지 않은 일봉 처리 방법입니다. 'raise'(기본값, ValueError) 또는
+                     'skip'(무시, 같은 데이터로 다시 실행할 때 사용)입니다.
+                     How to handle rows not newer than the last bar: 'raise' (default, ValueError) or
+                     'skip' (ignore them, for idempotent reruns over the same data).
+        inplace (bool): True이면 bars의 마지막 봉을 제자리에서 갱신해 복사 비용을 줄입니다.
+                        기본값 False는 호출자의 bars를 바꾸지 않습니다.
+                        When True, the last bars are updated inside `bars` to avoid a copy.
+                        The default False leaves the caller's `bars` untouched.
+
+    Returns:
+        pandas.DataFrame: 갱신된 봉 데이터프레임입니다. 새 봉은 끝에 추가됩니다. inplace=True여도
+                          새 봉이 추가되면 다른 객체가 반환되므로 항상 반환값을 사용하세요.
+                          Updated bars, with new bars appended at the end. Even with inplace=True a new
+                          object is returned when bars are appended, so always use the return value.
+
+    Raises:
+        ValueError: stale='raise'이고 마지막 봉보다 새롭지 않은 일봉이 있는 경우
+                    If stale='raise' and a row is not newer than the last bar
+    """
+    if stale not in ('raise', 'skip'):
+        raise ValueError(f"Unsupported stale option: {stale} (지원하지 않는 stale 옵션입니다: {stale}). Use 'raise' or 'skip'.")
+    has_symbol = symbol_column in bars.columns
+    sort_columns = [symbol_column, date_column] if has_symbol else [date_column]
+    daily = daily.sort_values(sort_columns, kind='stable')
+    # 어떤 봉도 바꾸기 전에 검사해 inplace=True에서도 오류 시 bars가 반쯤 갱신되지 않게 합니다.
+    # Check before touching any bar so that an error never leaves `bars` half-updated, even in place.
+    stale_rows = _stale_rows(bars, daily, has_symbol, symbol_column, date_column)
+    if stale_rows.any():
+        if stale == 'raise':
+            found = daily[stale_rows]
+            found = found[symbol_column].astype(str) + ' ' + found[date_column].astype(str) if has_symbol else found[date_column].astype(str)
+            found = ', '.join(found.head(5))
+            raise ValueError(f"Daily rows are not newer than the last bar: {found} "
+                             f"(마지막 봉보다 새롭지 않은 일봉입니다: {found}). Rebuild the bucket with resample_ohlcv or pass stale='skip'.")
+        daily = daily[~stale_rows]
+    if not inplace:
+        bars = bars.copy()
+    # 종목별 n번째 새 일봉을 한 단계로 묶어 단계마다 벡터 연산으로 처리합니다.
+    # Group the n-th new day of every symbol into one step and process each step vectorized.
+    steps = daily.groupby(symbol_column).cumcount() if has_symbol else pd.Series(np.arange(len(daily)), index=daily.index)
+    agg = _aggregation(bars.columns.drop('sessionCount'), symbol_column)
+
+    for step in range(int(steps.max()) + 1 if len(steps) else 0):
+        rows = daily[steps.to_numpy() == step]
+        if has_symbol:
+            last_index = bars.groupby(symbol_column, sort=False).tail(1)
+            last_index = pd.Series(last_index.index, index=last_index[symbol_column].to_numpy())
+            matched = last_index.reindex(rows[symbol_column].to_numpy())
+        else:
+            matched = pd.Series([bars.index[-1]] * len(rows) if len(bars) else [np.nan] * len(rows))
+
+        target = matched.to_numpy()
+        exists = ~pd.isna(target)
+        merge = np.zeros(len(rows), dtype=bool)
+        if exists.any():
+            existing = target[exists].astype(np.int64)
+            merge[exists] = _same_bar(_dates(bars.loc[existing, date_column]), _dates(rows.loc[rows.index[exists], date_column]),
+                                      bars.loc[existing, 'sessionCount'].to_numpy(), rule)
+
+        if merge.any():
+            index = target[merge].astype(np.int64)
+            new = rows[merge]
+            for column, how in agg.items():
+                if column not in new.columns:
+                    continue
+                values = new[column].to_numpy()
+                if how == 'max':
+                    values = np.maximum(bars.loc[index, column].to_numpy(), values)
+                elif how == 'min':
+                    values = np.minimum(bars.loc[index, column].to_numpy(), values)
+                elif how == 'sum':
+                    values = bars.loc[index, column].to_numpy() + values
+                elif how == 'first':
+                    continue
+                bars.loc[index, column] = values
+            bars.loc[index, 'sessionCount'] = bars.loc[index, 'sessionCount'].to_numpy() + 1
+
+        if (~merge).any():
+            new = rows[~merge].copy()
+            new['sessionCount'] = 1
+            new = new[[column for column in bars.columns if column in new.columns]]
+            bars = pd.concat([bars, new], ignore_index=True)
+
+    return bars
+
+
+def apply_by_symbol(bars, func, symbol_column='symbol', **kwargs):
+    """
+    종목별로 지표 함수를 적용하고 원래 행 순서에 맞춘 결과를 반환합니다.
+    Applies an indicator function per symbol and returns results aligned with the original rows.
+
+    Parameters:
+        bars (pandas.DataFrame): 일봉 또는 resample_ohlcv 결과입니다.
+                                 Daily bars or a resample_ohlcv result.
+        func (callable): compute 모듈의 지표 함수입니다. 예: compute_rsi
+                         An indicator function from the compute module. e.g., compute_rsi
+        symbol_column (str): 종목 컬럼 이름입니다.
+                             Symbol column name.
+        **kwargs: func에 그대로 전달됩니다.
+                  Passed through to func.
+
+    Returns:
+        pandas.Series or pandas.DataFrame: bars와 같은 인덱스를 가진 지표 값입니다.
+                                           Indicator values indexed like `bars`.
+    """
+    if symbol_column not in bars.columns:
+        return func(bars, **kwargs)
+    parts = [func(group, **kwargs) for _, group in bars.groupby(symbol_column, sort=False)]
+    return pd.concat(parts).reindex(bars.index)
@@ -0,0 +1,646 @@
+# 장 마감 후 종목 스캔 작업
+# 데이터 수집 → 지표 계산 → 저장 → 알림 단계를 크기가 제한된 큐로 연결해 동시에 실행합니다.
+#  - 수집: 스레드 풀 (네트워크 대기)
+#  - 지표 계산: 프로세스 풀 (CPU 작업, RSI/이동평균)
+#  - 저장: SQLite에 일괄(batch) 기록, 같은 트랜잭션에서 체크포인트 기록
+#  - 알림: 텔레그램 (토큰이 없으면 표준 출력)
+# --shard i/N으로 종목을 여러 장비에 결정적으로 나누고(crc32(symbol) % N == i),
+# 중단된 실행은 체크포인트를 보고 이미 끝난 종목을 건너뜁니다.
+# End-of-day symbol scan job.
+# Runs fetch → compute → store → alert as concurrent stages joined by bounded queues.
+#  - fetch: thread pool (network bound)
+#  - compute: process pool (CPU bound, RSI/moving averages)
+#  - store: batched SQLite writes, with the checkpoint written in the same transaction
+#  - alert: Telegram (standard output when no token is given)
+# --shard i/N splits the universe deterministically across machines (crc32(symbol) % N == i),
+# and an interrupted run resumes from the checkpoint, skipping symbols that already finished.
+#
+# 사용법 / Usage:
+#   python -m loadstockdata.scan --symbols 005930,000660,TSLA.O
+#   python -m loadstockdata.scan --symbols-file kospi.txt --shard 0/4 --db scan.db
+#   NSTOCK_TELEGRAM_TOKEN=... NSTOCK_TELEGRAM_CHAT_ID=... python -m loadstockdata.scan --symbols-file kospi.txt
+
+import argparse
+import concurrent.futures
+import contextvars
+import datetime
+import multiprocessing
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+
+import pandas as pd
+
+from httpclient import instrumentation, resilience
+
+from . import calendars
+from .compute import compute_rsi, compute_moving_average
+from .prices import retrieve_stock_data
+
+# 단계 종료 표시 / End-of-stage marker
+_DONE = object()
+
+# 큐 대기 중 중단 신호를 확인하는 간격(초) / Seconds between abort checks while waiting on a queue
+_POLL_INTERVAL = 0.1
+
+
+def parse_shard(text):
+    """
+    'i/N' 형식의 샤드 지정을 (i, N)으로 변환합니다.
+    Parses an 'i/N' shard spec into (i, N).
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 0 <= i < N이 아닌 경우.
+                    If the format is invalid or 0 <= i < N does not hold.
+    """
+    try:
+        index, count = (int(part) for part in text.split('/'))
+    except ValueError:
+        raise ValueError(f"Invalid shard: {text} (샤드 형식이 잘못되었습니다: {text}). Use i/N, e.g. 0/4.")
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard: {text} (샤드 번호는 0 이상 N 미만이어야 합니다: {text})")
+    return index, count
+
+
+def in_shard(symbol, index, count):
+    """
+    종목이 샤드 i/N에 속하는지 확인합니다. crc32를 사용하므로 장비와 실행에 관계없이 결과가 같습니다.
+    Checks whether a symbol belongs to shard i/N. crc32 is used, so the result is the same on every
+    machine and every run (unlike the built-in hash, which is salted per process).
+    """
+    return zlib.crc32(symbol.encode('utf-8')) % count == index
+
+
+def load_symbols(symbols=None, symbols_file=None):
+    """
+    쉼표로 구분한 문자열 또는 파일(한 줄에 한 종목, '#' 이후는 주석)에서 종목 목록을 읽습니다.
+    Reads the symbol list from a comma-separated string or a file (one symbol per line, '#' starts a comment).
+
+    Returns:
+        list: 입력 순서를 유지하고 중복을 제거한 종목 리스트입니다.
+              Symbols in input order with duplicates removed.
+    """
+    items = []
+    if symbols:
+        items.extend(symbols.split(','))
+    if symbols_file:
+        with open(symbols_file, encoding='utf-8') as f:
+            items.extend(line.split('#', 1)[0] for line in f)
+    return list(dict.fromkeys(item.strip() for item in items if item.strip()))
+
+
+class Checkpoint:
+    """
+    SQLite에 스캔 결과와 진행 상태를 저장합니다. 실행 중에는 저장 단계 스레드만 사용합니다.
+    Stores scan results and progress in SQLite. Only the store-stage thread uses it during a run.
+
+    테이블 / Tables:
+        scan_progress(run_id, symbol, status, error, updated_at): 종목별 진행 상태 ('done' 또는 'failed')
+                                                                   Per-symbol progress ('done' or 'failed')
+        scan_results(run_id, symbol, local_date, indicator, value): 종목별 마지막 거래일 지표 값
+                                                                     Indicator values on each symbol's last session
+    """
+
+    def __init__(self, path):
+        # 시작 전 확인은 메인 스레드에서, 기록은 저장 단계 스레드에서 하므로 스레드 검사를 끕니다.
+        # Progress is read on the main thread before the run and written from the store thread,
+        # never concurrently, so the same-thread check is disabled.
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS scan_progress (
+                run_id TEXT NOT NULL,
+                symbol TEXT NOT NULL,
+                status TEXT NOT NULL,
+                error TEXT,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (run_id, symbol)
+            );
+            CREATE TABLE IF NOT EXISTS scan_results (
+                run_id TEXT NOT NULL,
+                symbol TEXT NOT NULL,
+                local_date TEXT NOT NULL,
+                indicator TEXT NOT NULL,
+                value REAL,
+                PRIMARY KEY (run_id, symbol, indicator)
+            );
+        ''')
+
+    def finished(self, run_id):
+        """
+        이 실행에서 이미 끝난('done') 종목 집합을 반환합니다. 실패한 종목은 다시 처리합니다.
+        Returns the symbols already finished ('done') in this run. Failed symbols are retried.
+        """
+        rows = self.connection.execute(
+            "SELECT symbol FROM scan_progress WHERE run_id = ? AND status = 'done'", (run_id,))
+        return {row[0] for row in rows}
+
+    def write(self, run_id, outcomes):
+        """
+        결과 묶음과 진행 상태를 한 트랜잭션으로 기록합니다. 중간에 중단되어도 결과와 체크포인트가 어긋나지 않습니다.
+        Writes a batch of results and their progress in one transaction, so an interruption never
+        leaves results and checkpoint out of step.
+        """
+        now = datetime.datetime.now().isoformat(timespec='seconds')
+        results = []
+        progress = []
+        for outcome in outcomes:
+            if outcome['error'] is None:
+                results.extend((run_id, outcome['symbol'], outcome['localDate'], name, value)
+                               for name, value in outcome['indicators'].items())
+                progress.append((run_id, outcome['symbol'], 'done', None, now))
+            else:
+                progress.append((run_id, outcome['symbol'], 'failed', outcome['error'], now))
+
+        with self.connection:
+            self.connection.executemany('INSERT OR REPLACE INTO scan_results VALUES (?, ?, ?, ?, ?)', results)
+            self.connection.executemany('INSERT OR REPLACE INTO scan_progress VALUES (?, ?, ?, ?, ?)', progress)
+
+    def close(self):
+        self.connection.close()
+
+
+def pending_symbols(symbols, checkpoint, run_id):
+    """
+    체크포인트에서 이 실행에 이미 끝난 종목을 빼고 남은 종목을 반환합니다. 실패한 종목은 남겨 다시 처리합니다.
+    Returns the symbols not yet finished in this run according to the checkpoint. Failed symbols stay and are retried.
+    """
+    finished = checkpoint.finished(run_id)
+    remaining = []
+    for symbol in symbols:
+        # 체크포인트 적중(이미 끝난 종목)은 네트워크 요청 없이 건너뜁니다.
+        # A checkpoint hit (already finished) is skipped without any network request.
+        hit = symbol in finished
+        instrumentation.record_cache('scan.checkpoint', hit)
+        if not hit:
+            remaining.append(symbol)
+    return remaining
+
+
+def compute_indicators(symbol, dataframe, ma_periods, rsi_period):
+    """
+    프로세스 풀에서 실행되는 지표 계산 함수입니다. 마지막 거래일의 종가, RSI, 이동평균을 반환합니다.
+    Indicator step run in the process pool. Returns the close, RSI and moving averages on the last session.
+
+    Returns:
+        dict: symbol, localDate, indicators, error 키를 가진 딕셔너리입니다.
+              Dictionary with symbol, localDate, indicators and error keys.
+    """
+    if dataframe.empty:
+        return {'symbol': symbol, 'localDate': None, 'indicators': {}, 'error': 'no data (데이터가 없습니다)'}
+
+    indicators = {
+        'closePrice': dataframe['closePrice'].iloc[-1],
+        f'RSI{rsi_period}': compute_rsi(dataframe, period=rsi_period).iloc[-1],
+    }
+    for period in ma_periods:
+        indicators[f'MA{period}'] = compute_moving_average(dataframe, window_size=period).iloc[-1]
+
+    return {
+        'symbol': symbol,
+        'localDate': str(dataframe['localDate'].iloc[-1]),
+        'indicators': {name: None if pd.isna(value) else float(value) for name, value in indicators.items()},
+        'error': None,
+    }
+
+
+def _init_worker(instrumented):
+    # forkserver/spawn 작업 프로세스는 부모의 enable() 상태를 물려받지 않습니다.
+    # forkserver/spawn workers do not inherit the parent's enable() state.
+    if instrumented:
+        instrumentation.enable()
+
+
+def _compute_in_worker(symbol, dataframe, ma_periods, rsi_period):
+    """
+    작업 프로세스에서 compute_indicators를 실행하고, 계측 중이면 이 프로세스의 연산 시간을 결과에 담아 돌려줍니다.
+    Runs compute_indicators in a worker process and, when instrumented, returns the process's
+    compute timings with the outcome so the parent can merge them.
+    """
+    outcome = compute_indicators(symbol, dataframe, ma_periods, rsi_period)
+    if instrumentation.is_enabled():
+        outcome['computeMetrics'] = instrumentation.drain_compute()
+    return outcome
+
+
+def _failure(symbol, error):
+    return {'symbol': symbol, 'localDate': None, 'indicators': {}, 'error': f'{type(error).__name__}: {error}'}
+
+
+def _alert_text(outcome, rsi_name, rsi_low, rsi_high):
+    """
+    알림 조건(RSI가 rsi_low 이하 또는 rsi_high 이상)을 만족하면 메시지를, 아니면 None을 반환합니다.
+    Returns the alert message when RSI is at or below rsi_low or at or above rsi_high, otherwise None.
+    """
+    rsi = outcome['indicators'].get(rsi_name)
+    if rsi is None or rsi_low < rsi < rsi_high:
+        return None
+    state = '과매도 / oversold' if rsi <= rsi_low else '과매수 / overbought'
+    close = outcome['indicators'].get('closePrice')
+    return f"[{outcome['symbol']}] {outcome['localDate']} {rsi_name}={rsi:.1f} ({state}), close={close}"
+
+
+class ScanPipeline:
+    """
+    수집 → 지표 계산 → 저장 → 알림 단계를 제한된 큐로 연결한 파이프라인입니다.
+    큐가 가득 차면 앞 단계가 기다리므로(backpressure) 메모리 사용량이 종목 수와 관계없이 일정합니다.
+    Pipeline joining the fetch → compute → store → alert stages with bounded queues.
+    A full queue blocks the stage before it (backpressure), so memory stays flat regardless of
+    the number of symbols.
+
+    Parameters:
+        symbols (list): 처리할 종목 리스트입니다 (샤드와 체크포인트를 적용한 뒤).
+                        Symbols to process (after shard and checkpoint filtering).
+        checkpoint (Checkpoint): 결과와 진행 상태 저장소입니다.
+                                 Result and progress store.
+        run_id (str): 체크포인트를 구분하는 실행 ID입니다.
+                      Run ID that keys the checkpoint.
+        end_date (datetime.date): 기준 날짜입니다.
+                                  Reference date.
+        lookback (int): 종목별로 가져올 거래일 수입니다.
+                        Sessions to fetch per symbol.
+        ma_periods (list): 이동평균 기간 리스트입니다.
+                           Moving-average periods.
+        rsi_period (int): RSI 기간입니다.
+                          RSI period.
+        rsi_low, rsi_high (float): 알림 기준 RSI입니다.
+                                   RSI alert thresholds.
+        fetch_workers (int): 수집 스레드 수입니다.
+                             Number of fetch threads.
+        compute_workers (int): 지표 계산 프로세스 수입니다. 0이면 별도 프로세스 없이 계산합니다.
+                               Number of compute processes. 0 computes in-process.
+        queue_size (int): 단계 사이 큐의 최대 크기입니다.
+                          Maximum size of each inter-stage queue.
+        batch_size (int): 한 번에 기록할 결과 수입니다.
+                          Results per storage write.
+        flush_interval (float): 묶음이 덜 찼어도 기록하는 최대 대기 시간(초)입니다.
+                                Maximum seconds a partial batch waits before being written.
+        notify (callable): 알림 메시지를 받아 전송하는 함수입니다.
+                           Function that delivers an alert message.
+    """
+
+    def __init__(self, symbols, checkpoint, run_id, end_date, lookback=200, ma_periods=(20, 60), rsi_period=14,
+                 rsi_low=30, rsi_high=70, fetch_workers=8, compute_workers=None, queue_size=64, batch_size=50,
+                 flush_interval=1.0, notify=print):
+        self.symbols = symbols
+        self.checkpoint = checkpoint
+        self.run_id = run_id
+        self.end_date = end_date
+        self.lookback = lookback
+        self.ma_periods = tuple(ma_periods)
+        self.rsi_period = rsi_period
+        self.rsi_low = rsi_low
+        self.rsi_high = rsi_high
+        self.fetch_workers = fetch_workers
+        self.compute_workers = os.cpu_count() if compute_workers is None else compute_workers
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.notify = notify
+
+        self.compute_queue = queue.Queue(maxsize=queue_size)
+        self.store_queue = queue.Queue(maxsize=queue_size)
+        self.alert_queue = queue.Queue(maxsize=queue_size)
+        self.stats = {'fetched': 0, 'done': 0, 'failed': 0, 'alerts': 0}
+        self._stats_lock = threading.Lock()
+        self._error = None
+        # 한 단계가 실패하면 run()이 설정합니다. 큐에서 기다리는 모든 스레드가 이를 보고 멈춥니다.
+        # Set by run() when a stage fails; every thread waiting on a queue checks it and stops.
+        self._abort = threading.Event()
+
+    def _count(self, name, amount=1):
+        with self._stats_lock:
+            self.stats[name] += amount
+
+    def _stage(self, target, *args):
+        try:
+            target(*args)
+        except BaseException as e:
+            self._error = e
+
+    def _put(self, target, item):
+        """
+        큐에 항목을 넣습니다. 큐가 가득 차면 기다리되, 중단되면 버리고 False를 반환합니다.
+        Puts an item on a queue, waiting while it is full; returns False and drops the item once aborted.
+        """
+        while not self._abort.is_set():
+            try:
+                target.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _get(self, source):
+        """
+        큐에서 항목을 꺼냅니다. 중단되면 _DONE을 반환해 단계가 끝나도록 합니다.
+        Takes an item from a queue; returns _DONE once aborted so the stage winds down.
+        """
+        while not self._abort.is_set():
+            try:
+                return source.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                pass
+        return _DONE
+
+    # -- 수집 / fetch -------------------------------------------------------
+
+    def _fetch(self, symbol):
+        start_date = calendars.lookback_start(symbol, self.end_date, self.lookback).strftime('%Y%m%d')
+        return retrieve_stock_data(symbol, start_date, self.end_date.strftime('%Y%m%d'))
+
+    def _fetch_stage(self):
+        def fetch_one(symbol):
+            try:
+                item = (symbol, self._fetch(symbol))
+                self._count('fetched')
+            except Exception as e:
+                item = (symbol, e)
+            # 계산 큐가 가득 차면 여기서 기다립니다 (backpressure).
+            # Blocks here while the compute queue is full (backpressure).
+            self._put(self.compute_queue, item)
+
+        # 풀 작업 스레드는 인터프리터 종료 시 join되므로, 중단되면 남은 작업을 취소해 종료를 막지 않게 합니다.
+        # Pool workers are joined at interpreter exit, so on abort queued work is cancelled to let the process exit.
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.fetch_workers)
+        try:
+            # 제출도 큐 크기만큼만 앞서 나가도록 제한합니다.
+            # Submission is also kept at most queue_size ahead.
+            pending = set()
+            for symbol in self.symbols:
+                while len(pending) >= self.queue_size and not self._abort.is_set():
+                    _, pending = concurrent.futures.wait(pending, timeout=_POLL_INTERVAL,
+                                                         return_when=concurrent.futures.FIRST_COMPLETED)
+                if self._abort.is_set():
+                    break
+                # 재시도 예산(contextvar)이 풀 스레드에도 적용되도록 현재 컨텍스트의 복사본에서 실행합니다.
+                # Run in a copy of the current context so the retry budget (a contextvar) reaches pool threads.
+                pending.add(executor.submit(contextvars.copy_context().run, fetch_one, symbol))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=self._abort.is_set())
+        self._put(self.compute_queue, _DONE)
+
+    # -- 지표 계산 / compute -------------------------------------------------
+
+    def _compute_stage(self, executor):
+        if executor is None:
+            while True:
+                item = self._get(self.compute_queue)
+                if item is _DONE:
+                    break
+                symbol, data = item
+                if isinstance(data, Exception):
+                    outcome = _failure(symbol, data)
+                else:
+                    try:
+                        outcome = compute_indicators(symbol, data, self.ma_periods, self.rsi_period)
+                    except Exception as e:
+                        outcome = _failure(symbol, e)
+                self._put(self.store_queue, outcome)
+            self._put(self.store_queue, _DONE)
+            return
+
+        # 완료 콜백은 프로세스 풀의 관리 스레드에서 실행되므로 막히면 안 됩니다. 콜백은 크기 제한이 없는
+        # finished 큐에 넣기만 하고, 저장 큐로 옮기는 일(backpressure)은 이 스레드가 맡습니다.
+        # 프로세스 풀에 동시에 맡기는 작업 수는 queue_size로 제한하므로 finished 큐도 그 이상 자라지 않습니다.
+        # Done-callbacks run on the process pool's manager thread and must never block, so they only
+        # append to the unbounded `finished` queue; this thread moves results to the store queue
+        # (backpressure). At most queue_size tasks are in the pool, which also bounds `finished`.
+        finished = queue.SimpleQueue()
+        in_flight = 0
+        inputs_done = False
+        while not (inputs_done and in_flight == 0) and not self._abort.is_set():
+            if not inputs_done and in_flight < self.queue_size:
+                # 결과를 기다리는 작업이 있으면 짧게만 기다려 결과 전달이 늦어지지 않게 합니다.
+                # With results pending, wait only briefly so forwarding them is not delayed.
+                try:
+                    item = self.compute_queue.get(timeout=0.01 if in_flight else _POLL_INTERVAL)
+                except queue.Empty:
+                    item = None
+                if item is _DONE:
+                    inputs_done = True
+                elif item is not None:
+                    symbol, data = item
+                    if isinstance(data, Exception):
+                        self._put(self.store_queue, _failure(symbol, data))
+                    else:
+                        future = executor.submit(_compute_in_worker, symbol, data, self.ma_periods, self.rsi_period)
+                        future.add_done_callback(lambda f, symbol=symbol: finished.put((symbol, f)))
+                        in_flight += 1
+                waiting = None
+            else:
+                waiting = _POLL_INTERVAL
+
+            while in_flight:
+                try:
+                    symbol, future = finished.get(timeout=waiting) if waiting else finished.get_nowait()
+                except queue.Empty:
+                    break
+                waiting = None
+                in_flight -= 1
+                try:
+                    outcome = future.result()
+                    instrumentation.merge_compute(outcome.pop('computeMetrics', None))
+                except Exception as e:
+                    outcome = _failure(symbol, e)
+                self._put(self.store_queue, outcome)
+        self._put(self.store_queue, _DONE)
+
+    # -- 저장 / store --------------------------------------------------------
+
+    def _store_stage(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        finished = False
+        while not finished and not self._abort.is_set():
+            try:
+                item = self.store_queue.get(timeout=max(deadline - time.monotonic(), 0.01))
+                if item is _DONE:
+                    finished = True
+                else:
+                    batch.append(item)
+            except queue.Empty:
+                pass
+
+            if batch and (finished or len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self.checkpoint.write(self.run_id, batch)
+                for outcome in batch:
+                    if outcome['error'] is None:
+                        self._count('done')
+                        self._put(self.alert_queue, outcome)
+                    else:
+                        self._count('failed')
+                        print(f"{outcome['symbol']}: {outcome['error']}", file=sys.stderr)
+                batch = []
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self.flush_interval
+        self._put(self.alert_queue, _DONE)
+
+    # -- 알림 / alert --------------------------------------------------------
+
+    def _alert_stage(self):
+        rsi_name = f'RSI{self.rsi_period}'
+        while True:
+            outcome = self._get(self.alert_queue)
+            if outcome is _DONE:
+                break
+            text = _alert_text(outcome, rsi_name, self.rsi_low, self.rsi_high)
+            if text is None:
+                continue
+            try:
+                self.notify(text)
+                self._count('alerts')
+            except Exception as e:
+                # 알림 실패로 스캔이 멈추지 않도록 합니다. 결과는 이미 저장되어 있습니다.
+                # An alert failure must not stop the scan; the result is already stored.
+                print(f"Alert failed for {outcome['symbol']}: {e} (알림 전송에 실패했습니다)", file=sys.stderr)
+
+    def run(self):
+        """
+        모든 단계를 동시에 실행하고 끝날 때까지 기다립니다.
+        Runs every stage concurrently and waits until all of them finish.
+
+        Returns:
+            dict: fetched, done, failed, alerts 개수입니다.
+                  Counts of fetched, done, failed and alerts.
+        """
+        executor = None
+        if self.compute_workers:
+            # 작업 프로세스는 단계 스레드가 시작된 뒤 필요할 때 만들어지므로 fork를 쓰면 다른 스레드가 잡고 있던
+            # 잠금이 복사될 수 있습니다. forkserver(없으면 spawn)로 스레드가 없는 깨끗한 프로세스에서 시작합니다.
+            # Workers are created on demand after the stage threads start, and fork would copy locks held
+            # by those threads. Use forkserver (spawn where unavailable) so workers start thread-free.
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.compute_workers,
+                                                              mp_context=_process_context(),
+                                                              initializer=_init_worker,
+                                                              initargs=(instrumentation.is_enabled(),))
+        # 새 스레드는 컨텍스트를 물려받지 않으므로, 호출한 쪽의 retry_budget이 적용되도록 컨텍스트를 복사해 실행합니다.
+        # New threads do not inherit the context, so each stage runs in a copy of the caller's context
+        # to keep the caller's retry_budget in effect.
+        stages = [
+            threading.Thread(target=contextvars.copy_context().run, args=(self._stage,) + args,
+                             name=f'scan-{name}', daemon=True)
+            for name, args in (('fetch', (self._fetch_stage,)),
+                               ('compute', (self._compute_stage, executor)),
+                               ('store', (self._store_stage,)),
+                               ('alert', (self._alert_stage,)))
+        ]
+        failed = True
+        try:
+            for stage in stages:
+                stage.start()
+            # 한 단계가 예외로 멈추면 나머지 단계는 큐에서 영원히 기다리므로, 주기적으로 확인해 바로 중단합니다.
+            # If one stage dies the others would wait on their queues forever, so poll and abort at once.
+            for stage in stages:
+                while stage.is_alive():
+                    stage.join(timeout=0.5)
+                    if self._error is not None:
+                        raise self._error
+            failed = False
+        finally:
+            # 실패했으면 큐에서 기다리는 수집 풀과 단계 스레드를 모두 깨워 프로세스가 종료될 수 있게 합니다.
+            # On failure wake the fetch pool and every stage waiting on a queue so the process can exit.
+            self._abort.set()
+            if executor is not None:
+                executor.shutdown(wait=not failed, cancel_futures=failed)
+        return dict(self.stats)
+
+
+def _process_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def _telegram_notifier(token, chat_id):
+    # messageSVC는 저장소 최상위 패키지이므로 알림을 보낼 때만 가져옵니다.
+    # messageSVC is a top-level package of the repository, so import it only when alerts are sent.
+    from messageSVC.telegram import send_message_telegram
+
+    def notify(text):
+        send_message_telegram(token, chat_id, text).raise_for_status()
+    return notify
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m loadstockdata.scan',
+                                     description='Pipelined end-of-day scan: fetch -> compute -> store -> alert.')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--symbols', help='comma-separated symbols, e.g. 005930,000660,TSLA.O')
+    source.add_argument('--symbols-file', help='file with one symbol per line')
+    parser.add_argument('--shard', default='0/1', help='process only shard i of N (crc32(symbol) %% N == i)')
+    parser.add_argument('--db', default='scan.db', help='SQLite file for results and the checkpoint')
+    parser.add_argument('--run-id', help='checkpoint key; defaults to the end date (YYYYMMDD)')
+    parser.add_argument('--restart', action='store_true', help='ignore the checkpoint and redo every symbol')
+    parser.add_argument('--end-date', help="reference date in YYYYMMDD (default: today)")
+    parser.add_argument('--lookback', type=int, default=200, help='sessions to fetch per symbol')
+    parser.add_argument('--ma', default='20,60', help='comma-separated moving-average windows')
+    parser.add_argument('--rsi-period', type=int, default=14)
+    parser.add_argument('--rsi-low', type=float, default=30, help='alert when RSI is at or below this')
+    parser.add_argument('--rsi-high', type=float, default=70, help='alert when RSI is at or above this')
+    parser.add_argument('--fetch-workers', type=int, default=8)
+    parser.add_argument('--compute-workers', type=int, default=None, help='processes for indicators (0 = in-process)')
+    parser.add_argument('--queue-size', type=int, default=64, help='bound of each inter-stage queue')
+    parser.add_argument('--batch-size', type=int, default=50, help='results per SQLite transaction')
+    parser.add_argument('--retry-budget', type=int, default=200, help='retries shared by the whole run')
+    parser.add_argument('--telegram-token', default=os.environ.get('NSTOCK_TELEGRAM_TOKEN'))
+    parser.add_argument('--telegram-chat-id', default=os.environ.get('NSTOCK_TELEGRAM_CHAT_ID'))
+    parser.add_argument('--metrics', help='enable instrumentation and write the JSON summary to this path')
+    args = parser.parse_args(argv)
+
+    if args.metrics:
+        instrumentation.enable()
+
+    try:
+        shard_index, shard_count = parse_shard(args.shard)
+    except ValueError as e:
+        parser.error(str(e))
+
+    end_date = (datetime.datetime.strptime(args.end_date, '%Y%m%d').date() if args.end_date
+                else datetime.date.today())
+    run_id = args.run_id or end_date.strftime('%Y%m%d')
+
+    symbols = [symbol for symbol in load_symbols(args.symbols, args.symbols_file)
+               if in_shard(symbol, shard_index, shard_count)]
+    checkpoint = Checkpoint(args.db)
+    skipped = 0
+    if not args.restart:
+        remaining = pending_symbols(symbols, checkpoint, run_id)
+        skipped = len(symbols) - len(remaining)
+        symbols = remaining
+    print(f'run {run_id} shard {shard_index}/{shard_count}: {len(symbols)} to scan, {skipped} already done')
+
+    notify = print
+    if args.telegram_token and args.telegram_chat_id:
+        notify = _telegram_notifier(args.telegram_token, args.telegram_chat_id)
+
+    pipeline = ScanPipeline(
+        symbols, checkpoint, run_id, end_date,
+        lookback=args.lookback,
+        ma_periods=[int(period) for period in args.ma.split(',') if period.strip()],
+        rsi_period=args.rsi_period,
+        rsi_low=args.rsi_low,
+        rsi_high=args.rsi_high,
+        fetch_workers=args.fetch_workers,
+        compute_workers=args.compute_workers,
+        queue_size=args.queue_size,
+        batch_size=args.batch_size,
+        notify=notify,
+    )
+    started = time.perf_counter()
+    try:
+        with resilience.retry_budget(args.retry_budget):
+            stats = pipeline.run()
+    finally:
+        checkpoint.close()
+        if args.metrics:
+            instrumentation.write_json(args.metrics)
+    print(f"done {stats['done']}, failed {stats['failed']}, alerts {stats['alerts']} "
+          f"in {time.perf_counter() - started:.1f}s")
+    return 1 if stats['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
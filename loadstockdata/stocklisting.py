@@ -2,11 +2,17 @@ import requests
 import json
 import pandas as pd
 from .config import HEADERS
+from httpclient import resilience
+from . import parsing
 
-def get_kospi_decliners_today():
+def get_kospi_decliners_today(compact=False):
     """
     네이버 API를 이용하여 오늘의 KOSPI 하락 종목 상위 100개를 가져옵니다.
     Retrieves the top 100 declining KOSPI stocks for today using the Naver API.
+
+    Parameters:
+        compact (bool, optional): True이면 '71,000' 같은 가격/거래량 문자열을 숫자 타입으로 변환합니다.
+                                  If True, price/volume strings such as '71,000' are converted to numeric dtypes.
     
     Returns:
         pd.DataFrame: 하락 종목 리스트가 담긴 pandas 데이터프레임.
@@ -18,12 +24,12 @@ def get_kospi_decliners_today():
     
     # API 요청 및 응답 데이터 로드
     # Request data from the API and load the JSON response
-    response = requests.get(url)
-    json_data = json.loads(response.content)
+    response = resilience.get('naver.stocks.down', url)
+    json_data = parsing.loads(response.content)
     
     # 'stocks' 키에 있는 하락 종목 데이터를 데이터프레임으로 변환
     # Convert the 'stocks' data to a pandas DataFrame
-    df = pd.DataFrame(json_data['stocks'])
+    df = parsing.records_to_frame(json_data['stocks'], compact=compact)
     
     return df
 
@@ -34,10 +40,14 @@ def get_kospi_decliners_today():
 
 #https://api.stock.naver.com/stock/exchange/NASDAQ/down?page=1&pageSize=20
 
-def get_nasdaq_decliners_today():
+def get_nasdaq_decliners_today(compact=False):
     """
     네이버 API를 이용하여 오늘의 NASDAQ 하락 종목 상위 100개를 가져옵니다.
     Retrieves the top 100 declining NASDAQ stocks for today using the Naver API.
+
+    Parameters:
+        compact (bool, optional): True이면 가격/거래량 문자열을 숫자 타입으로 변환합니다.
+                                  If True, price/volume strings are converted to numeric dtypes.
     
     Returns:
         pd.DataFrame: 하락 종목 리스트가 담긴 pandas 데이터프레임.
@@ -49,17 +59,17 @@ def get_nasdaq_decliners_today():
     
     # API 요청 및 응답 데이터 로드
     # Request data from the API and load the JSON response
-    response = requests.get(url)
-    json_data = json.loads(response.content)
+    response = resilience.get('naver.stocks.down', url)
+    json_data = parsing.loads(response.content)
     
     # 'stocks' 키에 있는 하락 종목 데이터를 데이터프레임으로 변환
     # Convert the 'stocks' data to a pandas DataFrame
-    df = pd.DataFrame(json_data['stocks'])
+    df = parsing.records_to_frame(json_data['stocks'], compact=compact)
     
     return df
 
 
-def get_nasdaq_list(stock_code=None):
+def get_nasdaq_list(stock_code=None, compact=False):
     """
     나스닥 데이터를 가져오는 함수입니다.
     Fetches NASDAQ data.
@@ -67,6 +77,8 @@ def get_nasdaq_list(stock_code=None):
     Parameters:
         stock_code (str, optional): 종목코드입니다. 지정하면 해당 종목의 데이터만 반환합니다.
                                     If specified, returns data for the given stock code only.
+        compact (bool, optional): True이면 '$225.00', '-0.53%' 같은 문자열을 숫자 타입으로 변환합니다.
+                                  If True, strings such as '$225.00' and '-0.53%' are converted to numeric dtypes.
 
     Returns:
         pandas.DataFrame: 나스닥 데이터프레임입니다.
@@ -86,15 +98,15 @@ def get_nasdaq_list(stock_code=None):
     try:
         # 요청 보내기
         # Send request
-        response = requests.get(url, headers=headers)
+        response = resilience.get('nasdaq.screener', url, headers=headers)
         response.raise_for_status()  # HTTP 에러가 발생하면 예외 발생
                                      # Raise exception if HTTP error occurs
 
-        json_data = response.text  # 취득 데이터 JSON 형식 원본
-                                   # Raw JSON data
-        obj = json.loads(json_data)
+        json_data = response.content  # 취득 데이터 JSON 형식 원본
+                                      # Raw JSON data
+        obj = parsing.loads(json_data)
 
-        df = pd.DataFrame(obj['data']['rows'])
+        df = parsing.records_to_frame(obj['data']['rows'], compact=compact)
 
         if stock_code:
             # 종목코드로 필터링
@@ -1,4 +1,5 @@
 import requests
+from httpclient import resilience
 
 #참고한 문서 :https://blog.bizspring.co.kr/%ED%85%8C%ED%81%AC/telegram-bot-api-system-monitoring/
 
@@ -30,7 +31,7 @@ def send_message_telegram(token, chat_id, text):
         'chat_id': chat_id,
         'text': text
     }
-    response = requests.post(url, data=payload)
+    response = resilience.post('telegram.sendMessage', url, data=payload)
     return response
 
 # 예시 사용법
@@ -0,0 +1,27 @@
+# 테스트 공통 설정
+# 저장소 최상위(loadstockdata, httpclient)와 benchmarks(픽스처)를 가져올 수 있도록 경로를 추가합니다.
+# Shared test setup.
+# Puts the repository root (loadstockdata, httpclient) and benchmarks (fixtures) on the import path.
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+
+@pytest.fixture
+def instrumented():
+    """
+    계측을 켠 상태로 테스트를 실행하고, 끝나면 끄고 기록을 지웁니다.
+    Runs a test with instrumentation enabled, then disables it and clears the records.
+    """
+    from httpclient import instrumentation
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
@@ -0,0 +1,46 @@
+# calendars 모듈 테스트 / Tests for the calendars module
+
+import warnings
+
+import pandas as pd
+import pytest
+
+from loadstockdata import calendars
+
+
+def test_session_counts():
+    assert len(calendars.get_calendar('NYSE').sessions('20240101', '20241231')) == 252
+    assert len(calendars.get_calendar('KRX').sessions('20240101', '20241231')) == 244
+
+
+def test_krx_year_outside_table_warns():
+    first, last = calendars.KRX_TABLE_YEARS
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        calendars.get_calendar('KRX').sessions(f'{first}0101', f'{last}1231')
+    calendars._krx_holidays.cache_clear()
+    with pytest.warns(calendars.KRXHolidayTableWarning):
+        calendars.get_calendar('KRX').sessions(f'{last + 1}0101', f'{last + 1}1231')
+
+
+@pytest.mark.parametrize('symbol, name', [
+    ('005930', 'KRX'),
+    ('TSLA.O', 'NASDAQ'),
+    ('IBM.N', 'NYSE'),
+    ('SPY.P', 'NYSE'),
+])
+def test_calendar_for_symbol(symbol, name):
+    assert calendars.calendar_for_symbol(symbol).name == name
+
+
+@pytest.mark.parametrize('symbol', ['7203.T', '0700.HK', 'TSLA'])
+def test_calendar_for_symbol_rejects_other_markets(symbol):
+    with pytest.raises(ValueError):
+        calendars.calendar_for_symbol(symbol)
+
+
+def test_lookback_start():
+    assert calendars.lookback_start('005930', '20241015', 3) == calendars.get_calendar('KRX').previous_sessions('20241015', 3)[0]
+    # 캘린더가 없는 시장은 오류 대신 두 배의 달력일을 사용합니다.
+    # Markets without a calendar use twice the period in calendar days instead of raising.
+    assert calendars.lookback_start('7203.T', '20241015', 10) == pd.Timestamp('2024-09-25')
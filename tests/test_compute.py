@@ -0,0 +1,207 @@
+# compute 모듈 테스트 / Tests for the compute module
+# 각 지표를 pandas 기본 연산으로 만든 참조값과 고정된 허용오차로 비교합니다.
+# Each indicator is compared with a plain-pandas reference under fixed tolerances.
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import fixtures
+from loadstockdata import compute
+
+# 누적합 커널은 rolling보다 반올림 순서가 달라 약간의 오차를 허용합니다.
+# The cumulative-sum kernel rounds in a different order from rolling, so allow a small error.
+RTOL = 1e-9
+ATOL = 1e-6
+
+
+@pytest.fixture(scope='module')
+def prices():
+    panel = fixtures.price_panel(1, 500)
+    return panel.drop(columns='symbol').reset_index(drop=True)
+
+
+def _with_gaps(series):
+    """
+    중간중간 NaN 구간을 넣은 시리즈를 반환합니다.
+    Returns the series with a few NaN gaps inserted.
+    """
+    gapped = series.copy()
+    gapped.iloc[[0, 7, 8, 9, 40]] = np.nan
+    gapped.iloc[100:130] = np.nan
+    return gapped
+
+
+def _trend_then_flat(low, high):
+    """
+    4,000거래일 동안 low에서 high까지 오른 뒤 high와 high + 1을 오가는 시리즈를 반환합니다.
+    Returns a series ramping from low to high over 4,000 sessions, then alternating between high and high + 1.
+    """
+    return pd.Series(np.concatenate([np.linspace(low, high, 4000), high + np.arange(100) % 2]))
+
+
+def _exact_moments(series, window_size, min_periods):
+    """
+    창마다 평균을 먼저 구하고 편차를 제곱하는(2-pass) 참조 구현입니다. pandas rolling().std()는 값을 더하고
+    빼며 갱신하므로 급한 추세 뒤에는 오차가 쌓여 참조값으로 쓸 수 없습니다.
+    Two-pass reference that takes each window's mean before squaring deviations. pandas rolling().std()
+    updates by adding and removing values, so it accumulates error after a steep trend and cannot be the reference.
+    """
+    padded = np.concatenate([np.full(window_size - 1, np.nan), series.to_numpy(dtype=np.float64)])
+    windows = np.lib.stride_tricks.sliding_window_view(padded, window_size)
+    count = (~np.isnan(windows)).sum(axis=1)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        mean = np.nanmean(windows, axis=1)
+        std = np.nanstd(windows, axis=1, ddof=1)
+    enough = count >= max(min_periods, 1)
+    return (pd.Series(np.where(enough, mean, np.nan), index=series.index),
+            pd.Series(np.where(enough & (count > 1), std, np.nan), index=series.index))
+
+
+def _assert_close(actual, expected):
+    pd.testing.assert_series_equal(actual, expected, check_names=False, check_dtype=False, rtol=RTOL, atol=ATOL)
+
+
+@pytest.mark.parametrize('window_size, min_periods', [(1, 1), (5, 1), (20, 1), (20, 5), (20, 20), (60, 30)])
+@pytest.mark.parametrize('gaps', [False, True])
+def test_rolling_moments_match_rolling(prices, window_size, min_periods, gaps):
+    series = prices['closePrice']
+    series = _with_gaps(series) if gaps else series
+    mean, std = compute._rolling_moments(series, window_size, min_periods=min_periods)
+    rolling = series.rolling(window=window_size, min_periods=min_periods)
+    _assert_close(mean, rolling.mean())
+    _assert_close(std, rolling.std())
+    exact_mean, exact_std = _exact_moments(series, window_size, min_periods)
+    _assert_close(mean, exact_mean)
+    _assert_close(std, exact_std)
+
+
+@pytest.mark.parametrize('low, high', [(1e4, 1.5e6), (1e3, 1e7)])
+@pytest.mark.parametrize('window_size, min_periods', [(5, 1), (20, 1), (20, 20), (60, 30)])
+@pytest.mark.parametrize('gaps', [False, True])
+def test_rolling_moments_trend_then_flat(low, high, window_size, min_periods, gaps):
+    series = _trend_then_flat(low, high)
+    series = _with_gaps(series) if gaps else series
+    mean, std = compute._rolling_moments(series, window_size, min_periods=min_periods)
+    exact_mean, exact_std = _exact_moments(series, window_size, min_periods)
+    _assert_close(mean, exact_mean)
+    _assert_close(std, exact_std)
+    if not gaps and window_size == 20:
+        # 평탄 구간 마지막 20일(0과 1이 10번씩)의 표준편차는 sqrt(5 / 19)입니다.
+        # The last 20 flat sessions (ten 0s and ten 1s) have std sqrt(5 / 19).
+        assert std.iloc[-1] == pytest.approx(np.sqrt(5 / 19), rel=RTOL)
+
+
+def test_bollinger_width_after_trend():
+    dataframe = pd.DataFrame({'closePrice': _trend_then_flat(1e3, 1e7)})
+    bands = compute.compute_bollinger_bands(dataframe)
+    _, exact_std = _exact_moments(dataframe['closePrice'], 20, 1)
+    _assert_close(bands['upper_band'] - bands['lower_band'], 4 * exact_std)
+
+
+def test_rolling_moments_all_nan():
+    series = pd.Series([np.nan] * 10)
+    mean, std = compute._rolling_moments(series, 3)
+    assert mean.isna().all() and std.isna().all()
+
+
+@pytest.mark.parametrize('span', [5, 20, 50])
+def test_compute_ema_matches_ewm(prices, span):
+    expected = prices['closePrice'].ewm(span=span, adjust=False).mean()
+    _assert_close(compute.compute_ema(prices, span=span), expected)
+
+
+def test_compute_macd_matches_ewm(prices):
+    price = prices['closePrice']
+    macd = price.ewm(span=12, adjust=False).mean() - price.ewm(span=26, adjust=False).mean()
+    signal = macd.ewm(span=9, adjust=False).mean()
+    result = compute.compute_macd(prices)
+    _assert_close(result['macd'], macd)
+    _assert_close(result['signal'], signal)
+    _assert_close(result['histogram'], macd - signal)
+
+
+def _wilder_atr(dataframe, period, seed='first'):
+    """
+    와일더 ATR 참조 구현입니다. seed='first'는 첫 실제 범위로, seed='sma'는 처음 N개의 평균으로 시작합니다.
+    Reference Wilder ATR. seed='first' starts from the first true range, seed='sma' from the mean of the first N.
+    """
+    high = dataframe['highPrice'].to_numpy()
+    low = dataframe['lowPrice'].to_numpy()
+    close = dataframe['closePrice'].to_numpy()
+    true_range = high - low
+    previous = close[:-1]
+    true_range[1:] = np.maximum.reduce([true_range[1:], np.abs(high[1:] - previous), np.abs(low[1:] - previous)])
+
+    atr = np.full(len(true_range), np.nan)
+    start = 0 if seed == 'first' else period - 1
+    atr[start] = true_range[0] if seed == 'first' else true_range[:period].mean()
+    for i in range(start + 1, len(true_range)):
+        atr[i] = atr[i - 1] + (true_range[i] - atr[i - 1]) / period
+    atr[:period - 1] = np.nan
+    return pd.Series(atr, index=dataframe.index)
+
+
+@pytest.mark.parametrize('period', [5, 14])
+def test_compute_atr_matches_wilder(prices, period):
+    result = compute.compute_atr(prices, period=period)
+    _assert_close(result, _wilder_atr(prices, period))
+    # 단순 평균으로 시작하는 고전 방식과도 시작값의 영향이 사라진 뒤에는 일치합니다.
+    # It also agrees with the classic SMA-seeded form once the seed has decayed.
+    _assert_close(result.iloc[20 * period:], _wilder_atr(prices, period, seed='sma').iloc[20 * period:])
+
+
+@pytest.mark.parametrize('k_period, d_period', [(14, 3), (5, 5)])
+def test_compute_stochastic_matches_rolling(prices, k_period, d_period):
+    highest_high = prices['highPrice'].rolling(k_period).max()
+    lowest_low = prices['lowPrice'].rolling(k_period).min()
+    percent_k = 100 * (prices['closePrice'] - lowest_low) / (highest_high - lowest_low)
+    percent_d = percent_k.rolling(d_period).mean()
+    result = compute.compute_stochastic(prices, k_period=k_period, d_period=d_period)
+    _assert_close(result['percent_k'], percent_k)
+    _assert_close(result['percent_d'], percent_d)
+
+
+def test_compute_stochastic_flat_range_is_nan():
+    flat = pd.DataFrame({'highPrice': [10.0] * 6, 'lowPrice': [10.0] * 6, 'closePrice': [10.0] * 6})
+    assert compute.compute_stochastic(flat, k_period=3, d_period=2)['percent_k'].isna().all()
+
+
+def test_compute_obv_matches_formula(prices):
+    price = prices['closePrice']
+    volume = prices['accumulatedTradingVolume'].astype(float)
+    change = price.diff()
+    signed = volume.where(change > 0, 0) - volume.where(change < 0, 0)
+    _assert_close(compute.compute_obv(prices), signed.cumsum())
+
+
+@pytest.mark.parametrize('period', [1, 12])
+def test_compute_roc_matches_pct_change(prices, period):
+    expected = prices['closePrice'].pct_change(periods=period) * 100
+    _assert_close(compute.compute_roc(prices, period=period), expected)
+
+
+# 기존 지표는 커널 도입 전 구현(baseline)과 같은 값을 내야 합니다.
+# Existing indicators must produce the same values as the pre-kernel (baseline) implementation.
+
+@pytest.mark.parametrize('period', [5, 14])
+def test_compute_rsi_unchanged(prices, period):
+    delta = prices['closePrice'].diff()
+    avg_gain = delta.clip(lower=0).ewm(com=period - 1, min_periods=period).mean()
+    avg_loss = (-delta.clip(upper=0)).ewm(com=period - 1, min_periods=period).mean()
+    expected = 100 - (100 / (1 + avg_gain / avg_loss))
+    _assert_close(compute.compute_rsi(prices, period=period), expected)
+
+
+@pytest.mark.parametrize('window_size, num_std_dev', [(20, 2), (10, 1.5)])
+def test_compute_bollinger_bands_unchanged(prices, window_size, num_std_dev):
+    rolling = prices['closePrice'].rolling(window=window_size, min_periods=1)
+    middle, std = rolling.mean(), rolling.std()
+    result = compute.compute_bollinger_bands(prices, window_size=window_size, num_std_dev=num_std_dev)
+    assert list(result.columns) == ['middle_band', 'upper_band', 'lower_band']
+    _assert_close(result['middle_band'], middle)
+    _assert_close(result['upper_band'], middle + std * num_std_dev)
+    _assert_close(result['lower_band'], middle - std * num_std_dev)
@@ -0,0 +1,27 @@
+# instrumentation 모듈 테스트 / Tests for the instrumentation module
+
+import pytest
+
+from httpclient import instrumentation
+
+
+def test_drain_and_merge_compute(instrumented):
+    instrumentation.record_compute('f', 0.0002)
+    instrumentation.record_compute('f', 2.0)
+    drained = instrumentation.drain_compute()
+    assert instrumentation.summary()['compute'] == {}
+
+    instrumentation.record_compute('f', 0.003)
+    instrumentation.merge_compute(drained)
+    instrumentation.merge_compute({})
+    merged = instrumentation.summary()['compute']['f']
+    assert merged['count'] == 3
+    assert merged['sum'] == pytest.approx(2.0032)
+    assert merged['buckets'] == {'0.0005': 1, '0.001': 0, '0.005': 1, '0.01': 0, '0.05': 0, '0.1': 0,
+                                 '0.5': 0, '1.0': 0, '5.0': 1, '+Inf': 0}
+
+
+def test_merge_compute_ignored_when_disabled():
+    instrumentation.reset()
+    instrumentation.merge_compute({'f': ([1] + [0] * 9, 1, 0.0001)})
+    assert instrumentation.summary()['compute'] == {}
@@ -0,0 +1,150 @@
+# parsing 모듈 테스트: compact=True 경로가 기존 pd.DataFrame(records) 경로와 같은 값을 만드는지,
+# 컬럼별 타입이 데이터와 관계없이 일정한지 확인합니다.
+# Tests for the parsing module: the compact=True path must produce the same values as the
+# pd.DataFrame(records) path, with per-column dtypes that do not depend on the data.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import fixtures
+from loadstockdata import parsing
+
+# float32 유효 자릿수(약 7자리)에 맞춘 상대 오차 / Relative tolerance matching float32 precision (~7 digits)
+FLOAT32_RTOL = 1e-6
+
+CHART_DTYPES = {
+    'localDate': 'datetime64',
+    'closePrice': np.float32,
+    'openPrice': np.float32,
+    'highPrice': np.float32,
+    'lowPrice': np.float32,
+    'accumulatedTradingVolume': pd.Int64Dtype(),
+}
+
+
+def _reference_number(value):
+    if value is None or (isinstance(value, str) and value.strip() in ('', '-')):
+        return np.nan
+    if isinstance(value, str):
+        return float(value.replace(',', '').strip('$%+ '))
+    return float(value)
+
+
+def _assert_dtype(series, expected):
+    if expected == 'datetime64':
+        assert pd.api.types.is_datetime64_any_dtype(series), series.dtype
+    else:
+        assert series.dtype == expected, (series.name, series.dtype, expected)
+
+
+def _assert_values_match(compact, plain):
+    assert list(compact.columns) == list(plain.columns)
+    assert len(compact) == len(plain)
+    for name in plain.columns:
+        if name in parsing.DATE_COLUMNS:
+            expected = pd.to_datetime(plain[name].astype(str), format='%Y%m%d')
+            assert (compact[name].to_numpy() == expected.to_numpy()).all()
+        elif pd.api.types.is_numeric_dtype(compact[name]):
+            expected = np.array([_reference_number(value) for value in plain[name]], dtype=np.float64)
+            actual = compact[name].to_numpy(dtype=np.float64, na_value=np.nan)
+            np.testing.assert_allclose(actual, expected, rtol=FLOAT32_RTOL, equal_nan=True, err_msg=name)
+        else:
+            assert compact[name].tolist() == plain[name].tolist(), name
+
+
+@pytest.mark.parametrize('domestic', [True, False])
+def test_chart_records_match_plain_frame(domestic):
+    records = fixtures.stock_day_payload(300, domestic=domestic)
+    compact = parsing.records_to_frame(records, compact=True)
+    plain = parsing.records_to_frame(records)
+
+    _assert_values_match(compact, plain)
+    for name, expected in CHART_DTYPES.items():
+        _assert_dtype(compact[name], expected)
+
+
+def test_listing_strings_are_parsed():
+    records = fixtures.decliners_payload()['stocks']
+    compact = parsing.records_to_frame(records, compact=True)
+
+    _assert_values_match(compact, parsing.records_to_frame(records))
+    _assert_dtype(compact['closePrice'], np.float32)
+    _assert_dtype(compact['fluctuationsRatio'], np.float32)
+    _assert_dtype(compact['accumulatedTradingVolume'], pd.Int64Dtype())
+    # 거래대금/시가총액은 float32로는 자릿수가 부족하므로 float64입니다.
+    # Traded value and market cap need float64; float32 lacks the digits.
+    _assert_dtype(compact['accumulatedTradingValue'], np.float64)
+    _assert_dtype(compact['marketValue'], np.float64)
+    assert compact['stockName'].tolist() == [record['stockName'] for record in records]
+
+
+def test_nasdaq_screener_strings_are_parsed():
+    records = fixtures.nasdaq_screener_payload()['data']['rows']
+    compact = parsing.records_to_frame(records, compact=True)
+
+    _assert_values_match(compact, parsing.records_to_frame(records))
+    _assert_dtype(compact['lastsale'], np.float32)
+    _assert_dtype(compact['pctchange'], np.float32)
+    _assert_dtype(compact['volume'], pd.Int64Dtype())
+    _assert_dtype(compact['marketCap'], np.float64)
+
+
+@pytest.mark.parametrize('records', [
+    fixtures.stock_day_payload(120, domestic=True),
+    fixtures.decliners_payload()['stocks'],
+])
+def test_compact_frame_matches_records_to_frame(records):
+    expected = parsing.records_to_frame(records, compact=True)
+    actual = parsing.compact_frame(pd.DataFrame(records))
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=True)
+
+
+@pytest.mark.parametrize('missing', ['-', '', None])
+def test_missing_values(missing):
+    records = [
+        {'localDate': '20241014', 'closePrice': '71,000', 'accumulatedTradingVolume': '1,200'},
+        {'localDate': '20241015', 'closePrice': missing, 'accumulatedTradingVolume': missing},
+    ]
+    compact = parsing.records_to_frame(records, compact=True)
+
+    _assert_dtype(compact['closePrice'], np.float32)
+    assert compact['closePrice'].iloc[0] == 71000
+    assert np.isnan(compact['closePrice'].iloc[1])
+    # 결측값이 있어도 거래량 타입은 Int64로 같습니다.
+    # The volume dtype stays Int64 even with a missing value.
+    _assert_dtype(compact['accumulatedTradingVolume'], pd.Int64Dtype())
+    assert compact['accumulatedTradingVolume'].iloc[0] == 1200
+    assert compact['accumulatedTradingVolume'].isna().iloc[1]
+
+
+def test_volume_dtype_does_not_depend_on_missing_values():
+    complete = [{'accumulatedTradingVolume': 10}, {'accumulatedTradingVolume': 20}]
+    partial = [{'accumulatedTradingVolume': 10}, {'accumulatedTradingVolume': None}]
+    assert (parsing.records_to_frame(complete, compact=True)['accumulatedTradingVolume'].dtype
+            == parsing.records_to_frame(partial, compact=True)['accumulatedTradingVolume'].dtype
+            == pd.Int64Dtype())
+
+
+def test_mixed_keys():
+    records = [
+        {'localDate': '20241014', 'closePrice': 100},
+        {'localDate': '20241015', 'closePrice': 101, 'accumulatedTradingVolume': 5},
+        {'accumulatedTradingVolume': 7, 'localDate': '20241016', 'closePrice': 102},
+    ]
+    compact = parsing.records_to_frame(records, compact=True)
+    plain = parsing.records_to_frame(records)
+
+    _assert_values_match(compact, plain)
+    assert compact['accumulatedTradingVolume'].isna().tolist() == [True, False, False]
+    _assert_dtype(compact['accumulatedTradingVolume'], pd.Int64Dtype())
+
+
+def test_non_numeric_values_are_left_alone():
+    records = [{'closePrice': '71,000'}, {'closePrice': 'halted'}]
+    compact = parsing.records_to_frame(records, compact=True)
+    assert compact['closePrice'].tolist() == ['71,000', 'halted']
+
+
+def test_empty_records():
+    assert parsing.records_to_frame([], compact=True).empty
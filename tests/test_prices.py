@@ -0,0 +1,48 @@
+# prices 모듈 테스트 / Tests for the prices module
+
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from loadstockdata import calendars, prices
+
+
+@pytest.fixture
+def requests_made(monkeypatch):
+    """
+    retrieve_stock_data를 합성 일봉으로 바꾸고 요청한 기간을 기록합니다.
+    Replaces retrieve_stock_data with synthetic daily bars and records the requested windows.
+    """
+    made = []
+
+    def fake_retrieve(symbol, start_date, end_date):
+        made.append((symbol, start_date, end_date))
+        dates = pd.bdate_range(start_date, end_date)
+        return pd.DataFrame({
+            'localDate': dates.strftime('%Y%m%d'),
+            'closePrice': 100 + np.sin(np.arange(len(dates))) * 5,
+        })
+
+    monkeypatch.setattr(prices, 'retrieve_stock_data', fake_retrieve)
+    return made
+
+
+@pytest.mark.parametrize('symbol', ['7203.T', '0700.HK', '.IXIC'])
+def test_get_recent_stock_data_without_calendar(requests_made, symbol):
+    dataframe = prices.get_recent_stock_data(symbol, 20, moving_avg_periods=[5])
+    _, start_date, end_date = requests_made[0]
+    today = datetime.date.today()
+    assert end_date == today.strftime('%Y%m%d')
+    assert start_date == (today - datetime.timedelta(days=21 * 2)).strftime('%Y%m%d')
+    assert len(dataframe) == 20
+    assert dataframe['MA5'].notna().all()
+    assert dataframe['MA5'].iloc[-1] == pytest.approx(dataframe['closePrice'].tail(5).mean())
+
+
+def test_get_recent_stock_data_uses_exchange_calendar(requests_made):
+    prices.get_recent_stock_data('005930', 20)
+    _, start_date, _ = requests_made[0]
+    expected = calendars.get_calendar('KRX').previous_sessions(datetime.date.today(), 21)[0]
+    assert start_date == expected.strftime('%Y%m%d')
@@ -0,0 +1,101 @@
+# resample 모듈 테스트 / Tests for the resample module
+
+import pandas as pd
+import pytest
+
+import fixtures
+from loadstockdata import resample
+
+
+def _split(panel, days=1):
+    """
+    패널을 기존 일봉과 종목별 마지막 N일로 나눕니다.
+    Splits a panel into earlier days and each symbol's last N days.
+    """
+    last = panel.groupby('symbol').tail(days)
+    return panel.drop(last.index), last
+
+
+@pytest.mark.parametrize('rule', ['W', 'M', 5])
+def test_update_bars_matches_full_resample(rule):
+    panel = fixtures.price_panel(3, 60)
+    earlier, last = _split(panel, days=7)
+    bars = resample.resample_ohlcv(earlier, rule)
+    updated = resample.update_bars(bars, last, rule)
+    expected = resample.resample_ohlcv(panel, rule)
+    pd.testing.assert_frame_equal(updated.sort_values(['symbol', 'localDate'], ignore_index=True),
+                                  expected.sort_values(['symbol', 'localDate'], ignore_index=True),
+                                  check_dtype=False)
+
+
+def test_update_bars_leaves_input_untouched_by_default():
+    panel = fixtures.price_panel(2, 30)
+    earlier, last = _split(panel)
+    bars = resample.resample_ohlcv(earlier, 'W')
+    before = bars.copy()
+    resample.update_bars(bars, last, 'W')
+    pd.testing.assert_frame_equal(bars, before)
+
+
+def test_update_bars_inplace_updates_last_bar():
+    panel = fixtures.price_panel(2, 30)
+    earlier, last = _split(panel)
+    # 29일 → 5거래일봉 6개(마지막 봉 4거래일)이므로 30일째는 마지막 봉에 합쳐집니다.
+    # 29 days → six 5-session bars (the last holds 4), so day 30 merges into the last bar.
+    bars = resample.resample_ohlcv(earlier, 5)
+    updated = resample.update_bars(bars, last, 5, inplace=True)
+    assert updated is bars
+    assert (bars.groupby('symbol')['sessionCount'].last() == 5).all()
+
+
+def test_update_bars_same_day_again_raises():
+    panel = fixtures.price_panel(2, 30)
+    earlier, last = _split(panel)
+    bars = resample.update_bars(resample.resample_ohlcv(earlier, 'W'), last, 'W')
+    before = bars.copy()
+    with pytest.raises(ValueError):
+        resample.update_bars(bars, last, 'W', inplace=True)
+    # 오류가 나면 inplace=True여도 봉이 바뀌지 않습니다. / On error bars are unchanged, even in place.
+    pd.testing.assert_frame_equal(bars, before)
+
+
+def test_update_bars_same_day_again_skip_keeps_volume():
+    panel = fixtures.price_panel(2, 30)
+    earlier, last = _split(panel)
+    bars = resample.update_bars(resample.resample_ohlcv(earlier, 'W'), last, 'W')
+    again = resample.update_bars(bars, last, 'W', stale='skip')
+    pd.testing.assert_frame_equal(again, bars)
+
+
+def test_update_bars_older_and_repeated_rows():
+    panel = fixtures.price_panel(2, 30)
+    earlier, last = _split(panel)
+    bars = resample.resample_ohlcv(earlier, 'W')
+    older = earlier.groupby('symbol').tail(1)
+    with pytest.raises(ValueError):
+        resample.update_bars(bars, older, 'W')
+    with pytest.raises(ValueError):
+        resample.update_bars(bars, pd.concat([last, last]), 'W')
+    skipped = resample.update_bars(bars, pd.concat([older, last, last]), 'W', stale='skip')
+    pd.testing.assert_frame_equal(skipped, resample.update_bars(bars, last, 'W'))
+
+
+def test_update_bars_new_symbol_and_no_symbol_column():
+    panel = fixtures.price_panel(3, 30)
+    earlier, last = _split(panel)
+    first_two = earlier[earlier['symbol'] != earlier['symbol'].iloc[-1]]
+    updated = resample.update_bars(resample.resample_ohlcv(first_two, 'W'), last, 'W')
+    assert updated['symbol'].nunique() == 3
+
+    single = panel[panel['symbol'] == panel['symbol'].iloc[0]].drop(columns='symbol')
+    earlier, last = single.iloc[:-1], single.iloc[-1:]
+    bars = resample.update_bars(resample.resample_ohlcv(earlier, 'W'), last, 'W')
+    pd.testing.assert_frame_equal(bars, resample.resample_ohlcv(single, 'W'), check_dtype=False)
+    with pytest.raises(ValueError):
+        resample.update_bars(bars, last, 'W')
+
+
+def test_update_bars_rejects_unknown_stale_option():
+    panel = fixtures.price_panel(1, 10)
+    with pytest.raises(ValueError):
+        resample.update_bars(resample.resample_ohlcv(panel, 'W'), panel.tail(1), 'W', stale='replace')
@@ -0,0 +1,232 @@
+# resilience 모듈 테스트 / Tests for the resilience module
+# requests.request를 바꿔 네트워크 없이 재시도, 재시도 예산, 서킷 브레이커, 타임아웃, 헤지 요청을 확인합니다.
+# requests.request is replaced so retries, the retry budget, the circuit breaker, timeouts and hedging
+# are checked without network access.
+
+import contextvars
+import threading
+import time
+
+import pytest
+import requests
+
+from httpclient import resilience
+
+URL = 'https://api.example.com/chart'
+
+
+def _response(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b''
+    return response
+
+
+class FakeTransport:
+    """
+    requests.request 대신 호출되어 호출 기록을 남기고 정해진 결과(상태 코드, 예외 또는 함수)를 돌려줍니다.
+    Stands in for requests.request, recording calls and returning scripted outcomes
+    (a status code, an exception or a callable). The last outcome repeats.
+    """
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, method, url, **kwargs):
+        with self._lock:
+            self.calls.append((method, url, kwargs))
+            outcome = self.outcomes[min(len(self.calls), len(self.outcomes)) - 1]
+        if callable(outcome) and not isinstance(outcome, type):
+            return outcome()
+        if isinstance(outcome, int):
+            return _response(outcome)
+        raise outcome
+
+
+@pytest.fixture(autouse=True)
+def fast_policy(monkeypatch):
+    monkeypatch.setattr(resilience, 'BACKOFF_MULTIPLIER', 0.001)
+    monkeypatch.setattr(resilience, 'BACKOFF_MAX', 0.01)
+    monkeypatch.setattr(resilience, 'HEDGE_PERCENTILE', resilience.HEDGE_PERCENTILE)
+    monkeypatch.setattr(resilience, 'HEDGE_MIN_SAMPLES', resilience.HEDGE_MIN_SAMPLES)
+    resilience.reset()
+    yield
+    resilience.disable_hedging()
+    resilience.reset()
+
+
+def _transport(monkeypatch, *outcomes):
+    transport = FakeTransport(*outcomes)
+    monkeypatch.setattr(requests, 'request', transport)
+    return transport
+
+
+# -- 재시도 / retries --------------------------------------------------------
+
+def test_get_retries_5xx_then_returns_last_response(monkeypatch):
+    transport = _transport(monkeypatch, 503)
+    assert resilience.get('test', URL).status_code == 503
+    assert len(transport.calls) == resilience.MAX_ATTEMPTS == 3
+
+
+def test_get_retries_connection_error_until_success(monkeypatch):
+    transport = _transport(monkeypatch, requests.exceptions.ConnectionError(), 200)
+    assert resilience.get('test', URL).status_code == 200
+    assert len(transport.calls) == 2
+
+
+def test_get_does_not_retry_4xx(monkeypatch):
+    transport = _transport(monkeypatch, 404)
+    assert resilience.get('test', URL).status_code == 404
+    assert len(transport.calls) == 1
+
+
+@pytest.mark.parametrize('outcome, attempts', [
+    (503, 1),
+    (requests.exceptions.ReadTimeout(), 1),
+    (requests.exceptions.ConnectTimeout(), 3),
+    (429, 3),
+])
+def test_post_only_retries_unsent_or_rate_limited(monkeypatch, outcome, attempts):
+    transport = _transport(monkeypatch, outcome)
+    if isinstance(outcome, int):
+        assert resilience.post('test', URL).status_code == outcome
+    else:
+        with pytest.raises(type(outcome)):
+            resilience.post('test', URL)
+    assert len(transport.calls) == attempts
+    assert all(method == 'POST' for method, _, _ in transport.calls)
+
+
+# -- 재시도 예산 / retry budget ------------------------------------------------
+
+def test_retry_budget_limits_attempts(monkeypatch):
+    transport = _transport(monkeypatch, 503)
+    with resilience.retry_budget(1) as budget:
+        resilience.get('test', URL)
+        assert len(transport.calls) == 2
+        assert budget.remaining == 0
+        # 예산을 다 쓴 뒤에는 첫 시도만 합니다. / Once spent, only the first attempt is made.
+        resilience.reset()
+        resilience.get('test', URL)
+        assert len(transport.calls) == 3
+
+
+def test_retry_budget_is_per_context(monkeypatch):
+    transport = _transport(monkeypatch, 503)
+    attempts = {}
+
+    def worker(name):
+        before = len(transport.calls)
+        resilience.get('test', f'https://{name}.example.com/')
+        attempts[name] = len(transport.calls) - before
+
+    with resilience.retry_budget(0):
+        # 컨텍스트를 복사한 스레드는 예산을 공유하고, 그렇지 않은 스레드는 예산이 없습니다.
+        # A thread run in a copied context shares the budget; a plain thread has none.
+        shared = threading.Thread(target=contextvars.copy_context().run, args=(worker, 'shared'))
+        shared.start()
+        shared.join()
+        plain = threading.Thread(target=worker, args=('plain',))
+        plain.start()
+        plain.join()
+    assert attempts == {'shared': 1, 'plain': 3}
+
+
+# -- 서킷 브레이커 / circuit breaker -------------------------------------------
+
+def test_circuit_opens_after_threshold_failures(monkeypatch):
+    transport = _transport(monkeypatch, 503)
+    resilience.get('test', URL)
+    with pytest.raises(resilience.CircuitOpenError):
+        resilience.get('test', URL)
+    # 3번 + 2번 실패로 5번째에 열리고, 그 뒤에는 요청을 보내지 않습니다.
+    # Opens on the fifth failure (3 + 2 attempts); nothing is sent after that.
+    assert len(transport.calls) == resilience.FAILURE_THRESHOLD == 5
+    assert resilience.circuit_breaker('api.example.com').state == 'open'
+
+
+def test_circuit_breaker_state_machine():
+    breaker = resilience.CircuitBreaker(threshold=2, reset_timeout=60)
+    assert breaker.state == 'closed' and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == 'closed'
+    breaker.record_failure()
+    assert breaker.state == 'open' and not breaker.allow()
+
+    # 시간이 지나면 half-open이 되어 시험 요청 한 건만 허용합니다.
+    # After the timeout it turns half-open and lets exactly one trial through.
+    breaker.opened_at = time.monotonic() - 60
+    assert breaker.state == 'half-open'
+    assert breaker.allow() and not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == 'open'
+
+    breaker.opened_at = time.monotonic() - 60
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == 'closed' and breaker.failures == 0
+
+
+def test_success_resets_failure_count(monkeypatch):
+    _transport(monkeypatch, 503, 503, 200)
+    assert resilience.get('test', URL).status_code == 200
+    assert resilience.circuit_breaker('api.example.com').failures == 0
+
+
+# -- 타임아웃 / timeouts --------------------------------------------------------
+
+def test_default_timeout(monkeypatch):
+    transport = _transport(monkeypatch, 200)
+    resilience.get('test', URL)
+    assert transport.calls[0][2]['timeout'] == (resilience.CONNECT_TIMEOUT, resilience.READ_TIMEOUT)
+
+
+def test_explicit_timeout_wins(monkeypatch):
+    transport = _transport(monkeypatch, 200)
+    resilience.post('test', URL, timeout=1.5)
+    assert transport.calls[0][2]['timeout'] == 1.5
+
+
+# -- 헤지 요청 / hedging ---------------------------------------------------------
+
+def _prime_latencies(samples, fast=0.01, slow=0.05):
+    # 95번째 백분위수가 slow가 되도록 표본을 채웁니다. / Fill samples so the 95th percentile is `slow`.
+    for i in range(samples):
+        resilience._record_latency('api.example.com', slow if i >= samples * 0.9 else fast)
+
+
+def test_hedge_fires_after_p95(monkeypatch):
+    replies = iter([lambda: (time.sleep(1.0), _response(200))[1], lambda: _response(203)])
+    transport = _transport(monkeypatch, lambda: next(replies)())
+    _prime_latencies(20)
+    resilience.enable_hedging()
+    assert resilience._hedge_delay('api.example.com') == 0.05
+
+    started = time.monotonic()
+    response = resilience.get('test', URL)
+    assert response.status_code == 203
+    assert time.monotonic() - started < 0.9
+    assert len(transport.calls) == 2
+
+
+def test_no_hedge_when_fast_or_not_get(monkeypatch):
+    transport = _transport(monkeypatch, 200)
+    _prime_latencies(20)
+    resilience.enable_hedging()
+    resilience.get('test', URL)
+    assert len(transport.calls) == 1
+
+    transport.outcomes = [lambda: (time.sleep(0.2), _response(200))[1]]
+    resilience.post('test', URL)
+    assert len(transport.calls) == 2
+
+
+def test_no_hedge_before_min_samples(monkeypatch):
+    transport = _transport(monkeypatch, lambda: (time.sleep(0.2), _response(200))[1])
+    _prime_latencies(resilience.HEDGE_MIN_SAMPLES - 1)
+    resilience.enable_hedging()
+    resilience.get('test', URL)
+    assert len(transport.calls) == 1
@@ -0,0 +1,176 @@
+# scan 모듈 테스트 / Tests for the scan module
+
+import datetime
+import os
+import subprocess
+import sys
+import textwrap
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from httpclient import instrumentation
+from loadstockdata import scan
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 저장 단계가 실패하는 스캔을 별도 인터프리터에서 실행합니다. 단계 스레드나 풀 스레드가 큐에서 계속 기다리면
+# run()이 예외를 낸 뒤에도 인터프리터 종료 단계에서 멈추므로, 프로세스가 끝나는지까지 확인해야 합니다.
+# Runs a scan whose store stage fails in a separate interpreter. A stage or pool thread left waiting on a
+# queue would hang interpreter shutdown even after run() raised, so the process itself must exit.
+_FAILING_SCAN = textwrap.dedent('''
+    import datetime, sys, time
+    import numpy as np, pandas as pd
+    from loadstockdata import scan
+
+    def fake_retrieve(symbol, start_date, end_date):
+        dates = pd.bdate_range(end=end_date, periods=60).strftime('%Y%m%d')
+        return pd.DataFrame({'localDate': dates, 'closePrice': 100 + np.arange(60, dtype=float)})
+
+    class BrokenCheckpoint(scan.Checkpoint):
+        def write(self, run_id, outcomes):
+            raise RuntimeError('disk full')
+
+    scan.retrieve_stock_data = fake_retrieve
+    pipeline = scan.ScanPipeline([f'{i:06d}' for i in range(300)], BrokenCheckpoint(':memory:'), 'run',
+                                 datetime.date(2024, 10, 15), compute_workers=int(sys.argv[1]), queue_size=8,
+                                 notify=lambda text: None)
+    started = time.monotonic()
+    try:
+        pipeline.run()
+    except RuntimeError as e:
+        print(f'raised {e} after {time.monotonic() - started:.1f}s')
+''')
+
+
+@pytest.mark.parametrize('compute_workers', [0, 2])
+def test_failed_stage_lets_process_exit(compute_workers):
+    result = subprocess.run([sys.executable, '-c', _FAILING_SCAN, str(compute_workers)], cwd=ROOT,
+                            capture_output=True, text=True, timeout=30)
+    assert result.returncode == 0, result.stderr
+    assert 'raised disk full' in result.stdout
+
+
+def _fake_retrieve(symbol, start_date, end_date):
+    dates = pd.bdate_range(end=end_date, periods=60).strftime('%Y%m%d')
+    return pd.DataFrame({'localDate': dates, 'closePrice': 100 + np.arange(60, dtype=float)})
+
+
+def test_worker_compute_metrics_reach_parent(monkeypatch, instrumented):
+    monkeypatch.setattr(scan, 'retrieve_stock_data', _fake_retrieve)
+    checkpoint = scan.Checkpoint(':memory:')
+    pipeline = scan.ScanPipeline(['005930', '000660', '035420'], checkpoint, 'run', datetime.date(2024, 10, 15),
+                                 ma_periods=(5, 20), compute_workers=2, notify=lambda text: None)
+    assert pipeline.run()['done'] == 3
+    compute = instrumentation.summary()['compute']
+    assert compute['loadstockdata.compute.compute_rsi']['count'] == 3
+    assert compute['loadstockdata.compute.compute_moving_average']['count'] == 6
+
+
+# -- 샤드 / shards ------------------------------------------------------------
+
+@pytest.mark.parametrize('text, expected', [('0/1', (0, 1)), ('0/4', (0, 4)), ('3/4', (3, 4))])
+def test_parse_shard(text, expected):
+    assert scan.parse_shard(text) == expected
+
+
+@pytest.mark.parametrize('text', ['4/4', '-1/4', '0/0', 'a/b', '1', '1/2/3'])
+def test_parse_shard_rejects_invalid(text):
+    with pytest.raises(ValueError):
+        scan.parse_shard(text)
+
+
+def test_in_shard_partitions_symbols():
+    symbols = [f'{i:06d}' for i in range(1000)] + ['TSLA.O', 'AAPL.O']
+    shards = [[symbol for symbol in symbols if scan.in_shard(symbol, index, 4)] for index in range(4)]
+    assert sorted(sum(shards, [])) == sorted(symbols)
+    assert all(len(shard) > 200 for shard in shards)
+    # crc32 기반이므로 값이 고정되어 있습니다. / crc32-based, so the assignment is fixed.
+    assert [index for symbol in ['005930', '000660', 'TSLA.O', 'AAPL.O']
+            for index in range(4) if scan.in_shard(symbol, index, 4)] == [0, 2, 2, 0]
+
+
+def test_in_shard_same_in_every_process():
+    code = ("from loadstockdata import scan; "
+            "print([i for s in ['005930', '000660', '035420', 'TSLA.O'] for i in range(7) if scan.in_shard(s, i, 7)])")
+    outputs = set()
+    for seed in ('1', '2'):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        outputs.add(subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env, capture_output=True,
+                                   text=True, check=True).stdout)
+    assert len(outputs) == 1
+
+
+# -- 종목 목록 / symbol lists ---------------------------------------------------
+
+def test_load_symbols(tmp_path):
+    path = tmp_path / 'symbols.txt'
+    path.write_text('005930\n# 주석 / comment\n000660  # SK하이닉스\n\n  TSLA.O\n005930\n', encoding='utf-8')
+    assert scan.load_symbols(symbols_file=str(path)) == ['005930', '000660', 'TSLA.O']
+    assert scan.load_symbols(' 035420, 005930,,') == ['035420', '005930']
+    assert scan.load_symbols('035420,005930', str(path)) == ['035420', '005930', '000660', 'TSLA.O']
+
+
+# -- 알림 / alerts --------------------------------------------------------------
+
+@pytest.mark.parametrize('rsi, state', [
+    (None, None), (29.9, 'oversold'), (30.0, 'oversold'), (30.1, None), (69.9, None), (70.0, 'overbought'),
+])
+def test_alert_text_thresholds(rsi, state):
+    outcome = {'symbol': '005930', 'localDate': '20241015', 'indicators': {'RSI14': rsi, 'closePrice': 100.0}}
+    text = scan._alert_text(outcome, 'RSI14', 30, 70)
+    if state is None:
+        assert text is None
+    else:
+        assert state in text and '005930' in text and 'RSI14=' in text
+
+
+# -- 실행과 체크포인트 / runs and the checkpoint ------------------------------------
+
+def _run(symbols, checkpoint, notify=lambda text: None):
+    pipeline = scan.ScanPipeline(symbols, checkpoint, 'run', datetime.date(2024, 10, 15), ma_periods=(5,),
+                                 compute_workers=0, flush_interval=0.05, notify=notify)
+    return pipeline.run()
+
+
+def test_run_in_process_and_resume(monkeypatch):
+    def flaky_retrieve(symbol, start_date, end_date):
+        if symbol == '035420':
+            raise ConnectionError('upstream down')
+        return _fake_retrieve(symbol, start_date, end_date)
+
+    monkeypatch.setattr(scan, 'retrieve_stock_data', flaky_retrieve)
+    checkpoint = scan.Checkpoint(':memory:')
+    symbols = ['005930', '000660', '035420']
+    alerts = []
+
+    stats = _run(symbols, checkpoint, alerts.append)
+    assert stats == {'fetched': 2, 'done': 2, 'failed': 1, 'alerts': 2}
+    # 계속 오르는 가격이므로 RSI는 100(과매수)입니다. / Prices only rise, so RSI is 100 (overbought).
+    assert all('overbought' in text for text in alerts)
+    rows = checkpoint.connection.execute(
+        "SELECT symbol, indicator, value FROM scan_results WHERE run_id = 'run' ORDER BY symbol, indicator").fetchall()
+    assert [row[:2] for row in rows] == [(symbol, name) for symbol in ('000660', '005930')
+                                         for name in ('MA5', 'RSI14', 'closePrice')]
+    assert dict((row[1], row[2]) for row in rows if row[0] == '005930') == {'MA5': 157.0, 'RSI14': 100.0,
+                                                                               'closePrice': 159.0}
+    status = dict(checkpoint.connection.execute("SELECT symbol, status FROM scan_progress WHERE run_id = 'run'"))
+    assert status == {'005930': 'done', '000660': 'done', '035420': 'failed'}
+
+    # 다시 실행하면 끝난 종목은 건너뛰고 실패한 종목만 처리합니다.
+    # A rerun skips finished symbols and only retries the failed one.
+    assert scan.pending_symbols(symbols, checkpoint, 'run') == ['035420']
+    assert scan.pending_symbols(symbols, checkpoint, 'other-run') == symbols
+    monkeypatch.setattr(scan, 'retrieve_stock_data', _fake_retrieve)
+    stats = _run(scan.pending_symbols(symbols, checkpoint, 'run'), checkpoint)
+    assert stats['done'] == 1 and stats['failed'] == 0
+    assert checkpoint.finished('run') == set(symbols)
+    assert scan.pending_symbols(symbols, checkpoint, 'run') == []
+
+
+def test_pending_symbols_records_cache_hits(instrumented):
+    checkpoint = scan.Checkpoint(':memory:')
+    checkpoint.write('run', [{'symbol': '005930', 'localDate': '20241015', 'indicators': {}, 'error': None}])
+    assert scan.pending_symbols(['005930', '000660'], checkpoint, 'run') == ['000660']
+    assert instrumentation.summary()['caches']['scan.checkpoint'] == {'hits': 1, 'misses': 1, 'hit_rate': 0.5}